@@ -7,17 +7,32 @@ from typing import List, Optional
 import xml.etree.ElementTree as ET
 import json
 import uuid
-
-from .services.skills import extract_skills_from_text
-from .services.gaps import map_role_to_required_skills, detect_skill_gaps
+import asyncio
+
+from .services.skills import extract_skills_from_text, get_extraction_backend, get_extraction_stats, run_extraction
+from .services.local_extractor import get_local_model
+from .services.taxonomy import start_taxonomy_watcher
+from .services.gaps import map_role_to_required_skills, detect_skill_gaps, current_skill_scores, resolve_role
+from .services.role_fit import get_role_matrix
+from .services.what_if import simulate_next_skills
+from .services.career_paths import get_role_graph
+from .services.cohort import COHORT_FORMATS, DEFAULT_CHUNK_SIZE, analyze_cohort_file
+from .services.job_profiles import JobProfile, get_job_profile_store, target_profile
+from .services.gap_state import get_gap_state_store, record_analysis
+from .services.skill_evidence import scan_skill_evidence
+from .services.skill_graph import ADJACENCY_METRICS, DEFAULT_MIN_COUNT, document_key, get_skill_graph
 from .services.resources import rank_resources_for_skills
+from .services.course_catalog import get_course_catalog
 from .services.roadmap import generate_learning_roadmap
 from .services.assessment import generate_assessment, score_assessment, SOFT_SKILLS_QUESTIONS, INTERVIEW_QUESTIONS
 from .services.problems import generate_problems_for_skills, get_problem_by_id, validate_solution
 from .services.ai_analysis import analyze_ai_replacement_risk, get_job_market_analysis
+from .services.batch import analyze_batch, BATCH_MAX_ITEMS
+from .services.resume_sections import segment_resume
+from .services.incremental_analysis import extract_request_skills, extract_skills_incrementally
 from .services.reflection_agent import get_reflection_agent, ReflectionReport, ReflectionInsight, LearningProgress
 from .services.course_recommendations import get_course_service, CourseRecommendation, Course
-from .services.models import AnalyzeRequest, AnalyzeResponse, AssessmentGenerateRequest, AssessmentSubmitRequest, AssessmentResultResponse, RoadmapRequest, RoadmapResponse, ResourcesRequest, ResourcesResponse
+from .services.models import AnalyzeRequest, AnalyzeResponse, BatchAnalyzeRequest, BatchAnalyzeResponse, RoleFitRequest, RoleFitResponse, RoleFit, WhatIfRequest, WhatIfResponse, SkillAdditionResult, CareerPathRequest, CareerPathResponse, CareerHopResult, RoleProfileRequest, RoleProfileResponse, RoleProfileSkill, AssessmentGenerateRequest, AssessmentSubmitRequest, AssessmentResultResponse, UserGapsResponse, RoadmapRequest, RoadmapResponse, ResourcesRequest, ResourcesResponse
 
 # Production configuration
 app = FastAPI(
@@ -52,25 +67,104 @@ async def global_exception_handler(request, exc):
 def root():
     return {"message": "Noesis API is running", "version": "0.1.0"}
 
+@app.on_event("startup")
+def load_local_skill_model() -> None:
+    """Load the local skill model once at startup when it is the extraction backend"""
+    if get_extraction_backend() == "local":
+        get_local_model()
+
+
+@app.on_event("startup")
+def watch_taxonomy() -> None:
+    """Hot-reload edited taxonomy files when TAXONOMY_RELOAD_INTERVAL is set"""
+    start_taxonomy_watcher()
+
+
 @app.get("/health")
 def health() -> dict:
     return {"status": "ok", "environment": os.getenv("ENVIRONMENT", "development")}
 
 @app.post("/analyze", response_model=AnalyzeResponse)
 async def analyze(request: AnalyzeRequest) -> AnalyzeResponse:
-    extracted = extract_skills_from_text(
-        text=request.resume_text or "",
-        user_known_skills=request.known_skills or [],
+    # Returning users only re-extract the sections that changed since their previous resume
+    extracted, recomputed_sections = await run_extraction(
+        extract_request_skills,
+        request.resume_text or "", request.known_skills or [], request.fuzzy_threshold, request.user_id,
     )
-    required = map_role_to_required_skills(request.goal)
-    gaps = detect_skill_gaps(known_skills=extracted, required_skills=required, role=request.goal)
+    try:
+        profile = target_profile(request.role_profile_id, request.job_description)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown role profile: {request.role_profile_id}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if profile is not None:
+        role, confidence, required = profile.title, 1.0, list(profile.skills)
+    else:
+        resolution = resolve_role(request.goal)
+        role, confidence = resolution.role, resolution.confidence
+        required = map_role_to_required_skills(role)
+    # Graded scores from resume evidence (years, recency, seniority, projects) when there is a resume
+    evidence = scan_skill_evidence(request.resume_text) if (request.resume_text or "").strip() else None
+    skill_graph = get_skill_graph()
+    if evidence is not None:
+        # Mine co-occurrence from real resumes only, once per resume or user
+        skill_graph.observe(extracted, key=document_key(request.resume_text, request.user_id))
+    gaps = detect_skill_gaps(
+        known_skills=extracted, required_skills=required, role=role,
+        evidence=evidence, cooccurrence=skill_graph,
+        requirements=profile.skills if profile is not None else None,
+    )
+    if request.user_id:
+        # Kept so assessments can update these gaps without re-running extraction
+        scores = current_skill_scores(extracted, evidence)
+        record_analysis(
+            request.user_id, role, required, scores, set(scores) if evidence is not None else set(), gaps,
+            requirements=profile.skills if profile is not None else None,
+            role_profile_id=profile.profile_id if profile is not None else None,
+        )
     return AnalyzeResponse(
         extracted_skills=extracted,
         required_skills=required,
         skill_gaps=gaps,
+        recomputed_sections=recomputed_sections,
+        resolved_role=role,
+        role_confidence=confidence,
+        role_profile_id=profile.profile_id if profile is not None else None,
     )
 
 
+@app.get("/extraction/stats")
+async def extraction_stats():
+    """How many extractions each tier (lexicon, Nemotron, Nemotron failure fallback) has served"""
+    return get_extraction_stats()
+
+
+@app.get("/skills/adjacent")
+async def adjacent_skills(skill: str, limit: int = 10, metric: str = "pmi", min_count: int = DEFAULT_MIN_COUNT, exclude: str = ""):
+    """Skills that most often appear alongside ``skill`` in analyzed resumes (comma-separated ``exclude``)"""
+    if metric not in ADJACENCY_METRICS:
+        raise HTTPException(status_code=400, detail=f"metric must be one of: {', '.join(ADJACENCY_METRICS)}")
+    skill_graph = get_skill_graph()
+    return {
+        "skill": skill,
+        "metric": metric,
+        "adjacent": skill_graph.adjacent(
+            skill, limit=max(1, min(limit, 100)), metric=metric, min_count=max(1, min_count),
+            exclude=[s for s in exclude.split(",") if s.strip()],
+        ),
+        "graph": skill_graph.stats(),
+    }
+
+
+@app.post("/analyze/batch", response_model=BatchAnalyzeResponse)
+async def analyze_batch_endpoint(request: BatchAnalyzeRequest) -> BatchAnalyzeResponse:
+    """Analyze many resumes in one request; results come back in order with per-item errors"""
+    if len(request.items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch too large: at most {BATCH_MAX_ITEMS} items per request")
+    results = await analyze_batch(request.items, max_concurrency=request.max_concurrency)
+    return BatchAnalyzeResponse(results=results)
+
+
 @app.post("/assessment/generate")
 async def assessment_generate(request: AssessmentGenerateRequest):
     questions = generate_assessment(
@@ -83,9 +177,31 @@ async def assessment_generate(request: AssessmentGenerateRequest):
 @app.post("/assessment/submit", response_model=AssessmentResultResponse)
 async def assessment_submit(request: AssessmentSubmitRequest) -> AssessmentResultResponse:
     result = score_assessment(request.responses)
+    if request.user_id:
+        updated = get_gap_state_store().assess(request.user_id, result.results)
+        if updated is None:
+            raise HTTPException(status_code=404, detail=f"No analysis stored for user: {request.user_id}")
+        result.skill_gaps, result.recomputed_skills = updated
     return result
 
 
+@app.get("/users/{user_id}/gaps", response_model=UserGapsResponse)
+async def user_gaps(user_id: str) -> UserGapsResponse:
+    """A user's current gaps from their last /analyze, updated by any assessments since"""
+    state = get_gap_state_store().get(user_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"No analysis stored for user: {user_id}")
+    return UserGapsResponse(
+        user_id=state.user_id,
+        role=state.role,
+        role_profile_id=state.role_profile_id,
+        required_skills=state.required_skills,
+        skill_gaps=list(state.gaps.values()),
+        assessed_skills=sorted(state.assessed_skills),
+        version=state.version,
+    )
+
+
 @app.post("/resources", response_model=ResourcesResponse)
 async def resources(request: ResourcesRequest) -> ResourcesResponse:
     ranked = rank_resources_for_skills(
@@ -93,10 +209,18 @@ async def resources(request: ResourcesRequest) -> ResourcesResponse:
         free_preferred=(request.free_preferred if request.free_preferred is not None else True),
         weekly_time_hours=(request.weekly_time_hours if request.weekly_time_hours is not None else 5),
         provider_preferences=request.provider_preferences or [],
+        per_skill=max(1, min(request.per_skill or 1, 20)),
     )
     return ResourcesResponse(resources=ranked)
 
 
+@app.get("/courses/search")
+async def search_courses(q: str, limit: int = 20):
+    """Full-text search over the course catalog's titles, descriptions and skills"""
+    catalog = get_course_catalog()
+    return {"query": q, "courses": catalog.search(q, limit=max(1, min(limit, 100))), "total_courses": len(catalog)}
+
+
 @app.post("/roadmap", response_model=RoadmapResponse)
 async def roadmap(request: RoadmapRequest) -> RoadmapResponse:
     plan = generate_learning_roadmap(
@@ -110,7 +234,7 @@ async def roadmap(request: RoadmapRequest) -> RoadmapResponse:
 
 
 @app.post("/upload-pdf")
-async def upload_pdf(file: UploadFile = File(...)):
+async def upload_pdf(file: UploadFile = File(...), user_id: Optional[str] = Form(None)):
     """Upload PDF file and convert to XML format for processing"""
     if not file.filename or not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="File must be a PDF")
@@ -142,14 +266,25 @@ async def upload_pdf(file: UploadFile = File(...)):
             except Exception:
                 raise HTTPException(status_code=400, detail=f"Could not read PDF: {str(e)}")
         
+        # Re-extract only the sections that changed since this user's previous upload
+        recomputed_sections = None
+        extracted_skills = None
+        if user_id:
+            incremental = await run_extraction(extract_skills_incrementally, user_id, text_content, [])
+            extracted_skills = incremental.skills
+            recomputed_sections = incremental.recomputed_sections
+        
         # Convert text to XML format
         filename = file.filename or "unknown.pdf"
-        xml_content = convert_text_to_xml(text_content, filename)
+        if extracted_skills is None:
+            extracted_skills = await run_extraction(extract_skills_from_text, text_content, [])
+        xml_content = convert_text_to_xml(text_content, filename, extracted_skills)
         
         return {
             "filename": filename,
             "xml_content": xml_content,
             "text_content": text_content,
+            "recomputed_sections": recomputed_sections,
             "message": "PDF successfully converted to XML format"
         }
         
@@ -157,7 +292,7 @@ async def upload_pdf(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Error processing PDF: {str(e)}")
 
 
-def convert_text_to_xml(text: str, filename: str) -> str:
+def convert_text_to_xml(text: str, filename: str, extracted_skills: Optional[List[str]] = None) -> str:
     """Convert extracted text to structured XML format"""
     # Create XML structure
     root = ET.Element("resume")
@@ -171,17 +306,19 @@ def convert_text_to_xml(text: str, filename: str) -> str:
     # Add content sections
     content = ET.SubElement(root, "content")
     
-    # Split text into sections (basic parsing)
-    sections = text.split('\n\n')
-    for i, section in enumerate(sections):
-        if section.strip():
-            section_elem = ET.SubElement(content, "section")
-            section_elem.set("id", f"section_{i}")
-            section_elem.text = section.strip()
+    # Split text into typed resume sections (skills, experience, projects, education, ...)
+    for section in segment_resume(text):
+        section_elem = ET.SubElement(content, "section")
+        section_elem.set("id", section.id)
+        section_elem.set("type", section.type)
+        if section.heading:
+            section_elem.set("heading", section.heading)
+        section_elem.text = section.text
     
     # Add skills section (extracted from text)
     skills_section = ET.SubElement(root, "skills")
-    extracted_skills = extract_skills_from_text(text, [])
+    if extracted_skills is None:
+        extracted_skills = extract_skills_from_text(text, [])
     for skill in extracted_skills:
         skill_elem = ET.SubElement(skills_section, "skill")
         skill_elem.text = skill
@@ -210,9 +347,10 @@ async def analyze_xml(xml_content: str = Form(...), goal: str = Form(...), weekl
                 skills_from_xml.append(skill.text)
         
         # Use existing analysis logic
-        extracted = extract_skills_from_text(text_content, skills_from_xml)
+        extracted = await run_extraction(extract_skills_from_text, text_content, skills_from_xml)
         required = map_role_to_required_skills(goal)
-        gaps = detect_skill_gaps(known_skills=extracted, required_skills=required)
+        evidence = scan_skill_evidence(text_content) if text_content.strip() else None
+        gaps = detect_skill_gaps(known_skills=extracted, required_skills=required, role=goal, evidence=evidence)
         
         return {
             "xml_parsed": True,
@@ -288,6 +426,121 @@ async def get_interview_questions(role: str):
     return role_questions
 
 
+@app.post("/roles/fit", response_model=RoleFitResponse)
+async def role_fit(request: RoleFitRequest) -> RoleFitResponse:
+    """Rank every role by how well the user's skills meet its requirements, in one pass"""
+    text = request.resume_text or ""
+    extracted = await run_extraction(
+        extract_skills_from_text, text, request.known_skills or [], fuzzy_threshold=request.fuzzy_threshold,
+    )
+    evidence = scan_skill_evidence(text) if text.strip() else None
+    limit = max(1, request.limit) if request.limit is not None else None
+    fits = get_role_matrix().fit(current_skill_scores(extracted, evidence), limit=limit)
+    return RoleFitResponse(
+        extracted_skills=extracted,
+        fits=[RoleFit(**vars(f)) for f in fits],
+    )
+
+
+@app.post("/roles/what-if", response_model=WhatIfResponse)
+async def what_if(request: WhatIfRequest) -> WhatIfResponse:
+    """Which one or two skills would close the most of the target roles' gaps per mastery point"""
+    text = request.resume_text or ""
+    extracted = await run_extraction(
+        extract_skills_from_text, text, request.known_skills or [], fuzzy_threshold=request.fuzzy_threshold,
+    )
+    evidence = scan_skill_evidence(text) if text.strip() else None
+    result = simulate_next_skills(
+        current_skill_scores(extracted, evidence),
+        roles=request.target_roles,
+        limit=max(1, min(request.limit, 50)),
+        pairs=request.include_pairs,
+    )
+    return WhatIfResponse(
+        extracted_skills=extracted,
+        target_roles=result.target_roles,
+        singles=[SkillAdditionResult(**vars(a)) for a in result.singles],
+        pairs=[SkillAdditionResult(**vars(a)) for a in result.pairs],
+    )
+
+
+@app.post("/career/path", response_model=CareerPathResponse)
+async def career_path(request: CareerPathRequest) -> CareerPathResponse:
+    """Cheapest multi-hop route to a target role, from a current role or from the user's skills"""
+    graph = get_role_graph()
+    target = resolve_role(request.target_role).role
+    extracted = None
+    if request.current_role:
+        path = graph.path(resolve_role(request.current_role).role, target)
+    else:
+        text = request.resume_text or ""
+        extracted = await run_extraction(
+            extract_skills_from_text, text, request.known_skills or [], fuzzy_threshold=request.fuzzy_threshold,
+        )
+        evidence = scan_skill_evidence(text) if text.strip() else None
+        path = graph.plan(current_skill_scores(extracted, evidence), target)
+    return CareerPathResponse(
+        start=path.start,
+        target=path.target,
+        total_mastery_points=path.total_mastery_points,
+        direct_mastery_points=path.direct_mastery_points,
+        hops=[CareerHopResult(**vars(h)) for h in path.hops],
+        extracted_skills=extracted,
+    )
+
+
+@app.post("/cohort/gaps")
+async def cohort_gaps(
+    file: UploadFile = File(...),
+    role: Optional[str] = Form(None),
+    format: Optional[str] = Form(None),
+    chunk_size: int = Form(DEFAULT_CHUNK_SIZE),
+):
+    """Skill gap heatmap for a JSONL/CSV file of profiles, against ``role`` or each profile's goal"""
+    fmt = format or ("csv" if (file.filename or "").lower().endswith(".csv") else "jsonl")
+    if fmt not in COHORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(COHORT_FORMATS)}")
+    try:
+        # Streams the upload chunk by chunk off the event loop
+        return await asyncio.to_thread(
+            analyze_cohort_file, file.file, fmt, role, max(1, min(chunk_size, 10000))
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cohort file: {e}")
+
+
+def _role_profile_response(profile: JobProfile, cached: bool) -> RoleProfileResponse:
+    return RoleProfileResponse(
+        profile_id=profile.profile_id,
+        title=profile.title,
+        source=profile.source,
+        skills=[RoleProfileSkill(skill=skill, **info) for skill, info in profile.skills.items()],
+        cached=cached,
+    )
+
+
+@app.post("/roles/profiles", response_model=RoleProfileResponse)
+async def register_role_profile(request: RoleProfileRequest) -> RoleProfileResponse:
+    """Extract a role profile from a job description; the same text always maps to the same profile"""
+    if not request.job_description.strip():
+        raise HTTPException(status_code=400, detail="job_description is empty")
+    try:
+        profile, cached = await asyncio.to_thread(
+            get_job_profile_store().register, request.job_description, request.title, request.enrich
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _role_profile_response(profile, cached)
+
+
+@app.get("/roles/profiles/{profile_id}", response_model=RoleProfileResponse)
+async def get_role_profile(profile_id: str) -> RoleProfileResponse:
+    profile = get_job_profile_store().get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown role profile: {profile_id}")
+    return _role_profile_response(profile, True)
+
+
 @app.get("/roles")
 async def get_available_roles():
     """Get list of available STEM roles"""
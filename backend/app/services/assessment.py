@@ -1,6 +1,7 @@
 import uuid
 from typing import List, Dict
 from .models import AssessmentQuestion, AssessmentResult, AssessmentResultResponse
+from .skill_aliases import canonicalize_skill
 
 
 SOFT_SKILLS_QUESTIONS: Dict[str, List[Dict]] = {
@@ -203,7 +204,7 @@ QUESTION_BANK: Dict[str, Dict[str, List[Dict]]] = {
 def generate_assessment(skills: List[str], num_questions_per_skill: int = 3) -> List[AssessmentQuestion]:
     questions: List[AssessmentQuestion] = []
     for skill in skills:
-        skill_bank = QUESTION_BANK.get(skill.lower(), {})
+        skill_bank = QUESTION_BANK.get(canonicalize_skill(skill), {})
         if isinstance(skill_bank, dict):
             # New format with difficulty levels
             for difficulty in ["beginner", "intermediate", "advanced"]:
@@ -240,7 +241,7 @@ def score_assessment(responses: List[Dict]) -> AssessmentResultResponse:
     skill_to_counts: Dict[str, Dict[str, int]] = {}
     updated_known_skills: List[str] = []
     for r in responses:
-        skill = r.get("skill")
+        skill = canonicalize_skill(r.get("skill") or "")
         correct = 1 if r.get("selected_index") == r.get("answer_index") else 0
         if skill not in skill_to_counts:
             skill_to_counts[skill] = {"correct": 0, "total": 0}
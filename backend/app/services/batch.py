@@ -0,0 +1,120 @@
+"""
+Batch Analysis - analyze many resumes in one request
+Every item is extracted exactly as /analyze would (near-duplicate reuse, tier counters, incremental
+re-extraction for returning users) with bounded concurrency, then gaps are detected in one pass
+"""
+
+import os
+import asyncio
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from .gap_state import record_analysis
+from .gaps import current_skill_scores, detect_skill_gaps, map_role_to_required_skills, resolve_role
+from .incremental_analysis import extract_request_skills
+from .job_profiles import target_profile
+from .local_extractor import get_local_executor
+from .models import AnalyzeRequest, AnalyzeResponse, BatchAnalyzeItemResult
+from .skill_evidence import scan_skill_evidence
+from .skill_graph import document_key, get_skill_graph
+from .skills import get_extraction_backend
+
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_ANALYZE_MAX_ITEMS", 500))
+BATCH_DEFAULT_CONCURRENCY = int(os.getenv("BATCH_ANALYZE_CONCURRENCY", 8))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_ANALYZE_MAX_CONCURRENCY", 32))
+
+
+def _validate_items(items: List[Dict[str, Any]]) -> List[Any]:
+    """Validate each raw item on its own so one bad item does not fail the batch"""
+    validated: List[Any] = []
+    for item in items:
+        try:
+            validated.append(AnalyzeRequest.model_validate(item))
+        except ValidationError as e:
+            validated.append(e)
+    return validated
+
+
+async def _extract_items(requests: List[Any], max_concurrency: int) -> List[Any]:
+    """Extract every valid request off the event loop, at most ``max_concurrency`` at a time.
+
+    Each entry is (skills, recomputed sections), the exception an item raised, or None for
+    items that failed validation.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    local = get_extraction_backend() == "local"
+    loop = asyncio.get_running_loop()
+
+    async def run(request: Any) -> Any:
+        if not isinstance(request, AnalyzeRequest):
+            return None
+        extract = partial(
+            extract_request_skills, request.resume_text or "", request.known_skills or [],
+            request.fuzzy_threshold, request.user_id,
+        )
+        if local:
+            # CPU-bound; the local model's own thread pool bounds it
+            return await loop.run_in_executor(get_local_executor(), extract)
+        async with semaphore:
+            return await asyncio.to_thread(extract)
+
+    return await asyncio.gather(*(run(r) for r in requests), return_exceptions=True)
+
+
+async def analyze_batch(items: List[Dict[str, Any]], max_concurrency: Optional[int] = None) -> List[BatchAnalyzeItemResult]:
+    """Analyze every item and return results in input order"""
+    concurrency = max(1, min(max_concurrency or BATCH_DEFAULT_CONCURRENCY, BATCH_MAX_CONCURRENCY))
+    requests = _validate_items(items)
+    extractions = await _extract_items(requests, concurrency)
+
+    required_by_goal: Dict[str, List[str]] = {}
+    skill_graph = get_skill_graph()
+    results: List[BatchAnalyzeItemResult] = []
+    for index, (request, extraction) in enumerate(zip(requests, extractions)):
+        if isinstance(request, ValidationError):
+            results.append(BatchAnalyzeItemResult(index=index, error=str(request)))
+            continue
+        try:
+            if isinstance(extraction, BaseException):
+                raise extraction
+            extracted, recomputed_sections = extraction
+            # Items sharing a job description share one registered profile
+            profile = target_profile(request.role_profile_id, request.job_description)
+            if profile is not None:
+                role, confidence, required = profile.title, 1.0, list(profile.skills)
+            else:
+                resolution = resolve_role(request.goal)
+                role, confidence = resolution.role, resolution.confidence
+                required = required_by_goal.get(role)
+                if required is None:
+                    required = required_by_goal[role] = map_role_to_required_skills(role)
+            evidence = scan_skill_evidence(request.resume_text) if (request.resume_text or "").strip() else None
+            if evidence is not None:
+                skill_graph.observe(extracted, key=document_key(request.resume_text, request.user_id))
+            gaps = detect_skill_gaps(
+                known_skills=extracted, required_skills=required, role=role,
+                evidence=evidence, cooccurrence=skill_graph,
+                requirements=profile.skills if profile is not None else None,
+            )
+            if request.user_id:
+                # Same gap state /analyze keeps, so assessments can update batch results too
+                scores = current_skill_scores(extracted, evidence)
+                record_analysis(
+                    request.user_id, role, required, scores, set(scores) if evidence is not None else set(), gaps,
+                    requirements=profile.skills if profile is not None else None,
+                    role_profile_id=profile.profile_id if profile is not None else None,
+                )
+            results.append(BatchAnalyzeItemResult(
+                index=index,
+                result=AnalyzeResponse(
+                    extracted_skills=extracted, required_skills=required, skill_gaps=gaps,
+                    recomputed_sections=recomputed_sections,
+                    resolved_role=role, role_confidence=confidence,
+                    role_profile_id=profile.profile_id if profile is not None else None,
+                ),
+            ))
+        except Exception as e:
+            results.append(BatchAnalyzeItemResult(index=index, error=f"Analysis failed: {e}"))
+    return results
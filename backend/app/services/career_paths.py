@@ -0,0 +1,190 @@
+"""
+Career Paths - cheapest sequence of roles to a target role, with skills accumulating along the way
+Moving into a role costs the mastery points to raise its fit to the entry bar; the rest of its
+requirements are learned on the job and carry over to later roles. Every skill has one price per
+point of score whichever role it is learned for. Role-to-role paths are precomputed whenever the
+taxonomy is loaded; paths are searched with Dijkstra over the sets of roles visited so far
+"""
+
+import os
+import heapq
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .role_fit import RoleMatrix, get_role_matrix
+from .taxonomy import on_taxonomy_change
+
+# Most hops in a path, the move into the target included; a direct move is always one hop
+MAX_CAREER_HOPS = int(os.getenv("CAREER_MAX_HOPS", 3))
+
+# Mastery-weighted fit a role needs before moving into it; 1.0 means learning all of it first
+CAREER_ENTRY_FIT = float(os.getenv("CAREER_ENTRY_FIT", 0.7))
+
+
+@dataclass
+class CareerHop:
+    from_role: Optional[str]  # None for the first hop of a plan from current skills
+    to_role: str
+    mastery_points: float
+    skills_to_learn: List[str]
+
+
+@dataclass
+class CareerPath:
+    start: Optional[str]
+    target: str
+    total_mastery_points: float
+    direct_mastery_points: float  # cost of entering the target directly from the start
+    hops: List[CareerHop]
+
+
+class RoleGraph:
+    """Complete role graph over a RoleMatrix, with every role-to-role path precomputed.
+
+    A skill costs the same points per unit of score in every role (its mastery points per
+    required score, averaged over the roles requiring it), so which role a skill is learned for
+    never changes its price. Entering a role takes its fit to ``entry_fit`` with the most fit
+    per point first; working in it then raises every skill to the role's requirements. An
+    intermediate role is therefore worth it when what it teaches on the job lowers the bar
+    for later roles by more than it costs to enter. Since that only depends on the set of
+    roles visited, the search runs over those sets. The direct move is always a candidate,
+    so every target is reachable.
+    """
+
+    def __init__(self, matrix: RoleMatrix, max_hops: int = MAX_CAREER_HOPS, entry_fit: float = CAREER_ENTRY_FIT):
+        self.matrix = matrix
+        self.roles = matrix.roles
+        self.index = {role: r for r, role in enumerate(self.roles)}
+        self.max_hops = max(1, max_hops)
+        self.entry_fit = min(max(entry_fit, 0.0), 1.0)
+        self._prices = self._skill_prices()
+        self._profiles = [self.profile(r) for r in range(len(self.roles))]
+        self._paths: Dict[Tuple[int, int], CareerPath] = {
+            (source, target): self._career_path({}, (source,), target)
+            for source in range(len(self.roles))
+            for target in range(len(self.roles))
+            if source != target
+        }
+
+    def _skill_prices(self) -> List[float]:
+        """Mastery points per unit of score of each matrix skill, averaged over the roles requiring it"""
+        prices = []
+        for s in range(len(self.matrix.skills)):
+            rates = [
+                self.matrix._mastery[r][s] / self.matrix._required[r][s]
+                for r in range(len(self.roles)) if self.matrix._required[r][s] > 0
+            ]
+            prices.append(sum(rates) / len(rates) if rates else 0.0)
+        return prices
+
+    def profile(self, r: int) -> Dict[str, float]:
+        """A role's requirements as current skill scores"""
+        return {self.matrix.skills[s]: req for s, req in enumerate(self.matrix._required[r]) if req > 0}
+
+    def _covered(self, scores: Dict[str, float], visited: Tuple[int, ...]) -> Dict[str, float]:
+        """``scores`` raised to the requirements of every visited role"""
+        covered = dict(scores)
+        for r in visited:
+            for skill, required in self._profiles[r].items():
+                if required > covered.get(skill, 0.0):
+                    covered[skill] = required
+        return covered
+
+    def _entry(self, vector: List[float], b: int) -> Tuple[float, List[str]]:
+        """Points to raise role ``b``'s fit from ``vector`` to the entry bar, and the skills learned"""
+        required, mastery = self.matrix._required[b], self.matrix._mastery[b]
+        total = sum(mastery)
+        if total <= 0:
+            return 0.0, []
+        needed = self.entry_fit - sum(
+            mastery[s] / total * min(vector[s] / req, 1.0) for s, req in enumerate(required) if req > 0
+        )
+        # Fit gained per point spent on each unmet skill; the cheapest fit is learned first
+        options = sorted(
+            (
+                (mastery[s] / (total * req * self._prices[s]), s)
+                for s, req in enumerate(required) if req > 0 and vector[s] < req
+            ),
+            key=lambda option: (-option[0], self.matrix.skills[option[1]]),
+        )
+        points, skills = 0.0, []
+        for efficiency, s in options:
+            if needed <= 1e-9:
+                break
+            gain = min(mastery[s] / total * (1.0 - vector[s] / required[s]), needed)
+            points += gain / efficiency
+            needed -= gain
+            skills.append(self.matrix.skills[s])
+        return points, skills
+
+    def _vector(self, scores: Dict[str, float], visited: Tuple[int, ...]) -> List[float]:
+        return self.matrix.user_vector(self._covered(scores, visited))
+
+    def _search(self, scores: Dict[str, float], start: Tuple[int, ...], target: int) -> List[int]:
+        """Cheapest roles to pass through, ending at ``target``; fewer hops win ties"""
+        best: Dict[frozenset, float] = {frozenset(start): 0.0}
+        queue: List[Tuple[float, int, Tuple[int, ...]]] = [(0.0, 0, start)]
+        while queue:
+            cost, hops, visited = heapq.heappop(queue)
+            if hops and visited[-1] == target:
+                return list(visited[len(start):])
+            if cost > best[frozenset(visited)]:
+                continue
+            vector = self._vector(scores, visited)
+            for b in range(len(self.roles)):
+                # Intermediate roles only while a hop is left for the target
+                if b in visited or (b != target and hops + 2 > self.max_hops):
+                    continue
+                candidate = round(cost + self._entry(vector, b)[0], 6)
+                state = frozenset(visited + (b,))
+                if candidate < best.get(state, float("inf")):
+                    best[state] = candidate
+                    heapq.heappush(queue, (candidate, hops + 1, visited + (b,)))
+        return [target]
+
+    def _career_path(self, scores: Dict[str, float], start: Tuple[int, ...], target: int) -> CareerPath:
+        route = self._search(scores, start, target)
+        hops = []
+        previous: Optional[str] = self.roles[start[-1]] if start else None
+        for step, r in enumerate(route):
+            points, skills = self._entry(self._vector(scores, start + tuple(route[:step])), r)
+            hops.append(CareerHop(previous, self.roles[r], round(points, 1), skills))
+            previous = self.roles[r]
+        return CareerPath(
+            start=self.roles[start[-1]] if start else None,
+            target=self.roles[target],
+            total_mastery_points=round(sum(h.mastery_points for h in hops), 1),
+            direct_mastery_points=round(self._entry(self._vector(scores, start), target)[0], 1),
+            hops=hops,
+        )
+
+    def path(self, source_role: str, target_role: str) -> CareerPath:
+        """Cheapest path from a role's requirements to another role"""
+        source, target = self.index[source_role], self.index[target_role]
+        if source == target:
+            return CareerPath(source_role, target_role, 0.0, 0.0, [])
+        return self._paths[(source, target)]
+
+    def plan(self, current_scores: Dict[str, float], target_role: str) -> CareerPath:
+        """Cheapest path from a user's current skills, entering any role first"""
+        return self._career_path(current_scores, (), self.index[target_role])
+
+
+# Global instance
+_role_graph_instance = None
+
+def get_role_graph() -> RoleGraph:
+    """Get or build the role graph"""
+    global _role_graph_instance
+    if _role_graph_instance is None:
+        _role_graph_instance = RoleGraph(get_role_matrix())
+    return _role_graph_instance
+
+
+def _install_role_graph(graph: RoleGraph) -> None:
+    global _role_graph_instance
+    _role_graph_instance = graph
+
+
+# All-pairs paths are computed with the new taxonomy, before anything is swapped in
+on_taxonomy_change(lambda taxonomy: RoleGraph(RoleMatrix(taxonomy.role_to_skills)), _install_role_graph)
@@ -0,0 +1,214 @@
+"""
+Cohort Analytics - skill gap heatmaps over thousands of profiles
+Profiles stream in fixed-size chunks; each chunk becomes a profiles x skills score matrix
+whose gaps are summed into per-role totals, so memory stays flat in the cohort size
+"""
+
+import io
+import csv
+import json
+from itertools import islice
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .gaps import resolve_role
+from .role_fit import RoleMatrix, get_role_matrix
+from .skill_aliases import canonicalize_skill
+from .skill_evidence import LISTED_SCORE
+
+COHORT_FORMATS = ("jsonl", "csv")
+DEFAULT_CHUNK_SIZE = 1000
+
+# Same assumptions as detect_skill_gaps: a listed skill counts as 0.8, a missing one as 0.2
+KNOWN_SCORE = 0.8
+MISSING_SCORE = 0.2
+
+_CSV_SKILL_SEPARATORS = (";", "|")
+
+
+def _split_skills(value: str) -> List[str]:
+    for separator in _CSV_SKILL_SEPARATORS:
+        if separator in value:
+            return [s.strip() for s in value.split(separator) if s.strip()]
+    return [s.strip() for s in value.split(",") if s.strip()]
+
+
+def read_profiles(stream: IO[str], fmt: str = "jsonl") -> Iterator[Dict]:
+    """Yield profiles one at a time from a JSONL or CSV text stream.
+
+    A profile has ``known_skills`` (list, or a ";"/"|"/","-separated CSV cell), an optional
+    ``goal`` and optional ``skill_scores`` ({skill: 0..1}, JSON-encoded in CSV). A line or
+    row that is not valid JSON is yielded as None, which the aggregator counts as skipped.
+    """
+    if fmt not in COHORT_FORMATS:
+        raise ValueError(f"format must be one of {COHORT_FORMATS}")
+    if fmt == "jsonl":
+        for line in stream:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    yield None
+        return
+    for row in csv.DictReader(stream):
+        profile: Dict = {"goal": row.get("goal") or row.get("role") or ""}
+        profile["known_skills"] = _split_skills(row.get("known_skills") or row.get("skills") or "")
+        if row.get("skill_scores"):
+            try:
+                profile["skill_scores"] = json.loads(row["skill_scores"])
+            except json.JSONDecodeError:
+                profile = None
+        yield profile
+
+
+def chunked(profiles: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    iterator = iter(profiles)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class CohortGapAggregator:
+    """Running per-role, per-skill gap totals for a cohort.
+
+    Each chunk is scored as one matrix: rows are profiles, columns are RoleMatrix skills, and
+    every row is compared with its role's required scores. A required skill is "missing" when
+    unlisted and "partial" when a graded score (``skill_scores``) falls below the requirement;
+    listed skills without a score count as met, as in ``detect_skill_gaps``. An unlisted skill
+    with a listed specialization in the skill hierarchy is credited as in ``RoleMatrix.user_vector``.
+    """
+
+    def __init__(self, matrix: Optional[RoleMatrix] = None, role: Optional[str] = None):
+        self.matrix = matrix or get_role_matrix()
+        self.role = resolve_role(role).role if role else None
+        self._role_index = {r: i for i, r in enumerate(self.matrix.roles)}
+        roles, skills = len(self.matrix.roles), len(self.matrix.skills)
+        self.profiles = [0] * roles
+        self.skipped = 0
+        if NUMPY_AVAILABLE:
+            self.missing = np.zeros((roles, skills), dtype=np.int64)
+            self.partial = np.zeros((roles, skills), dtype=np.int64)
+            self.deficit = np.zeros((roles, skills), dtype=np.float64)
+            self.mastery = np.zeros((roles, skills), dtype=np.float64)
+        else:
+            self.missing = [[0] * skills for _ in range(roles)]
+            self.partial = [[0] * skills for _ in range(roles)]
+            self.deficit = [[0.0] * skills for _ in range(roles)]
+            self.mastery = [[0.0] * skills for _ in range(roles)]
+
+    def _profile_row(self, profile: Dict):
+        """(role index, score per matrix skill, whether the scores are graded, credit per skill) for one profile"""
+        role = self.role or resolve_role(profile.get("goal") or profile.get("role") or "").role
+        graded = profile.get("skill_scores") or {}
+        # Skills listed without a grade get the listed-only score, as in current_skill_scores
+        listed = LISTED_SCORE if graded else KNOWN_SCORE
+        scores = {canonicalize_skill(skill): listed for skill in profile.get("known_skills") or []}
+        scores.update({canonicalize_skill(skill): float(score) for skill, score in graded.items()})
+        # Held scores only: credited skills are counted as partial, not as held
+        vector = self.matrix.held_vector(scores)
+        credited = [0.0] * len(vector)
+        for s, credit in self.matrix.credited(vector, scores).items():
+            credited[s] = credit
+        return self._role_index[role], vector, bool(graded), credited
+
+    def add(self, profiles: List[Dict]) -> None:
+        """Fold one chunk of profiles into the totals"""
+        rows = []
+        for profile in profiles:
+            try:
+                rows.append(self._profile_row(profile))
+            except (AttributeError, TypeError, ValueError, KeyError):
+                # KeyError: the taxonomy was reloaded mid-run with a role this matrix lacks
+                self.skipped += 1
+        if not rows:
+            return
+        for r, _, _, _ in rows:
+            self.profiles[r] += 1
+        if NUMPY_AVAILABLE:
+            self._add_numpy(rows)
+        else:
+            self._add_python(rows)
+
+    def _add_numpy(self, rows) -> None:
+        role_idx = np.fromiter((r for r, _, _, _ in rows), dtype=np.int64, count=len(rows))
+        scores = np.asarray([v for _, v, _, _ in rows], dtype=np.float64)
+        graded = np.fromiter((g for _, _, g, _ in rows), dtype=bool, count=len(rows))[:, None]
+        credit = np.asarray([c for _, _, _, c in rows], dtype=np.float64)
+        required = self.matrix.required[role_idx]
+        needed = self.matrix.mask[role_idx]
+        held, credited = scores > 0, credit > 0
+        current = np.where(held, scores, np.where(credited, credit, MISSING_SCORE))
+        missing = needed & ~held & ~credited
+        partial = needed & ((held & graded) | credited) & (current < required)
+        gap = missing | partial
+        # Gap rows summed into their role's row of each total
+        np.add.at(self.missing, role_idx, missing)
+        np.add.at(self.partial, role_idx, partial)
+        np.add.at(self.deficit, role_idx, np.where(gap, required - current, 0.0))
+        np.add.at(self.mastery, role_idx, np.where(gap, self.matrix.mastery[role_idx], 0.0))
+
+    def _add_python(self, rows) -> None:
+        for r, vector, graded, credited in rows:
+            for s, required in enumerate(self.matrix._required[r]):
+                if required <= 0:
+                    continue
+                held = vector[s] > 0
+                current = vector[s] if held else credited[s] or MISSING_SCORE
+                if not held and not credited[s]:
+                    self.missing[r][s] += 1
+                elif (graded or credited[s]) and current < required:
+                    self.partial[r][s] += 1
+                else:
+                    continue
+                self.deficit[r][s] += required - current
+                self.mastery[r][s] += self.matrix._mastery[r][s]
+
+    def report(self) -> Dict:
+        """Per-role heatmap rows, most common gap first"""
+        roles = []
+        for r, role in enumerate(self.matrix.roles):
+            count = self.profiles[r]
+            if not count:
+                continue
+            skills = []
+            for s, skill in enumerate(self.matrix.skills):
+                if self.matrix._required[r][s] <= 0:
+                    continue
+                missing, partial = int(self.missing[r][s]), int(self.partial[r][s])
+                skills.append({
+                    "skill": skill,
+                    "missing": missing,
+                    "partial": partial,
+                    "gap_rate": round((missing + partial) / count, 4),
+                    "avg_deficit": round(float(self.deficit[r][s]) / count, 4),  # over all of the role's profiles
+                    "mastery_points": round(float(self.mastery[r][s]), 1),
+                })
+            skills.sort(key=lambda item: (-item["gap_rate"], -item["avg_deficit"], item["skill"]))
+            roles.append({"role": role, "profiles": count, "skills": skills})
+        return {"profiles": sum(self.profiles), "skipped": self.skipped, "roles": roles}
+
+
+def analyze_cohort(
+    profiles: Iterable[Dict],
+    role: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict:
+    """Gap heatmap for a stream of profiles, against ``role`` or each profile's own goal"""
+    aggregator = CohortGapAggregator(role=role)
+    for chunk in chunked(profiles, max(1, chunk_size)):
+        aggregator.add(chunk)
+    return aggregator.report()
+
+
+def analyze_cohort_file(stream: IO, fmt: str = "jsonl", role: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict:
+    """``analyze_cohort`` over a JSONL/CSV file; binary streams are decoded as UTF-8"""
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    return analyze_cohort(read_profiles(stream, fmt), role=role, chunk_size=chunk_size)
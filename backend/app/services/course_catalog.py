@@ -0,0 +1,302 @@
+"""
+Course Catalog - persistent provider course store with a skill -> course inverted index
+Courses live in SQLite with an FTS5 index over titles, descriptions and skills, so ranking
+reads only the rows that teach a skill and the catalog never has to fit in memory
+"""
+
+import io
+import os
+import csv
+import json
+import sqlite3
+import threading
+from itertools import islice
+from typing import Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from .course_scoring import NUMPY_AVAILABLE, CourseColumns
+from .skill_aliases import canonicalize_skill
+
+CATALOG_FORMATS = ("jsonl", "csv")
+DEFAULT_BATCH_SIZE = 2000
+
+# Courses considered when no course is indexed under a skill and full-text search finds none
+FALLBACK_CANDIDATES = 200
+
+_COLUMNS = ("course_key", "provider", "name", "link", "difficulty", "duration_hours", "rating", "price", "description")
+_SKILL_SEPARATORS = (";", "|")
+
+
+def _split_skills(value) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        return [str(s).strip() for s in value if str(s).strip()]
+    value = str(value or "")
+    for separator in _SKILL_SEPARATORS:
+        if separator in value:
+            return [s.strip() for s in value.split(separator) if s.strip()]
+    return [s.strip() for s in value.split(",") if s.strip()]
+
+
+def _price_label(value) -> str:
+    """Provider dumps give prices as numbers or labels; the catalog stores Free/Paid"""
+    if isinstance(value, (int, float)):
+        return "Free" if value <= 0 else "Paid"
+    text = str(value or "").strip()
+    if not text or text.lower() in ("free", "0", "0.0", "$0"):
+        return "Free"
+    return "Paid"
+
+
+def normalize_course(raw: Dict) -> Dict:
+    """One catalog row from a provider record; field names follow MOCK_PROVIDER_COURSES or Course.
+
+    Raises ValueError for records without a title or any skill.
+    """
+    name = raw.get("name") or raw.get("title")
+    skills = sorted({canonicalize_skill(s) for s in _split_skills(raw.get("skills") or raw.get("skills_covered") or raw.get("skill"))})
+    if not name or not skills:
+        raise ValueError("course needs a name and at least one skill")
+    provider = raw.get("provider") or raw.get("platform") or "Unknown"
+    link = raw.get("link") or raw.get("url") or ""
+    return {
+        "course_key": str(raw.get("course_id") or f"{provider}:{link or name}"),
+        "provider": provider,
+        "name": name,
+        "link": link,
+        "difficulty": raw.get("difficulty") or raw.get("difficulty_level") or "Beginner",
+        "duration_hours": int(float(raw.get("duration_hours") or 5)),
+        "rating": float(raw.get("rating") or 0.0),
+        "price": _price_label(raw.get("price", "Free")),
+        "description": raw.get("description") or "",
+        "skills": skills,
+    }
+
+
+def read_courses(stream: IO[str], fmt: str = "jsonl") -> Iterator[Dict]:
+    """Yield raw course records one at a time from a JSONL or CSV text stream"""
+    if fmt not in CATALOG_FORMATS:
+        raise ValueError(f"format must be one of {CATALOG_FORMATS}")
+    if fmt == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+        return
+    yield from csv.DictReader(stream)
+
+
+def _fts_query(text: str) -> str:
+    """Quote every word so user text is never parsed as FTS5 syntax"""
+    words = [w for w in "".join(ch if ch.isalnum() else " " for ch in text.lower()).split() if w]
+    return " ".join(f'"{w}"' for w in words)
+
+
+class CourseCatalog:
+    """SQLite course store: a courses table, a (skill, course) inverted index and an FTS5 index.
+
+    Pass ``path=":memory:"`` for a process-local catalog. Without FTS5 in the SQLite build,
+    full-text search is disabled and skill lookups still work.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        # Bumped on every write so the columnar snapshot knows when to rebuild; writes from other
+        # connections (load_course_catalog.py) show up in PRAGMA data_version instead
+        self._version = 0
+        self._columns = None
+        self._columns_version = None
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(
+            "PRAGMA journal_mode = WAL;"
+            "CREATE TABLE IF NOT EXISTS courses ("
+            " id INTEGER PRIMARY KEY, course_key TEXT NOT NULL UNIQUE, provider TEXT NOT NULL,"
+            " name TEXT NOT NULL, link TEXT NOT NULL, difficulty TEXT NOT NULL,"
+            " duration_hours INTEGER NOT NULL, rating REAL NOT NULL, price TEXT NOT NULL,"
+            " description TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS course_skills ("
+            " skill TEXT NOT NULL, course_id INTEGER NOT NULL, PRIMARY KEY (skill, course_id)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS idx_course_skills_course ON course_skills (course_id);"
+            "CREATE INDEX IF NOT EXISTS idx_courses_rating ON courses (rating DESC);"
+        )
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS course_fts USING fts5("
+                " name, description, skills, tokenize = 'porter unicode61')"
+            )
+            self.fts = True
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ Course catalog full-text search disabled: {e}")
+            self.fts = False
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM courses").fetchone()[0]
+
+    def add_courses(self, courses: Iterable[Dict], batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+        """Upsert raw course records in batches of one transaction each.
+
+        Records are normalized with ``normalize_course``; invalid ones are counted and skipped.
+        A record whose key is already stored replaces it, skills and search text included.
+        """
+        stats = {"loaded": 0, "skipped": 0}
+        iterator = iter(courses)
+        while True:
+            batch = list(islice(iterator, max(1, batch_size)))
+            if not batch:
+                return stats
+            rows = []
+            for raw in batch:
+                try:
+                    rows.append(normalize_course(raw))
+                except (AttributeError, TypeError, ValueError):
+                    stats["skipped"] += 1
+            with self._lock:
+                self._write(rows)
+                self._version += 1
+            stats["loaded"] += len(rows)
+
+    def _write(self, rows: List[Dict]) -> None:
+        conn = self._conn
+        with conn:
+            ids = []
+            for row in rows:
+                ids.append(conn.execute(
+                    f"INSERT INTO courses ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+                    " ON CONFLICT (course_key) DO UPDATE SET "
+                    + ", ".join(f"{c} = excluded.{c}" for c in _COLUMNS[1:])
+                    + " RETURNING id",
+                    [row[c] for c in _COLUMNS],
+                ).fetchone()[0])
+            # Replaced courses drop their old skills and search text first
+            conn.executemany("DELETE FROM course_skills WHERE course_id = ?", [(i,) for i in ids])
+            conn.executemany(
+                "INSERT OR IGNORE INTO course_skills (skill, course_id) VALUES (?, ?)",
+                [(skill, i) for i, row in zip(ids, rows) for skill in row["skills"]],
+            )
+            if self.fts:
+                conn.executemany("DELETE FROM course_fts WHERE rowid = ?", [(i,) for i in ids])
+                conn.executemany(
+                    "INSERT INTO course_fts (rowid, name, description, skills) VALUES (?, ?, ?, ?)",
+                    [(i, row["name"], row["description"], " ".join(row["skills"])) for i, row in zip(ids, rows)],
+                )
+
+    def _rows(self, sql: str, params) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        courses = []
+        for row in rows:
+            course = dict(row)
+            course["skills"] = course["skills"].split(",") if course.get("skills") else []
+            courses.append(course)
+        return courses
+
+    _SELECT = (
+        "SELECT c.*, (SELECT group_concat(skill) FROM course_skills WHERE course_id = c.id) AS skills"
+        " FROM courses c"
+    )
+
+    def courses_for_skill(self, skill: str, limit: Optional[int] = None) -> List[Dict]:
+        """Courses indexed under ``skill`` (canonicalized), in load order"""
+        return self._rows(
+            f"{self._SELECT} JOIN course_skills s ON s.course_id = c.id WHERE s.skill = ? ORDER BY c.id LIMIT ?",
+            (canonicalize_skill(skill), -1 if limit is None else limit),
+        )
+
+    def courses_by_id(self, course_ids: List[int]) -> Dict[int, Dict]:
+        """Stored courses keyed by id; ids no longer stored are left out"""
+        if not course_ids:
+            return {}
+        return {c["id"]: c for c in self._rows(
+            f"{self._SELECT} WHERE c.id IN ({', '.join('?' * len(course_ids))})", list(course_ids)
+        )}
+
+    def search_ids(self, text: str, limit: int = 20) -> List[int]:
+        """Ids of the best full-text matches, best first"""
+        query = _fts_query(text)
+        if not self.fts or not query:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid FROM course_fts WHERE course_fts MATCH ? ORDER BY rank LIMIT ?", (query, limit)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def search(self, text: str, limit: int = 20) -> List[Dict]:
+        """Full-text search over titles, descriptions and skills, best BM25 match first"""
+        query = _fts_query(text)
+        if not self.fts or not query:
+            return []
+        return self._rows(
+            f"{self._SELECT} JOIN course_fts f ON f.rowid = c.id WHERE course_fts MATCH ? ORDER BY f.rank LIMIT ?",
+            (query, limit),
+        )
+
+    def top_rated(self, limit: int = FALLBACK_CANDIDATES) -> List[Dict]:
+        return self._rows(f"{self._SELECT} ORDER BY c.rating DESC, c.id LIMIT ?", (limit,))
+
+    def skills(self) -> Dict[str, int]:
+        """Skill -> number of courses teaching it"""
+        with self._lock:
+            rows = self._conn.execute("SELECT skill, COUNT(*) FROM course_skills GROUP BY skill").fetchall()
+        return {skill: count for skill, count in rows}
+
+    def _data_version(self) -> Tuple[int, int]:
+        """Changes after a write through this catalog or a commit by any other connection"""
+        return self._version, self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def columns(self) -> Optional[CourseColumns]:
+        """Columnar snapshot for vectorized ranking, rebuilt after writes; None without NumPy"""
+        if not NUMPY_AVAILABLE:
+            return None
+        with self._lock:
+            version = self._data_version()
+            if self._columns_version == version:
+                return self._columns
+            course_rows = self._conn.execute(
+                "SELECT id, provider, rating, duration_hours, price FROM courses ORDER BY id"
+            ).fetchall()
+            skill_rows = self._conn.execute("SELECT skill, course_id FROM course_skills ORDER BY skill, course_id").fetchall()
+        columns = CourseColumns(course_rows, skill_rows)
+        with self._lock:
+            if self._data_version() == version:
+                self._columns, self._columns_version = columns, version
+        return columns
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM courses")
+            self._conn.execute("DELETE FROM course_skills")
+            if self.fts:
+                self._conn.execute("DELETE FROM course_fts")
+            self._version += 1
+
+
+def load_catalog_file(
+    stream: IO,
+    fmt: str = "jsonl",
+    catalog: Optional[CourseCatalog] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict[str, int]:
+    """Stream a JSONL/CSV provider dump into the catalog; binary streams are decoded as UTF-8"""
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    if catalog is None:
+        catalog = get_course_catalog()
+    return catalog.add_courses(read_courses(stream, fmt), batch_size=batch_size)
+
+
+# Global instance
+_course_catalog_instance = None
+
+def get_course_catalog() -> CourseCatalog:
+    """Get or open the catalog at COURSE_CATALOG_PATH (in memory when unset), seeding an empty one"""
+    global _course_catalog_instance
+    if _course_catalog_instance is None:
+        from .resources import MOCK_PROVIDER_COURSES
+
+        catalog = CourseCatalog(os.getenv("COURSE_CATALOG_PATH") or ":memory:")
+        if not len(catalog):
+            catalog.add_courses(MOCK_PROVIDER_COURSES)
+        _course_catalog_instance = catalog
+    return _course_catalog_instance
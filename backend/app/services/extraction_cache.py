@@ -0,0 +1,156 @@
+"""
+Extraction Cache - content-addressed cache for LLM skill extraction results
+In-memory LRU tier in front of an on-disk SQLite tier with TTL and size-based eviction
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+DEFAULT_CACHE_PATH = os.path.join(tempfile.gettempdir(), "noesis_extraction_cache.sqlite3")
+
+
+def make_cache_key(text: str, known_skills: Optional[Iterable[str]], model: str, prompt_version: str) -> str:
+    """Hash of everything that determines an extraction result"""
+    normalized = re.sub(r"\s+", " ", (text or "").strip().lower())
+    skills = sorted({s.strip().lower() for s in known_skills or [] if s and s.strip()})
+    payload = json.dumps([normalized, skills, model, prompt_version], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """Two-tier cache: a bounded in-process LRU backed by SQLite so entries survive restarts.
+
+    Pass ``path=None`` for a memory-only cache. Values must be JSON-serializable.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 50_000,
+        memory_entries: int = 1024,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS extraction_cache ("
+                    " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                    " created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_extraction_cache_accessed ON extraction_cache (accessed_at)"
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ Extraction cache disk tier disabled ({path}): {e}")
+                self._conn = None
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value, created_at FROM extraction_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        if now - row[1] <= self.ttl_seconds:
+                            self._conn.execute(
+                                "UPDATE extraction_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                            )
+                            self._conn.commit()
+                            value = json.loads(row[0])
+                            self._remember(key, row[1], value)
+                            self.stats["disk_hits"] += 1
+                            return value
+                        self._conn.execute("DELETE FROM extraction_cache WHERE key = ?", (key,))
+                        self._conn.commit()
+                except sqlite3.Error as e:
+                    print(f"⚠️ Extraction cache read failed: {e}")
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO extraction_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now),
+                )
+                self._evict(now)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ Extraction cache write failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM extraction_cache")
+                self._conn.commit()
+
+    def _remember(self, key: str, created_at: float, value: Any) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then least-recently-used rows beyond ``max_entries``"""
+        self._conn.execute("DELETE FROM extraction_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        count = self._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM extraction_cache WHERE key IN ("
+                " SELECT key FROM extraction_cache ORDER BY accessed_at ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+
+# Global instance
+_extraction_cache_instance = None
+
+def get_extraction_cache() -> ExtractionCache:
+    """Get or create the extraction cache configured from the environment"""
+    global _extraction_cache_instance
+    if _extraction_cache_instance is None:
+        path = os.getenv("EXTRACTION_CACHE_PATH", DEFAULT_CACHE_PATH)
+        _extraction_cache_instance = ExtractionCache(
+            path=path or None,
+            ttl_seconds=float(os.getenv("EXTRACTION_CACHE_TTL_SECONDS", 7 * 24 * 3600)),
+            max_entries=int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", 50_000)),
+            memory_entries=int(os.getenv("EXTRACTION_CACHE_MEMORY_ENTRIES", 1024)),
+        )
+    return _extraction_cache_instance
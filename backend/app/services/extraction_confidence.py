@@ -0,0 +1,104 @@
+"""
+Extraction Confidence - how much to trust a rule-based extraction before escalating to the LLM
+Combines lexicon hit density, resume section coverage and unknown capitalized terms into one score
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Set
+
+from .resume_sections import segment_resume
+from .skill_matcher import SkillMatch
+
+# Roughly one lexicon hit per this many tokens is what a well-covered resume looks like
+TARGET_HITS_PER_TOKEN = 1 / 40
+
+# Sections whose presence marks a well-structured resume
+CORE_SECTIONS = ("skills", "experience", "projects", "education")
+
+_TOKEN = re.compile(r"[A-Za-z][A-Za-z0-9+#.]*")
+_CAPITALIZED = re.compile(r"(?<![\w.])[A-Z][A-Za-z0-9+#]*(?:\.[A-Za-z]+)?")
+_SENTENCE_BREAKS = set(".!?:;•*-–|\n")
+
+# Capitalized words that are not skills: headings, months, titles and sentence starters
+COMMON_CAPITALIZED_WORDS: Set[str] = {
+    "i", "a", "an", "the", "and", "or", "in", "on", "at", "for", "with", "to", "of", "by", "as", "from",
+    "my", "we", "our", "led", "built", "worked", "developed", "designed", "managed", "created", "used",
+    "skills", "experience", "projects", "education", "summary", "profile", "objective", "contact",
+    "technical", "professional", "work", "university", "college", "school", "bachelor", "master",
+    "phd", "bs", "ba", "ms", "ma", "mba", "present", "current", "senior", "junior", "lead", "intern",
+    "engineer", "analyst", "scientist", "manager", "developer", "inc", "llc", "ltd", "corp", "company",
+    "january", "february", "march", "april", "may", "june", "july", "august", "september", "october",
+    "november", "december", "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct",
+    "nov", "dec", "usa", "us", "uk", "new", "york", "san", "francisco", "references", "available",
+}
+
+
+def _starts_sentence(text: str, index: int) -> bool:
+    i = index - 1
+    while i >= 0 and text[i] in " \t":
+        i -= 1
+    return i < 0 or text[i] in _SENTENCE_BREAKS
+
+
+def _unknown_capitalized_terms(text: str, known: Set[str]) -> List[str]:
+    """Capitalized terms that are not sentence starters, common words or known skills"""
+    terms = []
+    for match in _CAPITALIZED.finditer(text):
+        term = match.group(0)
+        lowered = term.lower()
+        if len(term) < 2 or lowered in COMMON_CAPITALIZED_WORDS or lowered in known:
+            continue
+        # Ordinary words are capitalized at the start of a line, bullet or sentence;
+        # only keep those that do not look like plain words (PyTorch, AWS)
+        if term[1:].islower() and _starts_sentence(text, match.start()):
+            continue
+        terms.append(term)
+    return terms
+
+
+@dataclass
+class ExtractionConfidence:
+    """Confidence that rule-based extraction captured a text's skills, with its components"""
+    score: float  # 0.0 to 1.0
+    hit_density: float
+    section_coverage: float
+    unknown_terms: List[str]
+
+
+def score_extraction_confidence(
+    text: str,
+    matches: Iterable[SkillMatch],
+    known_surface_forms: Iterable[str] = (),
+) -> ExtractionConfidence:
+    """Score rule-based ``matches`` found in ``text``.
+
+    ``known_surface_forms`` are lexicon entries and aliases; capitalized terms outside
+    them (``Kubernetes``, ``React``) suggest skills the lexicon cannot see.
+    """
+    text = text or ""
+    tokens = _TOKEN.findall(text)
+    if not tokens:
+        # Nothing an LLM could find either
+        return ExtractionConfidence(score=1.0, hit_density=0.0, section_coverage=0.0, unknown_terms=[])
+
+    matches = list(matches)
+    density = min(1.0, (len(matches) / len(tokens)) / TARGET_HITS_PER_TOKEN)
+
+    found_types = {section.type for section in segment_resume(text)}
+    coverage = sum(1 for section_type in CORE_SECTIONS if section_type in found_types) / len(CORE_SECTIONS)
+
+    known = {form.lower() for form in known_surface_forms}
+    # Words of matched multi-word skills ("Power BI") are accounted for too
+    known.update(word for m in matches for word in m.pattern.split())
+    unknown = sorted(set(_unknown_capitalized_terms(text, known)))
+    matched_skills = len({m.skill for m in matches})
+    unknown_ratio = len(unknown) / (len(unknown) + matched_skills) if unknown else 0.0
+
+    score = 0.4 * density + 0.2 * coverage + 0.4 * (1.0 - unknown_ratio)
+    return ExtractionConfidence(
+        score=round(score, 4),
+        hit_density=round(density, 4),
+        section_coverage=round(coverage, 4),
+        unknown_terms=unknown,
+    )
@@ -0,0 +1,272 @@
+"""
+Fuzzy Matcher - character-trigram inverted index for typo-tolerant skill matching
+Catches variants like "Pyhton", "Postgre SQL" or "scikit learn" without an LLM call
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_FUZZY_THRESHOLD = 0.8
+
+# Shorter terms only match on spacing/separator variants: one typo in "stats" is "state"
+MIN_FUZZY_LENGTH = 6
+
+# One substituted letter in a single word is as likely a real word ("locker", "postures") as a
+# typo, so single words must swap two adjacent letters ("pyhton") or be at least this similar
+SINGLE_WORD_MIN_SIMILARITY = 0.88
+
+# Trigram Dice score a pair needs before it is re-scored by edit distance
+CANDIDATE_DICE_FLOOR = 0.3
+CANDIDATES_PER_TERM = 5
+
+_NON_ALNUM = re.compile(r"[^a-z0-9+#]+")
+
+
+def compact(term: str) -> str:
+    """Lowercase with spaces and separators removed, so spacing variants compare equal"""
+    return _NON_ALNUM.sub("", (term or "").lower())
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f"#{term}#"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_similarity(a: str, b: str) -> float:
+    """1 - optimal-string-alignment distance / longer length (transpositions cost 1)"""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return 1.0 - prev[-1] / max(len(a), len(b))
+
+
+def is_adjacent_transposition(a: str, b: str) -> bool:
+    """Whether ``b`` is ``a`` with exactly two neighbouring characters swapped"""
+    if len(a) != len(b):
+        return False
+    diff = [i for i in range(len(a)) if a[i] != b[i]]
+    return len(diff) == 2 and diff[1] == diff[0] + 1 and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+
+
+def plausible_single_word_typo(term: str, form: str, similarity: float) -> bool:
+    """Whether a one-word fuzzy hit looks like a typo of ``form`` rather than another word.
+
+    Typos rarely change a word's first letter ("locker", "rocker"), and a lone substitution
+    or insertion in a short word usually spells something else ("docket", "dockery").
+    """
+    if term in FUZZY_STOPWORDS or not term or term[0] != form[0]:
+        return False
+    return is_adjacent_transposition(term, form) or similarity >= SINGLE_WORD_MIN_SIMILARITY
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """A candidate term resolved to a lexicon entry"""
+    term: str
+    form: str
+    skill: str
+    similarity: float
+
+
+class TrigramIndex:
+    """Inverted index from character trigrams to lexicon surface forms.
+
+    ``entries`` maps a surface form to the skill it denotes. Terms are scored against
+    every form sharing a trigram at once (NumPy when available), and the best few
+    candidates are re-scored with edit distance so transpositions like "pyhton" match.
+    """
+
+    def __init__(self, entries: Dict[str, str]):
+        self._forms: List[str] = []
+        self._skills: List[str] = []
+        self._gram_ids: Dict[str, int] = {}
+        postings: Dict[int, List[int]] = defaultdict(list)
+        sizes: List[int] = []
+
+        for form, skill in entries.items():
+            key = compact(form)
+            if not key:
+                continue
+            entry_id = len(self._forms)
+            self._forms.append(key)
+            self._skills.append(skill)
+            grams = trigrams(key)
+            sizes.append(len(grams))
+            for gram in grams:
+                gram_id = self._gram_ids.setdefault(gram, len(self._gram_ids))
+                postings[gram_id].append(entry_id)
+
+        self._exact: Dict[str, int] = {}
+        for entry_id, key in enumerate(self._forms):
+            self._exact.setdefault(key, entry_id)
+
+        self._postings: List[List[int]] = [postings[g] for g in range(len(self._gram_ids))]
+        if NUMPY_AVAILABLE:
+            self._posting_arrays = [np.asarray(p, dtype=np.int32) for p in self._postings]
+            self._sizes = np.asarray(sizes, dtype=np.float32)
+        else:
+            self._sizes_list = sizes
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    def _candidates(self, keys: Sequence[str]) -> List[List[Tuple[int, float]]]:
+        """Top trigram-Dice candidates (entry id, dice) for each compacted key"""
+        query_grams = [[self._gram_ids[g] for g in trigrams(k) if g in self._gram_ids] for k in keys]
+        query_sizes = [len(trigrams(k)) for k in keys]
+        if NUMPY_AVAILABLE:
+            return self._candidates_numpy(query_grams, query_sizes)
+        return self._candidates_python(query_grams, query_sizes)
+
+    def _candidates_numpy(self, query_grams, query_sizes) -> List[List[Tuple[int, float]]]:
+        n_entries = len(self._forms)
+        term_ids, entry_ids = [], []
+        for term_id, grams in enumerate(query_grams):
+            for gram_id in grams:
+                posting = self._posting_arrays[gram_id]
+                entry_ids.append(posting)
+                term_ids.append(np.full(len(posting), term_id, dtype=np.int64))
+        results: List[List[Tuple[int, float]]] = [[] for _ in query_grams]
+        if not entry_ids:
+            return results
+
+        # Count shared trigrams for every (term, entry) pair in one pass
+        codes = np.concatenate(term_ids) * n_entries + np.concatenate(entry_ids)
+        pairs, overlap = np.unique(codes, return_counts=True)
+        pair_terms = pairs // n_entries
+        pair_entries = pairs % n_entries
+        dice = 2.0 * overlap / (np.asarray(query_sizes, dtype=np.float32)[pair_terms] + self._sizes[pair_entries])
+
+        keep = dice >= CANDIDATE_DICE_FLOOR
+        pair_terms, pair_entries, dice = pair_terms[keep], pair_entries[keep], dice[keep]
+        order = np.lexsort((-dice, pair_terms))
+        for term_id, entry_id, score in zip(pair_terms[order], pair_entries[order], dice[order]):
+            bucket = results[term_id]
+            if len(bucket) < CANDIDATES_PER_TERM:
+                bucket.append((int(entry_id), float(score)))
+        return results
+
+    def _candidates_python(self, query_grams, query_sizes) -> List[List[Tuple[int, float]]]:
+        results: List[List[Tuple[int, float]]] = []
+        for grams, size in zip(query_grams, query_sizes):
+            overlap: Dict[int, int] = defaultdict(int)
+            for gram_id in grams:
+                for entry_id in self._postings[gram_id]:
+                    overlap[entry_id] += 1
+            scored = [
+                (entry_id, 2.0 * count / (size + self._sizes_list[entry_id]))
+                for entry_id, count in overlap.items()
+            ]
+            scored = [pair for pair in scored if pair[1] >= CANDIDATE_DICE_FLOOR]
+            scored.sort(key=lambda pair: -pair[1])
+            results.append(scored[:CANDIDATES_PER_TERM])
+        return results
+
+    def match_terms(self, terms: Iterable[str], threshold: float = DEFAULT_FUZZY_THRESHOLD) -> List[FuzzyMatch]:
+        """Resolve each term to its most similar lexicon entry, if it clears ``threshold``"""
+        terms = list(dict.fromkeys(terms))
+        keys = [compact(t) for t in terms]
+        matches: List[FuzzyMatch] = []
+        pending: List[int] = []
+        for i, key in enumerate(keys):
+            entry_id = self._exact.get(key)
+            if entry_id is not None:
+                matches.append(FuzzyMatch(terms[i], self._forms[entry_id], self._skills[entry_id], 1.0))
+            elif len(key) >= MIN_FUZZY_LENGTH:
+                pending.append(i)
+
+        candidates = self._candidates([keys[i] for i in pending])
+        for i, term_candidates in zip(pending, candidates):
+            best: Optional[Tuple[int, float]] = None
+            key = keys[i]
+            for entry_id, dice in term_candidates:
+                form = self._forms[entry_id]
+                # Length difference alone bounds edit similarity; skip hopeless pairs
+                if dice < threshold and 1.0 - abs(len(key) - len(form)) / max(len(key), len(form)) < threshold:
+                    continue
+                similarity = dice if dice >= threshold else max(dice, edit_similarity(key, form))
+                if best is None or similarity > best[1]:
+                    best = (entry_id, similarity)
+            if best is not None and " " not in terms[i].strip() and not plausible_single_word_typo(key, self._forms[best[0]], best[1]):
+                best = None
+            if best is not None and best[1] >= threshold:
+                entry_id, similarity = best
+                matches.append(FuzzyMatch(terms[i], self._forms[entry_id], self._skills[entry_id], round(similarity, 4)))
+        return matches
+
+    def match(self, term: str, threshold: float = DEFAULT_FUZZY_THRESHOLD) -> Optional[FuzzyMatch]:
+        found = self.match_terms([term], threshold)
+        return found[0] if found else None
+
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+# Punctuation between two words that a skill name never spans
+_BREAK = re.compile(r"[,;:()\[\]|\n•·]|\s-\s")
+
+# Frequent resume words that sit within edit distance of short skills
+FUZZY_STOPWORDS: Set[str] = {
+    "with", "from", "that", "this", "have", "were", "using", "used", "team", "teams", "data",
+    "work", "worked", "years", "year", "project", "projects", "experience", "skills", "tools",
+    # Ordinary words one edit away from a lexicon form
+    "locker", "lockers", "rocker", "rockers", "docket", "dockets", "dockers", "posture", "postures",
+}
+
+
+def candidate_terms(
+    text_norm: str,
+    covered: Iterable[Tuple[int, int]] = (),
+    max_words: int = 3,
+    min_length: int = 4,
+    max_length: int = 40,
+) -> List[str]:
+    """Word n-grams of normalized text that fuzzy matching should try.
+
+    Words inside ``covered`` spans (exact lexicon hits) are skipped, and n-grams never run
+    across sentence ends, list punctuation or line breaks.
+    """
+    spans = sorted(covered)
+    words: List[str] = []
+    span_idx = 0
+    previous_end, sentence_end = 0, False
+    for m in _WORD.finditer(text_norm):
+        # An empty word breaks n-grams, like a covered one
+        if words and (sentence_end or _BREAK.search(text_norm, previous_end, m.start())):
+            words.append("")
+        while span_idx < len(spans) and spans[span_idx][1] <= m.start():
+            span_idx += 1
+        inside = span_idx < len(spans) and spans[span_idx][0] <= m.start() < spans[span_idx][1]
+        # A covered word breaks n-grams so they never straddle an exact hit
+        words.append("" if inside else m.group(0).strip(".-"))
+        previous_end, sentence_end = m.end(), m.group(0).endswith(".")
+
+    terms: List[str] = []
+    for i in range(len(words)):
+        for n in range(1, max_words + 1):
+            gram = words[i:i + n]
+            if len(gram) < n or not all(gram):
+                break
+            if n == 1 and gram[0] in FUZZY_STOPWORDS:
+                continue
+            term = " ".join(gram)
+            if min_length <= len(compact(term)) <= max_length:
+                terms.append(term)
+    return terms
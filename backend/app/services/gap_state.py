@@ -0,0 +1,153 @@
+"""
+Gap State - each user's latest skill gaps, kept current as assessments come in
+/analyze stores the scores and gaps it computed; an assessment overwrites the assessed skills'
+scores and recomputes only the gaps those skills can change
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from .gaps import gaps_for_scores
+from .models import AssessmentResult, SkillGap
+from .skill_aliases import canonicalize_skill
+from .skill_graph import get_skill_graph
+from .skill_hierarchy import get_skill_hierarchy
+from .skill_ids import get_skill_registry
+
+
+@dataclass
+class UserGapState:
+    """Inputs and result of a user's last gap analysis"""
+    user_id: str
+    role: str
+    required_skills: List[str]
+    scores: Dict[str, float]  # canonical skill -> current score
+    graded: Set[str]  # skills whose score came from resume evidence or an assessment
+    gaps: Dict[str, SkillGap]  # required skill -> gap, in required_skills order
+    requirements: Optional[Dict[str, Dict]] = None  # job-description profile requirements
+    role_profile_id: Optional[str] = None
+    assessed_skills: Set[str] = field(default_factory=set)
+    version: int = 1
+
+
+def affected_skills(state: UserGapState, changed: Set[str]) -> List[str]:
+    """Required skills whose gap depends on a changed skill: the skill itself or a specialization of it"""
+    registry = get_skill_registry()
+    hierarchy = get_skill_hierarchy()
+    changed_mask = registry.mask(changed)
+    affected = []
+    for skill in state.required_skills:
+        skill_id = canonicalize_skill(skill)
+        if skill_id in changed:
+            affected.append(skill)
+            continue
+        registry_id = registry.lookup(skill_id)
+        if registry_id is not None and hierarchy.descendants_mask(registry_id) & changed_mask:
+            affected.append(skill)
+    return affected
+
+
+def apply_assessment(state: UserGapState, results: List[AssessmentResult]) -> List[str]:
+    """Take assessment scores as graded current scores and recompute the affected gaps.
+
+    A skill scored 0 counts as not held. Returns the required skills whose gaps were recomputed.
+    """
+    changed: Set[str] = set()
+    for result in results:
+        skill = canonicalize_skill(result.skill)
+        if not skill:
+            continue
+        if result.score > 0:
+            state.scores[skill] = result.score
+            state.graded.add(skill)
+        else:
+            state.scores.pop(skill, None)
+            state.graded.discard(skill)
+        changed.add(skill)
+    state.assessed_skills |= changed
+
+    affected = affected_skills(state, changed)
+    if affected:
+        recomputed = gaps_for_scores(
+            state.scores, state.graded, affected, role=state.role,
+            cooccurrence=get_skill_graph(), requirements=state.requirements,
+        )
+        state.gaps.update(zip(affected, recomputed))
+        state.version += 1
+    return affected
+
+
+class GapStateStore:
+    """Bounded in-memory map of user ID -> UserGapState (least recently used users evicted)"""
+
+    def __init__(self, max_users: int = 10_000):
+        self.max_users = max_users
+        self._users: "OrderedDict[str, UserGapState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[UserGapState]:
+        with self._lock:
+            state = self._users.get(user_id)
+            if state is not None:
+                self._users.move_to_end(user_id)
+            return state
+
+    def put(self, state: UserGapState) -> None:
+        with self._lock:
+            self._users[state.user_id] = state
+            self._users.move_to_end(state.user_id)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+
+    def assess(self, user_id: str, results: List[AssessmentResult]) -> Optional[Tuple[List[SkillGap], List[str]]]:
+        """(updated gaps, recomputed required skills) for a user; None when no analysis is stored"""
+        with self._lock:
+            state = self._users.get(user_id)
+            if state is None:
+                return None
+            self._users.move_to_end(user_id)
+            recomputed = apply_assessment(state, results)
+            return list(state.gaps.values()), recomputed
+
+    def forget(self, user_id: str) -> None:
+        with self._lock:
+            self._users.pop(user_id, None)
+
+
+def record_analysis(
+    user_id: str,
+    role: str,
+    required_skills: List[str],
+    scores: Dict[str, float],
+    graded: Set[str],
+    gaps: List[SkillGap],
+    requirements: Optional[Dict[str, Dict]] = None,
+    role_profile_id: Optional[str] = None,
+) -> UserGapState:
+    """Store a fresh /analyze result as the user's gap state, replacing any earlier one"""
+    state = UserGapState(
+        user_id=user_id,
+        role=role,
+        required_skills=list(required_skills),
+        scores=dict(scores),
+        graded=set(graded),
+        gaps=dict(zip(required_skills, gaps)),
+        requirements=requirements,
+        role_profile_id=role_profile_id,
+    )
+    get_gap_state_store().put(state)
+    return state
+
+
+# Global instance
+_gap_state_store_instance = None
+
+def get_gap_state_store() -> GapStateStore:
+    """Get or create the gap state store configured from the environment"""
+    global _gap_state_store_instance
+    if _gap_state_store_instance is None:
+        _gap_state_store_instance = GapStateStore(max_users=int(os.getenv("GAP_STATE_MAX_USERS", 10_000)))
+    return _gap_state_store_instance
@@ -1,314 +1,260 @@
-from typing import List, Dict
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Mapping, NamedTuple, Optional, Set
 from .models import SkillGap
+from .role_resolver import ROLE_ALIASES, RoleResolution, RoleResolver
+from .skill_aliases import canonical_skill_set, canonicalize_skill
+from .skill_evidence import LISTED_SCORE, SkillEvidence, proficiency_for_score
+from .skill_graph import SkillCooccurrence
+from .skill_hierarchy import get_skill_hierarchy
+from .skill_ids import get_skill_registry
+from .taxonomy import DEFAULT_ROLE, Taxonomy, get_taxonomy, on_taxonomy_change
 
 
-ROLE_TO_SKILLS: Dict[str, Dict[str, Dict]] = {
-    "data analyst": {
-        "statistics": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Essential for hypothesis testing, A/B testing, and statistical modeling in business contexts",
-            "mastery_points": 150
-        },
-        "python": {
-            "required_proficiency": "Intermediate", 
-            "required_score": 0.8,
-            "reasoning": "Core tool for data manipulation, analysis, and automation. Must handle pandas, numpy, and basic ML libraries",
-            "mastery_points": 200
-        },
-        "pandas": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.9,
-            "reasoning": "Primary library for data manipulation. Must master data cleaning, transformation, and aggregation",
-            "mastery_points": 180
-        },
-        "sql": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.9,
-            "reasoning": "Critical for data extraction from databases. Must write complex queries and optimize performance",
-            "mastery_points": 160
-        },
-        "data visualization": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Must create clear, actionable visualizations for stakeholders and decision makers",
-            "mastery_points": 120
-        },
-        "tableau": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Industry standard for interactive dashboards and business intelligence reporting",
-            "mastery_points": 140
-        }
-    },
-    "health data analyst": {
-        "statistics": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Critical for clinical research, epidemiological studies, and healthcare outcome analysis",
-            "mastery_points": 200
-        },
-        "python": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Essential for healthcare data processing, medical imaging analysis, and predictive modeling",
-            "mastery_points": 180
-        },
-        "sql": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Must query electronic health records, patient databases, and clinical trial data",
-            "mastery_points": 160
-        },
-        "data visualization": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Create visualizations for clinical outcomes, patient flow analysis, and healthcare metrics",
-            "mastery_points": 120
-        },
-        "epidemiology": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Understanding of disease patterns, risk factors, and population health trends",
-            "mastery_points": 100
-        },
-        "excel": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Still widely used in healthcare for reporting, compliance, and stakeholder communication",
-            "mastery_points": 80
-        }
-    },
-    "software engineer": {
-        "programming": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.9,
-            "reasoning": "Core competency for building applications, algorithms, and system design",
-            "mastery_points": 250
-        },
-        "algorithms": {
-            "required_proficiency": "Advanced", 
-            "required_score": 0.8,
-            "reasoning": "Essential for efficient code, system optimization, and technical interviews",
-            "mastery_points": 200
-        },
-        "system design": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Critical for building scalable, maintainable systems and architecture decisions",
-            "mastery_points": 220
-        },
-        "databases": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Necessary for data persistence, query optimization, and backend development",
-            "mastery_points": 150
-        },
-        "testing": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Ensures code quality, reliability, and maintainability in production systems",
-            "mastery_points": 120
-        },
-        "version control": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Essential for collaboration, code management, and deployment workflows",
-            "mastery_points": 100
-        }
-    },
-    "machine learning engineer": {
-        "python": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.9,
-            "reasoning": "Primary language for ML libraries (TensorFlow, PyTorch, scikit-learn)",
-            "mastery_points": 200
-        },
-        "statistics": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Foundation for understanding ML algorithms, model validation, and experimental design",
-            "mastery_points": 180
-        },
-        "machine learning": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.9,
-            "reasoning": "Core competency in supervised/unsupervised learning, deep learning, and model optimization",
-            "mastery_points": 250
-        },
-        "data preprocessing": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Critical for cleaning, transforming, and preparing data for ML models",
-            "mastery_points": 180
-        },
-        "model deployment": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Essential for putting ML models into production and maintaining them",
-            "mastery_points": 160
-        },
-        "cloud platforms": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Necessary for scalable ML infrastructure (AWS, GCP, Azure)",
-            "mastery_points": 140
-        }
-    },
-    "cybersecurity analyst": {
-        "network security": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Core competency for protecting network infrastructure and detecting threats",
-            "mastery_points": 200
-        },
-        "incident response": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Critical for rapid threat detection, containment, and recovery procedures",
-            "mastery_points": 180
-        },
-        "penetration testing": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Essential for vulnerability assessment and security testing",
-            "mastery_points": 160
-        },
-        "security tools": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Proficiency with SIEM, firewalls, IDS/IPS, and security monitoring tools",
-            "mastery_points": 140
-        },
-        "compliance": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Understanding of regulations (GDPR, HIPAA, SOX) and security frameworks",
-            "mastery_points": 120
-        },
-        "forensics": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Skills for digital evidence collection, analysis, and legal proceedings",
-            "mastery_points": 150
-        }
-    },
-    "biomedical engineer": {
-        "biology": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Deep understanding of biological systems for medical device design",
-            "mastery_points": 200
-        },
-        "medical devices": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.9,
-            "reasoning": "Core competency in designing, testing, and validating medical equipment",
-            "mastery_points": 250
-        },
-        "regulatory affairs": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Critical for FDA approval processes and medical device compliance",
-            "mastery_points": 180
-        },
-        "signal processing": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Essential for analyzing biological signals (ECG, EEG, imaging data)",
-            "mastery_points": 160
-        },
-        "materials science": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Understanding biocompatible materials for implants and devices",
-            "mastery_points": 140
-        },
-        "clinical trials": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Knowledge of study design, data collection, and statistical analysis",
-            "mastery_points": 120
-        }
-    },
-    "environmental engineer": {
-        "environmental science": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Deep understanding of ecosystems, pollution, and environmental processes",
-            "mastery_points": 200
-        },
-        "sustainability": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Core competency in green technologies, renewable energy, and carbon reduction",
-            "mastery_points": 180
-        },
-        "regulatory compliance": {
-            "required_proficiency": "Advanced",
-            "required_score": 0.8,
-            "reasoning": "Critical for EPA regulations, environmental permits, and compliance monitoring",
-            "mastery_points": 160
-        },
-        "data analysis": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.7,
-            "reasoning": "Essential for environmental monitoring, pollution modeling, and impact assessment",
-            "mastery_points": 140
-        },
-        "project management": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Necessary for managing environmental remediation and sustainability projects",
-            "mastery_points": 120
-        },
-        "gis": {
-            "required_proficiency": "Intermediate",
-            "required_score": 0.6,
-            "reasoning": "Geographic Information Systems for environmental mapping and analysis",
-            "mastery_points": 100
-        }
-    }
-}
+# Role -> required skill -> requirement, from data/taxonomy/role_skills.json.
+# Rebound on every taxonomy reload; functions below read the bundled _index instead.
+ROLE_TO_SKILLS: Dict[str, Dict[str, Dict]] = {}
+
+# Role -> bitmask of its required skills
+ROLE_SKILL_MASKS: Dict[str, int] = {}
+
+_registry = get_skill_registry()
+
+# Gap templates for requirement dicts passed in by callers (job-description profiles), by identity
+_REQUIREMENT_TEMPLATES_MAX = 256
+_requirement_templates: "OrderedDict[int, tuple]" = OrderedDict()
+
+
+class _GapTemplate(NamedTuple):
+    """Everything about one required skill's gap that does not depend on the user.
+
+    ``missing`` and ``known`` are complete SkillGap field values in field order (so serialized
+    gaps keep their key order); per-user outcomes override a copy of ``missing``.
+    """
+    skill_id: str
+    registry_id: Optional[int]  # None for skills outside the registry (caller-supplied, off-taxonomy)
+    required_score: float
+    missing: Mapping  # a skill the user lacks
+    known: Mapping  # a held skill with no graded score
+    partial_recommendation: str
+
+
+def _gap_template(skill: str, skill_info: Dict, role: str) -> _GapTemplate:
+    skill_id = canonicalize_skill(skill)
+    required_proficiency = skill_info.get("required_proficiency", "Intermediate")
+    # Validated once here; every gap built from it afterwards skips validation
+    missing = SkillGap(
+        skill=skill,
+        status="Missing",
+        proficiency_level="Beginner",
+        required_proficiency=required_proficiency,
+        current_score=0.2,  # Assume beginner level
+        required_score=skill_info.get("required_score", 0.7),
+        reasoning=skill_info.get("reasoning", f"Essential skill for {role} role"),
+        recommendation=f"Start with {skill.title()} basics on Coursera",
+        mastery_points=skill_info.get("mastery_points", 100),
+    ).model_dump()
+    known = dict(
+        missing, status="Known", proficiency_level="Intermediate", current_score=0.8,
+        recommendation=f"Advance your {skill.title()} skills",
+    )
+    return _GapTemplate(
+        skill_id=skill_id,
+        # Never interned here: caller-supplied skills would grow the process-wide registry forever
+        registry_id=_registry.lookup(skill_id),
+        required_score=missing["required_score"],
+        missing=MappingProxyType(missing),
+        known=MappingProxyType(known),
+        partial_recommendation=f"Build your {skill.title()} skills up to {required_proficiency} level",
+    )
+
+
+def _gap_templates(role_skills: Dict[str, Dict], role: str) -> Dict[str, _GapTemplate]:
+    return {skill: _gap_template(skill, info, role) for skill, info in role_skills.items()}
+
+
+def _templates_for_requirements(requirements: Dict[str, Dict], role: str) -> Dict[str, _GapTemplate]:
+    """Templates for a caller's requirement dict, cached while that same dict stays in use"""
+    entry = _requirement_templates.get(id(requirements))
+    if entry is None or entry[0] is not requirements:
+        # The dict itself is kept in the entry so its id cannot be reused while cached
+        entry = (requirements, _gap_templates(requirements, role))
+        _requirement_templates[id(requirements)] = entry
+        while len(_requirement_templates) > _REQUIREMENT_TEMPLATES_MAX:
+            _requirement_templates.popitem(last=False)
+    return entry[1]
+
+
+# Every constructed gap has all fields set, so they share one fields-set: pydantic only ever
+# adds field names to it, which are already present
+_ALL_FIELDS_SET = set(SkillGap.model_fields)
+_new_gap = object.__new__
+_set_attribute = object.__setattr__
+
+
+def _construct_gap(values: Dict) -> SkillGap:
+    """SkillGap from complete, already-valid field values without running validation.
+
+    Equivalent to ``SkillGap.model_construct(**values)`` (SkillGap has no extras or private
+    attributes), which on pydantic 2.9 is slower than validating because of its per-field
+    default handling.
+    """
+    gap = _new_gap(SkillGap)
+    _set_attribute(gap, "__dict__", values)
+    _set_attribute(gap, "__pydantic_fields_set__", _ALL_FIELDS_SET)
+    _set_attribute(gap, "__pydantic_extra__", None)
+    _set_attribute(gap, "__pydantic_private__", None)
+    return gap
+
+
+class _RoleIndex(NamedTuple):
+    role_to_skills: Dict[str, Dict[str, Dict]]
+    skill_masks: Dict[str, int]
+    resolver: RoleResolver
+    templates: Dict[str, Dict[str, _GapTemplate]]  # role -> required skill -> gap template
+
+
+def _build_role_index(taxonomy: Taxonomy) -> _RoleIndex:
+    """Role lookups for a (re)loaded taxonomy"""
+    role_to_skills = taxonomy.role_to_skills
+    return _RoleIndex(
+        role_to_skills,
+        {role: _registry.mask(skills, intern=True) for role, skills in role_to_skills.items()},
+        RoleResolver(role_to_skills, ROLE_ALIASES, default=DEFAULT_ROLE),
+        {role: _gap_templates(skills, role) for role, skills in role_to_skills.items()},
+    )
+
+
+def _install_role_index(index: _RoleIndex) -> None:
+    """Swap in role lookups with one assignment"""
+    global _index, ROLE_TO_SKILLS, ROLE_SKILL_MASKS
+    _index = index
+    ROLE_TO_SKILLS, ROLE_SKILL_MASKS = index.role_to_skills, index.skill_masks
+
+
+_install_role_index(_build_role_index(get_taxonomy()))
+on_taxonomy_change(_build_role_index, _install_role_index)
+
+
+def resolve_role(goal: str) -> RoleResolution:
+    """Map a free-text goal ("Sr. Data Analyst", "ML engineer") to a ROLE_TO_SKILLS key"""
+    return _index.resolver.resolve(goal or "")
 
 
 def map_role_to_required_skills(role: str) -> List[str]:
-    key = (role or "").strip().lower()
-    return list(ROLE_TO_SKILLS.get(key, ROLE_TO_SKILLS["data analyst"]).keys())
+    index = _index
+    return list(index.role_to_skills[index.resolver.resolve(role or "").role].keys())
+
+
+def missing_skills(role: str, known_skills: List[str]) -> List[str]:
+    """A role's required skills absent from ``known_skills``, as one mask difference"""
+    index = _index
+    missing = index.skill_masks[index.resolver.resolve(role or "").role] & ~_registry.mask(known_skills)
+    return _registry.names(missing)
+
 
+def current_skill_scores(known_skills: List[str], evidence: Optional[Dict[str, SkillEvidence]] = None) -> Dict[str, float]:
+    """Current score of every known skill: graded from resume evidence when given, else 0.8"""
+    known = canonical_skill_set(known_skills)
+    if evidence is None:
+        return {skill: 0.8 for skill in known}  # Assume good if mentioned
+    known.update(evidence)
+    # Claimed skills without resume evidence get the listed-only score
+    return {skill: evidence[skill].score if skill in evidence else LISTED_SCORE for skill in known}
 
-def detect_skill_gaps(known_skills: List[str], required_skills: List[str], role: str = "data analyst") -> List[SkillGap]:
-    known = set([s.lower() for s in known_skills])
+
+def detect_skill_gaps(
+    known_skills: List[str],
+    required_skills: List[str],
+    role: str = "data analyst",
+    evidence: Optional[Dict[str, SkillEvidence]] = None,
+    cooccurrence: Optional[SkillCooccurrence] = None,
+    requirements: Optional[Dict[str, Dict]] = None,
+) -> List[SkillGap]:
+    """Compare known skills with a role's requirements.
+
+    With ``evidence`` from ``scan_skill_evidence`` each skill gets a graded current score and
+    is "Partial" when below the role's required score; without it, any known skill counts as 0.8.
+    With ``cooccurrence`` counts, recommendations for missing skills cite the known skill
+    whose holders most often also have them. A required skill the user lacks but holds a
+    specialization of (pandas for python) earns DESCENDANT_CREDIT from the skill hierarchy, or
+    the specialization's own score when that is lower.
+    ``requirements`` (skill -> requirement, e.g. a job-description profile) replaces the role's own.
+    """
+    scores = current_skill_scores(known_skills, evidence)
+    graded = set(scores) if evidence is not None else set()
+    return gaps_for_scores(scores, graded, required_skills, role, cooccurrence, requirements)
+
+
+def gaps_for_scores(
+    scores: Dict[str, float],
+    graded: Set[str],
+    required_skills: List[str],
+    role: str = "data analyst",
+    cooccurrence: Optional[SkillCooccurrence] = None,
+    requirements: Optional[Dict[str, Dict]] = None,
+) -> List[SkillGap]:
+    """``detect_skill_gaps`` over precomputed current scores.
+
+    Skills in ``graded`` are judged by their score against the required score; other held
+    skills count as met. Recomputing a subset of ``required_skills`` yields the same gaps as
+    the full run for those skills.
+    """
     gaps: List[SkillGap] = []
-    role_key = role.lower().strip()
-    role_skills = ROLE_TO_SKILLS.get(role_key, ROLE_TO_SKILLS["data analyst"])
-    
-    for skill in required_skills:
-        skill_lower = skill.lower()
-        skill_info = role_skills.get(skill_lower, {})
-        
-        # Determine current proficiency level
-        if skill_lower in known:
-            current_score = 0.8  # Assume good if mentioned
-            proficiency_level = "Intermediate"
-            status = "Known"
+    index = _index
+    if requirements is not None:
+        templates = _templates_for_requirements(requirements, role)
+    else:
+        resolved = index.resolver.resolve(role or "").role
+        templates = index.templates[resolved]
+        requirements = index.role_to_skills[resolved]
+    hierarchy = get_skill_hierarchy()
+    # Off-role required skills get ad hoc templates
+    required = [
+        (skill, templates.get(skill) or _gap_template(skill, requirements.get(canonicalize_skill(skill), {}), role))
+        for skill in required_skills
+    ]
+    known_mask = _registry.mask(scores)
+
+    for skill, template in required:
+        skill_id = template.skill_id
+        if template.registry_id is None:
+            # Unregistered skills have no mask bit and no descendants; only the same skill counts
+            held, credited_by = skill_id in scores, 0
         else:
-            current_score = 0.2  # Assume beginner level
-            proficiency_level = "Beginner"
-            status = "Missing"
-        
-        gaps.append(SkillGap(
-            skill=skill,
-            status=status,
-            proficiency_level=proficiency_level,
-            required_proficiency=skill_info.get("required_proficiency", "Intermediate"),
-            current_score=current_score,
-            required_score=skill_info.get("required_score", 0.7),
-            reasoning=skill_info.get("reasoning", f"Essential skill for {role} role"),
-            recommendation=f"Start with {skill.title()} basics on Coursera" if status == "Missing" else f"Advance your {skill.title()} skills",
-            mastery_points=skill_info.get("mastery_points", 100)
-        ))
-    
-    return gaps
+            held = known_mask >> template.registry_id & 1
+            credited_by = 0 if held else hierarchy.held_descendants(template.registry_id, known_mask)
 
+        # Fixed outcomes come straight from the template; only graded or credited skills vary per user
+        if held and skill_id in graded:
+            current_score = scores[skill_id]
+            status = "Known" if current_score >= template.required_score else "Partial"
+            values = dict(
+                template.missing, status=status, proficiency_level=proficiency_for_score(current_score),
+                current_score=current_score,
+                recommendation=template.known["recommendation"] if status == "Known" else template.partial_recommendation,
+            )
+        elif held:
+            values = dict(template.known, current_score=scores[skill_id])
+        elif credited_by:
+            credit = hierarchy.credit(credited_by, scores)
+            status = "Known" if credit >= template.required_score else "Partial"
+            via = ", ".join(s.title() for s in _registry.names(credited_by))
+            values = dict(
+                template.missing, status=status, proficiency_level=proficiency_for_score(credit),
+                current_score=credit,
+                recommendation=(
+                    f"Build on your {via} experience to cover {skill.title()} more broadly"
+                    if status == "Partial" else template.known["recommendation"]
+                ),
+            )
+        else:
+            values = dict(template.missing)
+        if values["status"] != "Known" and cooccurrence is not None:
+            link = cooccurrence.strongest_link(skill_id, scores)
+            if link:
+                values["recommendation"] += f" ({link[1]:.0%} of analyzed resumes with {link[0].title()} also list it)"
 
+        gaps.append(_construct_gap(values))
+
+    return gaps
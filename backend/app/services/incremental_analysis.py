@@ -0,0 +1,168 @@
+"""
+Incremental Analysis - re-extract only the resume sections that changed since a user's last upload
+Keeps per-section content hashes and skills for each user and merges cached results for unchanged sections
+"""
+
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .resume_sections import EXTRACTION_PRIORITY, ResumeSection, segment_resume
+from .skill_aliases import canonical_skill_set
+from .skills import extract_skills_from_text, extract_skills_rule_based
+
+
+@dataclass
+class SectionRecord:
+    """Extraction result for one resume section, keyed by its content hash"""
+    content_hash: str
+    skills: List[str]
+
+
+@dataclass
+class IncrementalExtraction:
+    """Merged skills for a resume revision and which sections had to be recomputed"""
+    skills: List[str]
+    recomputed_sections: List[str] = field(default_factory=list)
+    reused_sections: List[str] = field(default_factory=list)
+
+
+def section_hash(section: ResumeSection) -> str:
+    normalized = re.sub(r"\s+", " ", f"{section.heading or ''}\n{section.text}".strip().lower())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def keyed_sections(sections: List[ResumeSection]) -> Dict[str, ResumeSection]:
+    """Stable keys like "experience:0" that survive sections being added or reordered elsewhere"""
+    counts: Dict[str, int] = {}
+    keyed: Dict[str, ResumeSection] = {}
+    for section in sections:
+        n = counts.get(section.type, 0)
+        counts[section.type] = n + 1
+        keyed[f"{section.type}:{n}"] = section
+    return keyed
+
+
+class ResumeRevisionStore:
+    """Bounded in-memory map of user ID -> section key -> SectionRecord (least recently used users evicted)"""
+
+    def __init__(self, max_users: int = 10_000):
+        self.max_users = max_users
+        self._users: "OrderedDict[str, Dict[str, SectionRecord]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Dict[str, SectionRecord]:
+        with self._lock:
+            records = self._users.get(user_id)
+            if records is None:
+                return {}
+            self._users.move_to_end(user_id)
+            return dict(records)
+
+    def put(self, user_id: str, records: Dict[str, SectionRecord]) -> None:
+        with self._lock:
+            self._users[user_id] = records
+            self._users.move_to_end(user_id)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+
+    def forget(self, user_id: str) -> None:
+        with self._lock:
+            self._users.pop(user_id, None)
+
+
+def section_text(section: ResumeSection) -> str:
+    return f"{section.heading}\n{section.text}" if section.heading else section.text
+
+
+def attribute_skills(skills: List[str], sections: Dict[str, ResumeSection]) -> Dict[str, List[str]]:
+    """Split one extraction over several sections back into per-section skills.
+
+    A skill goes to every section where the lexicon finds it; skills the lexicon cannot place
+    (LLM-only finds) go to the most skill-dense section so they are stored exactly once.
+    """
+    rank = {section_type: i for i, section_type in enumerate(EXTRACTION_PRIORITY)}
+    keys = list(sections)
+    found = {key: set(extract_skills_rule_based(section_text(sections[key]), [], fuzzy_threshold=0)) for key in keys}
+    attributed: Dict[str, List[str]] = {key: [] for key in keys}
+    primary = min(keys, key=lambda k: rank.get(sections[k].type, len(rank)))
+    for skill in skills:
+        holders = [key for key in keys if skill in found[key]] or [primary]
+        for key in holders:
+            attributed[key].append(skill)
+    return attributed
+
+
+def extract_skills_incrementally(
+    user_id: str,
+    text: str,
+    user_known_skills: List[str],
+    fuzzy_threshold: Optional[float] = None,
+    store: Optional[ResumeRevisionStore] = None,
+) -> IncrementalExtraction:
+    """Extract skills section by section, reusing the stored result of every unchanged section.
+
+    All changed sections go to the extractor together in one call, so a first upload costs
+    the same single extraction as a full analysis.
+    """
+    store = store or get_revision_store()
+    previous = store.get(user_id)
+    records: Dict[str, SectionRecord] = {}
+    changed: Dict[str, ResumeSection] = {}
+    result = IncrementalExtraction(skills=[])
+    skills = canonical_skill_set(user_known_skills)
+
+    for key, section in keyed_sections(segment_resume(text)).items():
+        if not section.text:
+            continue
+        cached = previous.get(key)
+        if cached is not None and cached.content_hash == section_hash(section):
+            records[key] = cached
+            result.reused_sections.append(key)
+        else:
+            changed[key] = section
+
+    if changed:
+        combined = "\n\n".join(section_text(section) for section in changed.values())
+        extracted = sorted(canonical_skill_set(extract_skills_from_text(combined, [], fuzzy_threshold=fuzzy_threshold)))
+        for key, section_skills in attribute_skills(extracted, changed).items():
+            records[key] = SectionRecord(section_hash(changed[key]), sorted(section_skills))
+            result.recomputed_sections.append(key)
+
+    for record in records.values():
+        skills.update(record.skills)
+    store.put(user_id, records)
+    result.skills = sorted(skills)
+    return result
+
+
+# Global instance
+_revision_store_instance = None
+
+def get_revision_store() -> ResumeRevisionStore:
+    """Get or create the per-user resume revision store"""
+    global _revision_store_instance
+    if _revision_store_instance is None:
+        _revision_store_instance = ResumeRevisionStore(max_users=int(os.getenv("INCREMENTAL_ANALYSIS_MAX_USERS", 10_000)))
+    return _revision_store_instance
+
+
+def extract_request_skills(
+    text: str,
+    user_known_skills: List[str],
+    fuzzy_threshold: Optional[float] = None,
+    user_id: Optional[str] = None,
+) -> Tuple[List[str], Optional[List[str]]]:
+    """Skills for one analysis request and the sections recomputed for it.
+
+    Requests with a ``user_id`` re-extract only the sections that changed since that user's
+    previous resume; others run a full extraction (recomputed sections are then None).
+    """
+    if user_id:
+        incremental = extract_skills_incrementally(user_id, text, user_known_skills, fuzzy_threshold=fuzzy_threshold)
+        return incremental.skills, incremental.recomputed_sections
+    return extract_skills_from_text(text, user_known_skills, fuzzy_threshold=fuzzy_threshold), None
@@ -0,0 +1,186 @@
+"""
+Job Profiles - role profiles extracted from job-description text
+A profile lists the skills a job description asks for with the level its wording implies, and is
+registered under a hash of the normalized text so every analysis against the same posting
+reuses one extraction
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+from .extraction_cache import make_cache_key
+from .skill_evidence import FULL_CREDIT_YEARS, SkillEvidence, proficiency_for_score, scan_skill_evidence
+from .skills import extract_skills_rule_based, extract_skills_with_nemotron
+from .taxonomy import get_taxonomy
+
+# Bump when extraction changes so stale profile IDs stop matching
+PROFILE_VERSION = "1"
+
+# Required score of a skill the posting names without any level cue
+BASE_REQUIRED_SCORE = 0.6
+MIN_REQUIRED_SCORE = 0.3
+MAX_REQUIRED_SCORE = 0.95
+# Mastery points for a skill no taxonomy role lists
+DEFAULT_MASTERY_POINTS = 100
+
+
+@dataclass(frozen=True)
+class JobProfile:
+    """Skill requirements of one job description, shaped like a ROLE_TO_SKILLS entry"""
+    profile_id: str
+    title: str
+    skills: Dict[str, Dict]
+    source: str  # "lexicon" or "lexicon+nemotron"
+
+
+def profile_id_for(text: str) -> str:
+    return make_cache_key(text, None, "job_profile", PROFILE_VERSION)[:16]
+
+
+def required_score(evidence: Optional[SkillEvidence]) -> float:
+    """Level a posting asks for: "5+ years" and "expert in" raise it, "familiarity with" lowers it"""
+    score = BASE_REQUIRED_SCORE
+    if evidence is not None:
+        score += 0.2 * min(evidence.years / FULL_CREDIT_YEARS, 1.0)
+        score += 0.15 * evidence.seniority
+    return round(min(max(score, MIN_REQUIRED_SCORE), MAX_REQUIRED_SCORE), 2)
+
+
+def _taxonomy_mastery_points() -> Dict[str, float]:
+    """Median mastery points of each skill across the taxonomy's roles"""
+    points: Dict[str, List[float]] = {}
+    for skills in get_taxonomy().role_to_skills.values():
+        for skill, info in skills.items():
+            points.setdefault(skill, []).append(info.get("mastery_points", DEFAULT_MASTERY_POINTS))
+    return {skill: median(values) for skill, values in points.items()}
+
+
+def _title(text: str) -> str:
+    first_line = next((line.strip() for line in text.splitlines() if line.strip()), "")
+    return first_line[:80] or "Job description"
+
+
+def extract_job_profile(text: str, title: Optional[str] = None, enrich: bool = False) -> JobProfile:
+    """Build a profile from a job description with the lexicon matcher and level cues.
+
+    With ``enrich``, skills Nemotron finds beyond the lexicon are added at the base level.
+    Raises ValueError when no skills are found.
+    """
+    evidence = scan_skill_evidence(text)
+    found = set(extract_skills_rule_based(text, [])) | set(evidence)
+    source = "lexicon"
+    if enrich:
+        ai_skills = extract_skills_with_nemotron(text, sorted(found))
+        if ai_skills:
+            found.update(ai_skills)
+            source = "lexicon+nemotron"
+    if not found:
+        raise ValueError("No skills found in the job description")
+
+    mastery = _taxonomy_mastery_points()
+    skills: Dict[str, Dict] = {}
+    for skill in sorted(found):
+        skill_evidence = evidence.get(skill)
+        score = required_score(skill_evidence)
+        cues = []
+        if skill_evidence is not None and skill_evidence.years:
+            cues.append(f"{skill_evidence.years:g}+ years")
+        reasoning = "Named in the job description" + (f" ({', '.join(cues)})" if cues else "")
+        skills[skill] = {
+            "required_score": score,
+            "required_proficiency": proficiency_for_score(score),
+            "mastery_points": int(round(mastery.get(skill, DEFAULT_MASTERY_POINTS) * score / BASE_REQUIRED_SCORE)),
+            "reasoning": reasoning,
+        }
+    return JobProfile(profile_id_for(text), title or _title(text), skills, source)
+
+
+class JobProfileStore:
+    """Bounded in-memory map of profile ID -> JobProfile (least recently used profiles evicted).
+
+    Concurrent registrations of the same text wait on one extraction instead of repeating it;
+    the per-text lock lives only while some registration of that text holds or awaits it.
+    """
+
+    def __init__(self, max_profiles: int = 1024):
+        self.max_profiles = max_profiles
+        self.stats = {"extractions": 0, "hits": 0}
+        self._profiles: "OrderedDict[str, JobProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List] = {}  # profile ID -> [lock, registrations holding or awaiting it]
+
+    def get(self, profile_id: str) -> Optional[JobProfile]:
+        with self._lock:
+            profile = self._profiles.get(profile_id)
+            if profile is not None:
+                self._profiles.move_to_end(profile_id)
+            return profile
+
+    def register(self, text: str, title: Optional[str] = None, enrich: bool = False) -> Tuple[JobProfile, bool]:
+        """(profile, whether it was already registered) for a job description.
+
+        A ``title`` given for already-registered text renames the stored profile.
+        """
+        profile_id = profile_id_for(text)
+        with self._lock:
+            pending = self._pending.get(profile_id)
+            if pending is None:
+                pending = self._pending[profile_id] = [threading.Lock(), 0]
+            pending[1] += 1
+        try:
+            with pending[0]:
+                cached = self.get(profile_id)
+                # An enrichment request upgrades a lexicon-only profile under the same ID
+                if cached is not None and (not enrich or cached.source != "lexicon"):
+                    with self._lock:
+                        self.stats["hits"] += 1
+                        if title and title != cached.title:
+                            cached = self._profiles[profile_id] = replace(cached, title=title)
+                    return cached, True
+                profile = extract_job_profile(text, title=title, enrich=enrich)
+                with self._lock:
+                    self.stats["extractions"] += 1
+                    self._profiles[profile_id] = profile
+                    self._profiles.move_to_end(profile_id)
+                    while len(self._profiles) > self.max_profiles:
+                        self._profiles.popitem(last=False)
+                return profile, False
+        finally:
+            with self._lock:
+                pending[1] -= 1
+                if not pending[1]:
+                    del self._pending[profile_id]
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+def target_profile(role_profile_id: Optional[str], job_description: Optional[str]) -> Optional[JobProfile]:
+    """Profile an analysis request targets, registering inline job descriptions.
+
+    Returns None when the request targets a taxonomy role; raises KeyError for an unknown ID.
+    """
+    store = get_job_profile_store()
+    if role_profile_id:
+        profile = store.get(role_profile_id)
+        if profile is None:
+            raise KeyError(f"Unknown role profile: {role_profile_id}")
+        return profile
+    if (job_description or "").strip():
+        return store.register(job_description)[0]
+    return None
+
+
+# Global instance
+_job_profile_store_instance = None
+
+def get_job_profile_store() -> JobProfileStore:
+    """Get or create the job profile store configured from the environment"""
+    global _job_profile_store_instance
+    if _job_profile_store_instance is None:
+        _job_profile_store_instance = JobProfileStore(max_profiles=int(os.getenv("JOB_PROFILE_MAX_ENTRIES", 1024)))
+    return _job_profile_store_instance
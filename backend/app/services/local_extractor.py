@@ -0,0 +1,263 @@
+"""
+Local Extractor - in-process CPU skill tagger as an offline alternative to the Nemotron endpoint
+Logistic span classifier over hashed word/char/context features, trained on LLM-labelled resumes
+"""
+
+import os
+import re
+import zlib
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .fuzzy_matcher import compact
+from .resume_sections import segment_resume
+from .skill_aliases import SKILL_ALIASES, canonical_skill_set, canonicalize_skill, skill_key
+
+MODEL_VERSION = 1
+DEFAULT_DIM = 1 << 18
+DEFAULT_THRESHOLD = 0.5
+MAX_SPAN_TOKENS = 3
+
+_TOKEN = re.compile(r"[A-Za-z0-9][A-Za-z0-9+#.\-/]*[A-Za-z0-9+#]|[A-Za-z0-9]\+*#?")
+# Punctuation between two tokens that a skill name never spans
+_BREAK = re.compile(r"[,;:()\[\]|\n•·]|\s-\s|\.\s")
+
+SPAN_STOPWORDS: Set[str] = {
+    "a", "an", "the", "and", "or", "of", "in", "on", "at", "for", "with", "to", "from", "by", "as",
+    "is", "are", "was", "were", "be", "i", "we", "my", "our", "using", "used", "use", "via", "into",
+    "over", "across", "per", "years", "year", "experience", "team", "teams", "skills", "work",
+    "worked", "built", "developed", "led", "including", "such", "like", "etc", "also", "both",
+}
+
+_KNOWN_FORMS: Set[str] = {
+    skill_key(name) for canonical, aliases in SKILL_ALIASES.items() for name in [canonical, *aliases]
+}
+
+
+@lru_cache(maxsize=1 << 16)
+def _hash(feature: str, dim: int) -> int:
+    return zlib.crc32(feature.encode("utf-8")) % dim
+
+
+def _shape(text: str) -> str:
+    shape = re.sub(r"[A-Z]+", "X", text)
+    shape = re.sub(r"[a-z]+", "x", shape)
+    return re.sub(r"[0-9]+", "d", shape)
+
+
+@lru_cache(maxsize=1 << 15)
+def _span_features(span: str, dim: int) -> Tuple[int, ...]:
+    """Features of the span text itself; cached because the same spans recur across resumes"""
+    lowered = span.lower()
+    words = lowered.split()
+    padded = f"^{compact(lowered)}$"
+    features = [
+        f"w={lowered}", f"n={len(words)}", f"shape={_shape(span)}",
+        f"pre={padded[:4]}", f"suf={padded[-4:]}",
+        f"lex={skill_key(span) in _KNOWN_FORMS}",
+    ]
+    features += [f"wi={w}" for w in words]
+    features += [f"c3={padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    if span.isupper() and len(span) > 1:
+        features.append("caps=all")
+    elif any(c.isupper() for c in span[1:]):
+        features.append("caps=mixed")
+    elif span[:1].isupper():
+        features.append("caps=title")
+    return tuple(_hash(f, dim) for f in features)
+
+
+@dataclass
+class SpanCandidate:
+    start: int
+    end: int
+    text: str
+    features: Tuple[int, ...]
+
+
+def candidate_spans(text: str, dim: int = DEFAULT_DIM) -> List[SpanCandidate]:
+    """Every 1-3 token span that could name a skill, with its hashed features"""
+    candidates: List[SpanCandidate] = []
+    for section in segment_resume(text or ""):
+        body = section.text
+        tokens = [(m.start(), m.end(), m.group(0)) for m in _TOKEN.finditer(body)]
+        breaks = [bool(_BREAK.search(body[tokens[i][1]:tokens[i + 1][0]])) for i in range(len(tokens) - 1)]
+        section_feature = _hash(f"sec={section.type}", dim)
+        for i in range(len(tokens)):
+            for n in range(1, MAX_SPAN_TOKENS + 1):
+                j = i + n - 1
+                if j >= len(tokens) or (n > 1 and breaks[j - 1]):
+                    break
+                first, last = tokens[i][2].lower(), tokens[j][2].lower()
+                if first in SPAN_STOPWORDS or last in SPAN_STOPWORDS or tokens[j][2].isdigit():
+                    continue
+                start, end = tokens[i][0], tokens[j][1]
+                span = body[start:end]
+                left = tokens[i - 1][2].lower() if i > 0 and not breaks[i - 1] else "<b>"
+                right = tokens[j + 1][2].lower() if j + 1 < len(tokens) and not breaks[j] else "<b>"
+                in_list = (i == 0 or breaks[i - 1]) and (j + 1 == len(tokens) or breaks[j])
+                context = (
+                    section_feature,
+                    _hash(f"L={left}", dim),
+                    _hash(f"R={right}", dim),
+                    _hash(f"item={in_list}", dim),
+                    _hash(f"item={in_list}|n={n}", dim),
+                )
+                candidates.append(SpanCandidate(start, end, span, _span_features(span, dim) + context))
+    return candidates
+
+
+def span_labels(candidates: Sequence[SpanCandidate], skills: Iterable[str]) -> List[int]:
+    """1 for spans naming one of the labelled skills, else 0"""
+    wanted = canonical_skill_set(skills)
+    wanted_compact = {compact(s) for s in wanted}
+    return [
+        int(canonicalize_skill(c.text) in wanted or compact(c.text) in wanted_compact)
+        for c in candidates
+    ]
+
+
+class LocalSkillModel:
+    """Hashed-feature logistic regression that tags resume spans as skills"""
+
+    def __init__(self, weights, bias: float = 0.0, threshold: float = DEFAULT_THRESHOLD):
+        self.weights = weights
+        self.bias = bias
+        self.threshold = threshold
+
+    @property
+    def dim(self) -> int:
+        return len(self.weights)
+
+    def score_spans(self, candidates: Sequence[SpanCandidate]):
+        """Skill probability for every candidate, scored in one vectorized pass"""
+        if not candidates:
+            return np.zeros(0, dtype=np.float32)
+        lengths = np.fromiter((len(c.features) for c in candidates), dtype=np.int64, count=len(candidates))
+        indices = np.fromiter(
+            (f for c in candidates for f in c.features), dtype=np.int64, count=int(lengths.sum())
+        )
+        owners = np.repeat(np.arange(len(candidates)), lengths)
+        logits = np.bincount(owners, weights=self.weights[indices], minlength=len(candidates)) + self.bias
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    def extract(self, text: str, user_known_skills: Optional[List[str]] = None) -> List[str]:
+        candidates = candidate_spans(text, self.dim)
+        probabilities = self.score_spans(candidates)
+        taken: List[Tuple[int, int]] = []
+        found: Set[str] = set()
+        # Highest-probability spans first; overlapping weaker spans are dropped
+        for i in np.argsort(-probabilities, kind="stable"):
+            if probabilities[i] < self.threshold:
+                break
+            c = candidates[i]
+            if any(c.start < end and start < c.end for start, end in taken):
+                continue
+            taken.append((c.start, c.end))
+            found.add(canonicalize_skill(c.text))
+        found |= canonical_skill_set(user_known_skills or [])
+        return sorted(found)
+
+    @classmethod
+    def train(
+        cls,
+        examples: Iterable[Tuple[str, List[str]]],
+        dim: int = DEFAULT_DIM,
+        epochs: int = 5,
+        learning_rate: float = 0.2,
+        l2: float = 1e-6,
+        positive_weight: float = 3.0,
+        seed: int = 13,
+    ) -> "LocalSkillModel":
+        """Fit on (resume text, LLM-labelled skills) pairs with AdaGrad SGD"""
+        rows: List[Tuple[int, ...]] = []
+        labels: List[int] = []
+        for text, skills in examples:
+            candidates = candidate_spans(text, dim)
+            rows.extend(c.features for c in candidates)
+            labels.extend(span_labels(candidates, skills))
+
+        weights = np.zeros(dim, dtype=np.float64)
+        grad_sq = np.full(dim, 1e-8, dtype=np.float64)
+        bias, bias_sq = 0.0, 1e-8
+        rng = np.random.default_rng(seed)
+        row_arrays = [np.asarray(r, dtype=np.int64) for r in rows]
+        for _ in range(epochs):
+            for k in rng.permutation(len(rows)):
+                idx = row_arrays[k]
+                z = weights[idx].sum() + bias
+                p = 1.0 / (1.0 + math.exp(-max(min(z, 30.0), -30.0)))
+                g = (p - labels[k]) * (positive_weight if labels[k] else 1.0)
+                grad = g + l2 * weights[idx]
+                np.add.at(grad_sq, idx, grad * grad)
+                np.add.at(weights, idx, -learning_rate * grad / np.sqrt(grad_sq[idx]))
+                bias_sq += g * g
+                bias -= learning_rate * g / math.sqrt(bias_sq)
+        return cls(weights.astype(np.float32), float(bias))
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(
+            path, weights=self.weights, bias=np.float32(self.bias),
+            threshold=np.float32(self.threshold), version=np.int32(MODEL_VERSION),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LocalSkillModel":
+        with np.load(path) as data:
+            if int(data["version"]) != MODEL_VERSION:
+                raise ValueError(f"Unsupported local skill model version {int(data['version'])}")
+            return cls(data["weights"].astype(np.float32), float(data["bias"]), float(data["threshold"]))
+
+
+# Global instances
+_local_model: Optional[LocalSkillModel] = None
+_local_model_error: Optional[str] = None
+_local_model_lock = threading.Lock()
+_local_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_local_model() -> Optional[LocalSkillModel]:
+    """Load the model at LOCAL_SKILL_MODEL_PATH once; None when numpy or the model file is missing"""
+    global _local_model, _local_model_error
+    if _local_model is not None or _local_model_error is not None:
+        return _local_model
+    with _local_model_lock:
+        if _local_model is None and _local_model_error is None:
+            path = os.getenv("LOCAL_SKILL_MODEL_PATH", "")
+            if not NUMPY_AVAILABLE:
+                _local_model_error = "numpy is not installed"
+            elif not path or not os.path.exists(path):
+                _local_model_error = f"model file not found: {path or '(LOCAL_SKILL_MODEL_PATH unset)'}"
+            else:
+                try:
+                    _local_model = LocalSkillModel.load(path)
+                    threshold = os.getenv("LOCAL_SKILL_MODEL_THRESHOLD")
+                    if threshold:
+                        _local_model.threshold = float(threshold)
+                    print(f"✅ Local skill model loaded from {path}")
+                except Exception as e:
+                    _local_model_error = str(e)
+            if _local_model_error:
+                print(f"⚠️ Local skill model unavailable: {_local_model_error}")
+    return _local_model
+
+
+def get_local_executor() -> ThreadPoolExecutor:
+    """Thread pool that runs local extractions off the event loop (LOCAL_SKILL_MODEL_THREADS)"""
+    global _local_executor
+    if _local_executor is None:
+        with _local_model_lock:
+            if _local_executor is None:
+                workers = int(os.getenv("LOCAL_SKILL_MODEL_THREADS", min(4, os.cpu_count() or 1)))
+                _local_executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="local-skill-model")
+    return _local_executor
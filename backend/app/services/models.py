@@ -8,6 +8,10 @@ class AnalyzeRequest(BaseModel):
     known_skills: Optional[List[str]] = []
     weekly_time_hours: Optional[int] = 5
     resume_text: Optional[str] = ""
+    fuzzy_threshold: Optional[float] = None  # 0.0 to 1.0 typo tolerance; None = server default, 0 = off
+    user_id: Optional[str] = None  # enables incremental re-analysis against this user's previous resume
+    role_profile_id: Optional[str] = None  # target a registered job-description profile instead of the goal
+    job_description: Optional[str] = None  # register (or reuse) a profile from this text and target it
 
 
 class SkillGap(BaseModel):
@@ -26,6 +30,115 @@ class AnalyzeResponse(BaseModel):
     extracted_skills: List[str]
     required_skills: List[str]
     skill_gaps: List[SkillGap]
+    recomputed_sections: Optional[List[str]] = None  # section keys re-extracted in incremental mode
+    resolved_role: Optional[str] = None  # role profile the free-text goal was matched to
+    role_confidence: Optional[float] = None  # 1.0 exact title or alias, 0.0 default-role fallback
+    role_profile_id: Optional[str] = None  # set when a job-description profile was targeted
+
+
+class RoleProfileRequest(BaseModel):
+    job_description: str
+    title: Optional[str] = None  # defaults to the description's first line
+    enrich: bool = False  # add skills Nemotron finds beyond the lexicon
+
+
+class RoleProfileSkill(BaseModel):
+    skill: str
+    required_score: float
+    required_proficiency: str
+    mastery_points: int
+    reasoning: str
+
+
+class RoleProfileResponse(BaseModel):
+    profile_id: str  # content hash of the description; pass as AnalyzeRequest.role_profile_id
+    title: str
+    source: str  # lexicon, or lexicon+nemotron when enriched
+    skills: List[RoleProfileSkill]
+    cached: bool = False  # the same description was already registered
+
+
+class BatchAnalyzeRequest(BaseModel):
+    items: List[Dict[str, Any]]  # each validated as an AnalyzeRequest, errors reported per item
+    max_concurrency: Optional[int] = None  # concurrent LLM extractions
+
+
+class BatchAnalyzeItemResult(BaseModel):
+    index: int
+    result: Optional[AnalyzeResponse] = None
+    error: Optional[str] = None
+
+
+class BatchAnalyzeResponse(BaseModel):
+    results: List[BatchAnalyzeItemResult]
+
+
+class RoleFitRequest(BaseModel):
+    known_skills: Optional[List[str]] = []
+    resume_text: Optional[str] = ""
+    fuzzy_threshold: Optional[float] = None
+    limit: Optional[int] = None  # top roles to return; None = all
+
+
+class RoleFit(BaseModel):
+    role: str
+    fit_score: float  # 0.0 to 1.0, mastery-weighted share of requirements met
+    mastery_points_remaining: float
+    skills_below_requirement: List[str]
+
+
+class RoleFitResponse(BaseModel):
+    extracted_skills: List[str]
+    fits: List[RoleFit]
+
+
+class WhatIfRequest(BaseModel):
+    known_skills: Optional[List[str]] = []
+    resume_text: Optional[str] = ""
+    fuzzy_threshold: Optional[float] = None
+    target_roles: Optional[List[str]] = []  # free-text goals; empty = every role
+    limit: int = 5
+    include_pairs: bool = True
+
+
+class SkillAdditionResult(BaseModel):
+    skills: List[str]
+    gap_reduction: float  # share of the target roles' requirements closed, averaged over the targets
+    fit_gain: float
+    mastery_points: float
+    gain_per_mastery_point: float
+    roles_improved: List[str]
+
+
+class WhatIfResponse(BaseModel):
+    extracted_skills: List[str]
+    target_roles: List[str]
+    singles: List[SkillAdditionResult]
+    pairs: List[SkillAdditionResult]
+
+
+class CareerPathRequest(BaseModel):
+    target_role: str
+    current_role: Optional[str] = None  # plan from this role's requirements instead of the user's skills
+    known_skills: Optional[List[str]] = []
+    resume_text: Optional[str] = ""
+    fuzzy_threshold: Optional[float] = None
+
+
+class CareerHopResult(BaseModel):
+    from_role: Optional[str] = None  # None when starting from the user's current skills
+    to_role: str
+    mastery_points: float
+    skills_to_learn: List[str]
+
+
+class CareerPathResponse(BaseModel):
+    start: Optional[str] = None
+    target: str
+    total_mastery_points: float
+    direct_mastery_points: float
+    hops: List[CareerHopResult]
+    extracted_skills: Optional[List[str]] = None
 
 
 class AssessmentQuestion(BaseModel):
@@ -43,6 +156,7 @@ class AssessmentGenerateRequest(BaseModel):
 
 class AssessmentSubmitRequest(BaseModel):
     responses: List[Dict[str, Any]]  # each: {id, selected_index}
+    user_id: Optional[str] = None  # update this user's stored gaps with the assessed scores
 
 
 class AssessmentResult(BaseModel):
@@ -56,6 +170,18 @@ class AssessmentResult(BaseModel):
 class AssessmentResultResponse(BaseModel):
     results: List[AssessmentResult]
     updated_known_skills: List[str]
+    skill_gaps: Optional[List[SkillGap]] = None  # the user's gaps after the update, with user_id
+    recomputed_skills: Optional[List[str]] = None  # required skills whose gaps the assessment changed
+
+
+class UserGapsResponse(BaseModel):
+    user_id: str
+    role: str
+    role_profile_id: Optional[str] = None
+    required_skills: List[str]
+    skill_gaps: List[SkillGap]
+    assessed_skills: List[str]
+    version: int  # increases whenever an assessment changes the gaps
 
 
 class ResourceItem(BaseModel):
@@ -75,6 +201,8 @@ class ResourcesRequest(BaseModel):
     weekly_time_hours: Optional[int] = 5
     free_preferred: Optional[bool] = True
     provider_preferences: Optional[List[str]] = []
+    # Courses returned per skill, best first
+    per_skill: Optional[int] = 1
 
 
 class ResourcesResponse(BaseModel):
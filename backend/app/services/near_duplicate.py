@@ -0,0 +1,141 @@
+"""
+Near Duplicate - SimHash fingerprint index over analyzed resume texts
+Templated resumes (bootcamp cohorts, agency-formatted CVs) reuse a stored LLM extraction instead of a new call
+"""
+
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+FINGERPRINT_BITS = 64
+DEFAULT_MAX_DISTANCE = 6
+SHINGLE_SIZE = 2
+
+# Below this many words a fingerprint is too unstable to call two texts near-identical
+MIN_WORDS = 20
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def _shingles(text: str) -> List[str]:
+    words = _WORD.findall((text or "").lower())
+    if len(words) < MIN_WORDS:
+        return []
+    return [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash over word bigrams; None when the text is too short to fingerprint"""
+    shingles = _shingles(text)
+    if not shingles:
+        return None
+    hashes = [_shingle_hash(s) for s in shingles]
+    if NUMPY_AVAILABLE:
+        values = np.asarray(hashes, dtype=np.uint64)
+        bits = (values[:, None] >> np.arange(FINGERPRINT_BITS, dtype=np.uint64)) & np.uint64(1)
+        votes = 2 * bits.sum(axis=0, dtype=np.int64) - len(hashes)
+        return sum(1 << i for i in np.flatnonzero(votes > 0).tolist())
+    votes = [0] * FINGERPRINT_BITS
+    for value in hashes:
+        for i in range(FINGERPRINT_BITS):
+            votes[i] += 1 if value >> i & 1 else -1
+    return sum(1 << i for i, vote in enumerate(votes) if vote > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class NearDuplicateMatch:
+    """A stored extraction whose text is within the distance limit of the query"""
+    fingerprint: int
+    distance: int
+    skills: List[str]
+
+
+class SimHashIndex:
+    """Bounded fingerprint -> skills index with banded lookup.
+
+    Fingerprints are split into ``max_distance + 1`` bands; by pigeonhole any fingerprint
+    within ``max_distance`` bits shares at least one band exactly, so only those
+    buckets are compared instead of the whole index.
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE, max_entries: int = 20_000):
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._bands = max_distance + 1
+        self._band_bits = -(-FINGERPRINT_BITS // self._bands)
+        self._entries: "OrderedDict[int, List[str]]" = OrderedDict()
+        self._buckets: List[Dict[int, Set[int]]] = [defaultdict(set) for _ in range(self._bands)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        mask = (1 << self._band_bits) - 1
+        return [(fingerprint >> (i * self._band_bits)) & mask for i in range(self._bands)]
+
+    def add(self, fingerprint: int, skills: List[str]) -> None:
+        with self._lock:
+            if fingerprint not in self._entries:
+                for band, key in enumerate(self._band_keys(fingerprint)):
+                    self._buckets[band][key].add(fingerprint)
+            self._entries[fingerprint] = list(skills)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                for band, key in enumerate(self._band_keys(evicted)):
+                    bucket = self._buckets[band][key]
+                    bucket.discard(evicted)
+                    if not bucket:
+                        del self._buckets[band][key]
+
+    def nearest(self, fingerprint: int) -> Optional[NearDuplicateMatch]:
+        with self._lock:
+            best: Optional[NearDuplicateMatch] = None
+            for band, key in enumerate(self._band_keys(fingerprint)):
+                for candidate in self._buckets[band].get(key, ()):
+                    distance = hamming_distance(fingerprint, candidate)
+                    if distance <= self.max_distance and (best is None or distance < best.distance):
+                        best = NearDuplicateMatch(candidate, distance, self._entries[candidate])
+            if best is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(best.fingerprint)
+            self.stats["hits"] += 1
+            return NearDuplicateMatch(best.fingerprint, best.distance, list(best.skills))
+
+
+# Global instance
+_near_duplicate_index = None
+
+def get_near_duplicate_index() -> Optional[SimHashIndex]:
+    """Get or create the shared index; None when NEAR_DUPLICATE_MAX_DISTANCE is negative (disabled)"""
+    global _near_duplicate_index
+    max_distance = min(int(os.getenv("NEAR_DUPLICATE_MAX_DISTANCE", DEFAULT_MAX_DISTANCE)), FINGERPRINT_BITS - 1)
+    if max_distance < 0:
+        return None
+    if _near_duplicate_index is None or _near_duplicate_index.max_distance != max_distance:
+        _near_duplicate_index = SimHashIndex(
+            max_distance=max_distance,
+            max_entries=int(os.getenv("NEAR_DUPLICATE_MAX_ENTRIES", 20_000)),
+        )
+    return _near_duplicate_index
@@ -3,14 +3,21 @@ import requests
 import json
 from typing import List, Dict, Any, Optional
 from .models import SkillGap
+from .extraction_cache import get_extraction_cache, make_cache_key
+from .resume_sections import build_extraction_text, segment_resume
 
 class NemotronService:
     """Service for integrating with NVIDIA Nemotron Nano v12 model"""
     
+    # Bump whenever the extraction prompt changes so cached results are not reused
+    EXTRACTION_PROMPT_VERSION = "2"
+    
     def __init__(self):
         self.api_key = os.getenv("NVIDIA_API_KEY")
         self.base_url = os.getenv("NVIDIA_BASE_URL", "https://api.nvcf.nvidia.com/v1")
         self.model = os.getenv("NEMOTRON_MODEL", "nvidia/nemotron-nano-9b-v2")
+        # Resume text sent for skill extraction is capped to this many (estimated) tokens
+        self.extraction_token_budget = int(os.getenv("NEMOTRON_EXTRACTION_TOKEN_BUDGET", 1200))
         
         if not self.api_key:
             raise ValueError("NVIDIA_API_KEY environment variable is required")
@@ -57,11 +64,21 @@ class NemotronService:
     def extract_skills_from_text(self, text: str, user_known_skills: List[str] = None) -> List[str]:
         """Extract skills from text using Nemotron Nano v12"""
         
+        cache = get_extraction_cache()
+        prompt_version = f"{self.EXTRACTION_PROMPT_VERSION}:{self.extraction_token_budget}"
+        cache_key = make_cache_key(text, user_known_skills, self.model, prompt_version)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        # Only the skill-relevant resume sections go into the prompt
+        relevant_text = build_extraction_text(segment_resume(text), self.extraction_token_budget)
+        
         prompt = f"""
-        Analyze the following text and extract all technical skills, programming languages, tools, frameworks, and competencies mentioned. 
+        Analyze the following resume sections and extract all technical skills, programming languages, tools, frameworks, and competencies mentioned. 
         Focus on skills relevant to STEM careers (Data Science, Software Engineering, AI/ML, etc.).
         
-        Text: "{text}"
+        Text: "{relevant_text}"
         
         Known skills from user: {user_known_skills or []}
         
@@ -81,11 +98,15 @@ class NemotronService:
         
         response = self._make_request(prompt, max_tokens=500)
         
+        skills = []
         try:
             # Try to parse JSON response
-            skills = json.loads(response)
-            if isinstance(skills, list):
-                return [skill.lower().strip() for skill in skills if skill.strip()]
+            parsed = json.loads(response)
+            if isinstance(parsed, list):
+                skills = [skill.lower().strip() for skill in parsed if skill.strip()]
+                if skills:
+                    cache.set(cache_key, skills)
+                return skills
         except json.JSONDecodeError:
             # Fallback: extract skills from text response
             skills = []
@@ -100,7 +121,11 @@ class NemotronService:
         if user_known_skills:
             skills.extend([skill.lower().strip() for skill in user_known_skills])
         
-        return list(set(skills))  # Remove duplicates
+        skills = list(set(skills))  # Remove duplicates
+        if response:
+            # Only successful calls are cached; an empty response means the API call failed
+            cache.set(cache_key, skills)
+        return skills
     
     def analyze_skill_gaps_with_ai(self, known_skills: List[str], target_role: str) -> List[SkillGap]:
         """Analyze skill gaps using AI-powered analysis"""
@@ -1,90 +1,56 @@
-from typing import List, Dict
+from typing import List, Dict, NamedTuple
 from .models import ResourceItem
+from .skill_ids import get_skill_registry
+from .taxonomy import DEFAULT_PROBLEM_ROLE, Taxonomy, get_taxonomy, on_taxonomy_change
 
 
-PROBLEM_BANK: Dict[str, List[Dict]] = {
-    "data_analyst": [
-        {
-            "id": "da_001",
-            "title": "E-commerce Sales Analysis",
-            "description": "Analyze sales data to identify trends and optimize marketing spend",
-            "skills_required": ["python", "pandas", "sql", "data visualization"],
-            "difficulty": "intermediate",
-            "points": 150,
-            "scenario": "You're a data analyst at an e-commerce company. The marketing team wants to understand which products are driving the most revenue and which customer segments are most valuable.",
-            "data_provided": "Sales transactions, customer demographics, product catalog, marketing campaigns",
-            "deliverables": [
-                "Top 10 products by revenue",
-                "Customer segmentation analysis", 
-                "Marketing ROI by channel",
-                "Interactive dashboard"
-            ],
-            "hints": [
-                "Start by cleaning and exploring the sales data",
-                "Use pandas for data manipulation and aggregation",
-                "Create visualizations to identify patterns",
-                "Consider seasonality in your analysis"
-            ]
-        },
-        {
-            "id": "da_002", 
-            "title": "A/B Test Analysis",
-            "description": "Analyze A/B test results to determine if a new feature should be launched",
-            "skills_required": ["statistics", "python", "pandas"],
-            "difficulty": "intermediate",
-            "points": 120,
-            "scenario": "Your product team ran an A/B test on a new checkout flow. You need to determine if the new flow significantly improves conversion rates.",
-            "data_provided": "User behavior data, conversion events, test group assignments",
-            "deliverables": [
-                "Statistical significance test",
-                "Conversion rate comparison",
-                "Confidence intervals",
-                "Recommendation with reasoning"
-            ],
-            "hints": [
-                "Use appropriate statistical tests (t-test, chi-square)",
-                "Check for statistical significance (p < 0.05)",
-                "Consider practical significance (effect size)",
-                "Account for multiple testing if needed"
-            ]
-        }
-    ],
-    "health_data_analyst": [
-        {
-            "id": "hda_001",
-            "title": "Patient Readmission Prediction",
-            "description": "Build a model to predict which patients are likely to be readmitted",
-            "skills_required": ["python", "pandas", "statistics", "epidemiology"],
-            "difficulty": "advanced",
-            "points": 200,
-            "scenario": "A hospital wants to reduce readmission rates. You need to identify patients at high risk of readmission within 30 days.",
-            "data_provided": "Patient demographics, medical history, treatment details, readmission status",
-            "deliverables": [
-                "Risk prediction model",
-                "Feature importance analysis",
-                "Model validation results",
-                "Clinical recommendations"
-            ],
-            "hints": [
-                "Consider both clinical and demographic factors",
-                "Use appropriate ML algorithms (logistic regression, random forest)",
-                "Validate your model properly",
-                "Consider ethical implications of predictions"
-            ]
-        }
-    ]
-}
+# Role -> practice problems, from data/taxonomy/problem_bank.json.
+# Rebound on every taxonomy reload; functions below read the bundled _index instead.
+PROBLEM_BANK: Dict[str, List[Dict]] = {}
+
+# Problem ID -> bitmask of the skills it exercises
+PROBLEM_SKILL_MASKS: Dict[str, int] = {}
+
+_registry = get_skill_registry()
+
+
+class _ProblemIndex(NamedTuple):
+    problem_bank: Dict[str, List[Dict]]
+    skill_masks: Dict[str, int]
+    by_id: Dict[str, Dict]
+
+
+def _build_problem_index(taxonomy: Taxonomy) -> _ProblemIndex:
+    """Problem lookups for a (re)loaded taxonomy"""
+    problems = [problem for role_problems in taxonomy.problem_bank.values() for problem in role_problems]
+    return _ProblemIndex(
+        taxonomy.problem_bank,
+        {problem["id"]: _registry.mask(problem["skills_required"], intern=True) for problem in problems},
+        {problem["id"]: problem for problem in reversed(problems)},  # first definition wins
+    )
+
+
+def _install_problem_index(index: _ProblemIndex) -> None:
+    """Swap in problem lookups with one assignment"""
+    global _index, PROBLEM_BANK, PROBLEM_SKILL_MASKS
+    _index = index
+    PROBLEM_BANK, PROBLEM_SKILL_MASKS = index.problem_bank, index.skill_masks
+
+
+_install_problem_index(_build_problem_index(get_taxonomy()))
+on_taxonomy_change(_build_problem_index, _install_problem_index)
 
 
 def generate_problems_for_skills(skills: List[str], role: str = "data_analyst", difficulty: str = "intermediate") -> List[Dict]:
     """Generate real-world problems that combine multiple skills"""
-    role_problems = PROBLEM_BANK.get(role.lower(), PROBLEM_BANK["data_analyst"])
+    index = _index
+    role_problems = index.problem_bank.get(role.lower(), index.problem_bank[DEFAULT_PROBLEM_ROLE])
     
     # Filter problems that use the available skills
     relevant_problems = []
+    user_mask = _registry.mask(skills)
     for problem in role_problems:
-        required_skills = [s.lower() for s in problem["skills_required"]]
-        if any(skill.lower() in required_skills for skill in skills):
+        if user_mask & index.skill_masks[problem["id"]]:
             if problem["difficulty"] == difficulty:
                 relevant_problems.append(problem)
     
@@ -93,11 +59,7 @@ def generate_problems_for_skills(skills: List[str], role: str = "data_analyst",
 
 def get_problem_by_id(problem_id: str) -> Dict:
     """Get a specific problem by ID"""
-    for role, problems in PROBLEM_BANK.items():
-        for problem in problems:
-            if problem["id"] == problem_id:
-                return problem
-    return {}
+    return _index.by_id.get(problem_id, {})
 
 
 def validate_solution(problem_id: str, solution_data: Dict) -> Dict:
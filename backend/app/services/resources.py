@@ -1,5 +1,9 @@
-from typing import List, Dict
+import heapq
+from typing import List, Dict, Optional, Tuple
+from .course_catalog import FALLBACK_CANDIDATES, CourseCatalog, get_course_catalog
+from .course_scoring import FALLBACK_RELEVANCE, INDEXED_RELEVANCE, top_k
 from .models import ResourceItem
+from .skill_aliases import canonicalize_skill
 
 
 MOCK_PROVIDER_COURSES: List[Dict] = [
@@ -63,7 +67,9 @@ def score_course(
     free_preferred: bool,
     provider_preferences: List[str],
 ) -> float:
-    relevance = 1.0 if course["skill"].lower() == target_skill.lower() else 0.5
+    # Catalog rows list every skill a course teaches; mock rows name one
+    taught = course.get("skills") or [course.get("skill", "")]
+    relevance = 1.0 if canonicalize_skill(target_skill) in {canonicalize_skill(s) for s in taught} else 0.5
     rating = course.get("rating", 0) / 5.0
     duration_match = min(1.0, weekly_time_hours / max(1.0, float(course.get("duration_hours", 1))))
     price_pref = 1.0 if (free_preferred and course.get("price") == "Free") else 0.5
@@ -72,40 +78,77 @@ def score_course(
     return round(score, 4)
 
 
+def candidate_courses(skill: str, catalog: Optional[CourseCatalog] = None) -> Tuple[List[Dict], bool]:
+    """(courses to score for ``skill``, whether they are indexed under it).
+
+    Reads the skill's rows from the catalog's inverted index; without any, falls back to
+    full-text search on the skill, then to the top-rated courses.
+    """
+    if catalog is None:
+        catalog = get_course_catalog()
+    indexed = catalog.courses_for_skill(skill)
+    if indexed:
+        return indexed, True
+    return catalog.search(skill, limit=FALLBACK_CANDIDATES) or catalog.top_rated(), False
+
+
+def top_courses_for_skill(
+    skill: str,
+    k: int,
+    weekly_time_hours: int,
+    free_preferred: bool,
+    provider_preferences: List[str],
+    catalog: Optional[CourseCatalog] = None,
+) -> List[Dict]:
+    """The ``k`` best-scoring candidate courses for ``skill``, best first, each with its ``score``.
+
+    Scores the catalog's columnar snapshot in one pass; without NumPy, scores each course
+    with ``score_course``. Either way, ties go to the earlier candidate.
+    """
+    if catalog is None:
+        catalog = get_course_catalog()
+    columns = catalog.columns()
+    if columns is None:
+        candidates, _ = candidate_courses(skill, catalog)
+        scored = [(score_course(c, skill, weekly_time_hours, free_preferred, provider_preferences), i) for i, c in enumerate(candidates)]
+        return [{**candidates[i], "score": score} for score, i in heapq.nsmallest(k, scored, key=lambda s: (-s[0], s[1]))]
+
+    candidates, relevance = columns.for_skill(skill), INDEXED_RELEVANCE
+    if not len(candidates.ids):
+        relevance = FALLBACK_RELEVANCE
+        candidates = columns.for_ids(catalog.search_ids(skill, limit=FALLBACK_CANDIDATES))
+        if not len(candidates.ids):
+            candidates = columns.top_rated(FALLBACK_CANDIDATES)
+    scores = columns.scores(candidates, relevance, weekly_time_hours, free_preferred, provider_preferences)
+    best = top_k(scores, k, decimals=4)
+    course_ids = candidates.ids[best].tolist()
+    # Courses replaced since the snapshot was taken are skipped rather than misattributed
+    courses = catalog.courses_by_id(course_ids)
+    return [{**courses[c], "score": round(float(scores[i]), 4)} for c, i in zip(course_ids, best) if c in courses]
+
+
 def rank_resources_for_skills(
     missing_skills: List[str],
     weekly_time_hours: int,
     free_preferred: bool,
     provider_preferences: List[str],
+    catalog: Optional[CourseCatalog] = None,
+    per_skill: int = 1,
 ) -> List[ResourceItem]:
     ranked: List[ResourceItem] = []
     for skill in missing_skills:
-        candidates = [c for c in MOCK_PROVIDER_COURSES if c["skill"].lower() == skill.lower()]
-        if not candidates:
-            candidates = MOCK_PROVIDER_COURSES  # fallback to all
-        scored = [
-            {
-                **c,
-                "score": score_course(c, skill, weekly_time_hours, free_preferred, provider_preferences),
-            }
-            for c in candidates
-        ]
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        best = scored[0]
-        ranked.append(
-            ResourceItem(
-                provider=best["provider"],
-                name=best["name"],
-                link=best["link"],
-                skill=skill,
-                difficulty=best.get("difficulty", "Beginner"),
-                duration_hours=best.get("duration_hours", 5),
-                rating=best.get("rating", 0.0),
-                price=best.get("price", "Free"),
-                score=float(best["score"]),
+        for best in top_courses_for_skill(skill, per_skill, weekly_time_hours, free_preferred, provider_preferences, catalog):
+            ranked.append(
+                ResourceItem(
+                    provider=best["provider"],
+                    name=best["name"],
+                    link=best["link"],
+                    skill=skill,
+                    difficulty=best.get("difficulty", "Beginner"),
+                    duration_hours=best.get("duration_hours", 5),
+                    rating=best.get("rating", 0.0),
+                    price=best.get("price", "Free"),
+                    score=float(best["score"]),
+                )
             )
-        )
     return ranked
-
-
-
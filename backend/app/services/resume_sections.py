@@ -0,0 +1,140 @@
+"""
+Resume Sections - single-pass resume segmentation into Skills / Experience / Projects / Education
+Lets extraction send only the relevant sections to the LLM, within a token budget
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Heading phrase -> section type
+SECTION_HEADINGS: Dict[str, str] = {
+    "summary": "summary",
+    "professional summary": "summary",
+    "profile": "summary",
+    "professional profile": "summary",
+    "objective": "summary",
+    "career objective": "summary",
+    "about me": "summary",
+    "skills": "skills",
+    "technical skills": "skills",
+    "core skills": "skills",
+    "key skills": "skills",
+    "skills & tools": "skills",
+    "skills and tools": "skills",
+    "core competencies": "skills",
+    "competencies": "skills",
+    "technologies": "skills",
+    "tools": "skills",
+    "tools & technologies": "skills",
+    "tools and technologies": "skills",
+    "tech stack": "skills",
+    "experience": "experience",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "relevant experience": "experience",
+    "employment": "experience",
+    "employment history": "experience",
+    "work history": "experience",
+    "career history": "experience",
+    "internships": "experience",
+    "projects": "projects",
+    "personal projects": "projects",
+    "selected projects": "projects",
+    "academic projects": "projects",
+    "key projects": "projects",
+    "portfolio": "projects",
+    "education": "education",
+    "academic background": "education",
+    "qualifications": "education",
+    "relevant coursework": "education",
+    "coursework": "education",
+    "certifications": "certifications",
+    "certificates": "certifications",
+    "licenses & certifications": "certifications",
+    "licenses and certifications": "certifications",
+    "courses": "certifications",
+    "publications": "publications",
+    "awards": "awards",
+    "honors & awards": "awards",
+    "volunteer experience": "volunteering",
+    "volunteering": "volunteering",
+    "interests": "interests",
+    "languages": "languages",
+    "programming languages": "languages",
+}
+
+# Section types worth sending to the LLM for skill extraction, most skill-dense first;
+# any other detected section follows them in resume order while the budget lasts
+EXTRACTION_PRIORITY = ("skills", "languages", "experience", "projects", "certifications", "summary", "header", "other", "education")
+
+_HEADING_LINE = re.compile(
+    r"[\W_]*(?P<heading>"
+    + "|".join(re.escape(h) for h in sorted(SECTION_HEADINGS, key=len, reverse=True))
+    + r")[\W_]*?(?::\s*(?P<rest>.*\S))?[\W_]*",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class ResumeSection:
+    """A contiguous block of a resume under one heading"""
+    id: str
+    type: str  # skills, experience, projects, education, ... ; "header" before the first heading
+    heading: Optional[str]
+    text: str
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count (about four characters per token)"""
+    return (len(text) + 3) // 4
+
+
+def segment_resume(text: str) -> List[ResumeSection]:
+    """Split resume text into typed sections in one pass over its lines"""
+    sections: List[ResumeSection] = []
+    current_type, current_heading, lines = "header", None, []
+
+    def flush() -> None:
+        body = "\n".join(lines).strip()
+        if body or current_heading:
+            sections.append(ResumeSection(
+                id=f"section_{len(sections)}", type=current_type, heading=current_heading, text=body,
+            ))
+
+    for line in (text or "").splitlines():
+        stripped = line.strip()
+        match = _HEADING_LINE.fullmatch(stripped) if 0 < len(stripped) <= 80 else None
+        if match:
+            flush()
+            current_heading = match.group("heading").strip()
+            current_type = SECTION_HEADINGS[current_heading.lower()]
+            lines = [match.group("rest")] if match.group("rest") else []
+        else:
+            lines.append(line)
+    flush()
+
+    if len(sections) == 1 and sections[0].type == "header":
+        sections[0].type = "other"  # No headings at all
+    return sections
+
+
+def build_extraction_text(sections: List[ResumeSection], token_budget: int) -> str:
+    """Concatenate sections most skill-relevant first, stopping at ``token_budget`` tokens"""
+    rank = {section_type: i for i, section_type in enumerate(EXTRACTION_PRIORITY)}
+    separator = "\n\n"
+    chosen: List[str] = []
+    remaining = token_budget * 4  # in characters, matching estimate_tokens
+    for section in sorted(sections, key=lambda s: rank.get(s.type, len(rank))):
+        if not section.text:
+            continue
+        if chosen:
+            remaining -= len(separator)
+        block = f"[{section.heading or section.type}]\n{section.text}"
+        if len(block) > remaining:
+            block = block[:max(remaining, 0)].rsplit(" ", 1)[0]
+        if not block:
+            break
+        chosen.append(block)
+        remaining -= len(block)
+    return separator.join(chosen)
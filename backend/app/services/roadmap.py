@@ -1,5 +1,6 @@
 from typing import List
 from .models import RoadmapEntry, ResourceItem
+from .skill_aliases import canonicalize_skill
 
 
 def generate_learning_roadmap(
@@ -11,14 +12,14 @@ def generate_learning_roadmap(
 ) -> List[RoadmapEntry]:
     entries: List[RoadmapEntry] = []
     week = 1
-    skill_to_resource = {r.skill.lower(): r for r in ranked_resources}
+    skill_to_resource = {canonicalize_skill(r.skill): r for r in ranked_resources}
     
     # Phase 1: Foundation skills (weeks 1-2)
     foundation_skills = missing_skills[:2] if len(missing_skills) >= 2 else missing_skills
     for skill in foundation_skills:
         if week > weeks:
             break
-        res = skill_to_resource.get(skill.lower())
+        res = skill_to_resource.get(canonicalize_skill(skill))
         resource_name = res.name if res else "Self-study"
         provider = res.provider if res else ""
         entries.append(
@@ -37,7 +38,7 @@ def generate_learning_roadmap(
     for skill in core_skills:
         if week > weeks:
             break
-        res = skill_to_resource.get(skill.lower())
+        res = skill_to_resource.get(canonicalize_skill(skill))
         resource_name = res.name if res else "Self-study"
         provider = res.provider if res else ""
         entries.append(
@@ -56,7 +57,7 @@ def generate_learning_roadmap(
     for skill in advanced_skills:
         if week > weeks:
             break
-        res = skill_to_resource.get(skill.lower())
+        res = skill_to_resource.get(canonicalize_skill(skill))
         resource_name = res.name if res else "Self-study"
         provider = res.provider if res else ""
         entries.append(
@@ -0,0 +1,165 @@
+"""
+Role Fit - the role taxonomy compiled into a roles x skills matrix
+Scores one user's skill vector against every role in a single vectorized pass; a required skill
+the user lacks but holds a specialization of (pandas for python) counts at up to DESCENDANT_CREDIT
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .skill_aliases import canonicalize_skill
+from .skill_hierarchy import get_skill_hierarchy
+from .skill_ids import get_skill_registry
+from .taxonomy import get_taxonomy, on_taxonomy_change
+
+
+@dataclass
+class RoleFitScore:
+    role: str
+    fit_score: float  # mastery-weighted share of the role's requirements met, 0.0 to 1.0
+    mastery_points_remaining: float
+    skills_below_requirement: List[str]
+
+
+class RoleMatrix:
+    """Dense roles x skills arrays of required score and mastery points.
+
+    A role's fit is sum(weight * min(current / required, 1)) over its skills, with weights
+    proportional to mastery points; points remaining are mastery * (1 - coverage).
+    """
+
+    def __init__(self, role_to_skills: Dict[str, Dict[str, Dict]]):
+        self.roles: List[str] = list(role_to_skills)
+        skills: Dict[str, int] = {}
+        for role_skills in role_to_skills.values():
+            for skill in role_skills:
+                skills.setdefault(canonicalize_skill(skill), len(skills))
+        self.skills: List[str] = list(skills)
+        self.skill_index = skills
+
+        # Matrix skills a held specialization can stand in for, with their descendant masks;
+        # every skill with descendants is registered when the hierarchy is built
+        self._hierarchy, self._registry = get_skill_hierarchy(), get_skill_registry()
+        skill_ids = [self._registry.lookup(skill) for skill in self.skills]
+        self._creditable = [
+            (s, self._hierarchy.descendants_mask(skill_id))
+            for s, skill_id in enumerate(skill_ids)
+            if skill_id is not None and self._hierarchy.descendants_mask(skill_id)
+        ]
+
+        self._required = [[0.0] * len(skills) for _ in self.roles]
+        self._mastery = [[0.0] * len(skills) for _ in self.roles]
+        for r, role_skills in enumerate(role_to_skills.values()):
+            for skill, info in role_skills.items():
+                s = skills[canonicalize_skill(skill)]
+                self._required[r][s] = float(info.get("required_score", 0.7))
+                self._mastery[r][s] = float(info.get("mastery_points", 100))
+
+        if NUMPY_AVAILABLE:
+            self.required = np.asarray(self._required, dtype=np.float64)
+            self.mastery = np.asarray(self._mastery, dtype=np.float64)
+            self.mask = self.required > 0
+            totals = self.mastery.sum(axis=1, keepdims=True)
+            self.weights = np.divide(self.mastery, totals, out=np.zeros_like(self.mastery), where=totals > 0)
+
+    def held_vector(self, current_scores: Dict[str, float]) -> List[float]:
+        """Score per matrix skill from the user's own skills only"""
+        vector = [0.0] * len(self.skills)
+        for skill, score in current_scores.items():
+            s = self.skill_index.get(canonicalize_skill(skill))
+            if s is not None:
+                vector[s] = max(vector[s], float(score))
+        return vector
+
+    def credited(self, vector: List[float], current_scores: Dict[str, float]) -> Dict[int, float]:
+        """Credit for each matrix skill unscored in ``vector`` whose specializations the user holds"""
+        if not self._creditable:
+            return {}
+        known_mask = self._registry.mask(current_scores)
+        credits: Dict[int, float] = {}
+        scores: Optional[Dict[str, float]] = None
+        for s, descendants in self._creditable:
+            held = descendants & known_mask
+            if vector[s] > 0 or not held:
+                continue
+            if scores is None:
+                scores = {}
+                for skill, score in current_scores.items():
+                    skill = canonicalize_skill(skill)
+                    scores[skill] = max(scores.get(skill, 0.0), float(score))
+            credits[s] = self._hierarchy.credit(held, scores)
+        return credits
+
+    def user_vector(self, current_scores: Dict[str, float]) -> List[float]:
+        """Score per matrix skill, with descendant credit for credited skills as in detect_skill_gaps"""
+        vector = self.held_vector(current_scores)
+        for s, credit in self.credited(vector, current_scores).items():
+            vector[s] = credit
+        return vector
+
+    def fit(self, current_scores: Dict[str, float], limit: Optional[int] = None) -> List[RoleFitScore]:
+        """Every role ranked by fit for a user's current skill scores (the best ``limit``, at least one)"""
+        vector = self.user_vector(current_scores)
+        if NUMPY_AVAILABLE:
+            scores = self._fit_numpy(np.asarray(vector, dtype=np.float64))
+        else:
+            scores = self._fit_python(vector)
+        scores.sort(key=lambda f: (-f.fit_score, f.mastery_points_remaining, f.role))
+        return scores[:max(1, limit)] if limit is not None else scores
+
+    def _fit_numpy(self, user) -> List[RoleFitScore]:
+        coverage = np.minimum(np.divide(user, self.required, out=np.zeros_like(self.required), where=self.mask), 1.0)
+        fit = (self.weights * coverage).sum(axis=1)
+        remaining = (self.mastery * (1.0 - coverage) * self.mask).sum(axis=1)
+        below = self.mask & (coverage < 1.0)
+        return [
+            RoleFitScore(
+                role=role,
+                fit_score=round(float(fit[r]), 4),
+                mastery_points_remaining=round(float(remaining[r]), 1),
+                skills_below_requirement=[self.skills[s] for s in np.flatnonzero(below[r])],
+            )
+            for r, role in enumerate(self.roles)
+        ]
+
+    def _fit_python(self, user: List[float]) -> List[RoleFitScore]:
+        results = []
+        for r, role in enumerate(self.roles):
+            total = sum(self._mastery[r])
+            fit = remaining = 0.0
+            below = []
+            for s, required in enumerate(self._required[r]):
+                if required <= 0:
+                    continue
+                coverage = min(user[s] / required, 1.0)
+                fit += (self._mastery[r][s] / total if total else 0.0) * coverage
+                remaining += self._mastery[r][s] * (1.0 - coverage)
+                if coverage < 1.0:
+                    below.append(self.skills[s])
+            results.append(RoleFitScore(role, round(fit, 4), round(remaining, 1), below))
+        return results
+
+
+# Global instance
+_role_matrix_instance = None
+
+def get_role_matrix() -> RoleMatrix:
+    """Get or compile the roles x skills matrix"""
+    global _role_matrix_instance
+    if _role_matrix_instance is None:
+        _role_matrix_instance = RoleMatrix(get_taxonomy().role_to_skills)
+    return _role_matrix_instance
+
+
+def _install_role_matrix(matrix: RoleMatrix) -> None:
+    global _role_matrix_instance
+    _role_matrix_instance = matrix
+
+
+on_taxonomy_change(lambda taxonomy: RoleMatrix(taxonomy.role_to_skills), _install_role_matrix)
@@ -0,0 +1,191 @@
+"""
+Role Resolver - map free-text career goals ("Sr. Data Analyst", "ML engineer") to known role profiles
+Exact alias lookup, then a token index for reordered or padded goals, then edit distance for typos.
+Generic words ("engineer", "analyst") never decide a match on their own: the distinguishing words of
+a title must match, and the goal's generic words must agree with the title's.
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .fuzzy_matcher import edit_similarity
+
+# Role -> alternative titles. Roles missing from a resolver's role set are ignored.
+ROLE_ALIASES: Dict[str, List[str]] = {
+    "data analyst": [
+        "data analytics", "analytics analyst", "reporting analyst", "bi analyst",
+        "business intelligence analyst", "data analysis", "da",
+    ],
+    "health data analyst": [
+        "healthcare data analyst", "clinical data analyst", "health analyst", "healthcare analyst",
+        "health informatics analyst", "public health analyst", "medical data analyst",
+    ],
+    "software engineer": [
+        "software developer", "developer", "programmer", "swe", "sde", "software development engineer",
+        "backend engineer", "backend developer", "frontend engineer", "frontend developer",
+        "full stack developer", "full stack engineer", "web developer", "coder",
+    ],
+    "machine learning engineer": [
+        "ml engineer", "mle", "ai engineer", "deep learning engineer", "mlops engineer",
+        "machine learning", "ml", "applied scientist", "ai ml engineer",
+    ],
+    "cybersecurity analyst": [
+        "security analyst", "cyber security analyst", "infosec analyst", "information security analyst",
+        "soc analyst", "cyber analyst", "security engineer", "cybersecurity", "penetration tester",
+    ],
+    "biomedical engineer": [
+        "bioengineer", "biomedical engineering", "medical device engineer", "biomed engineer",
+        "clinical engineer",
+    ],
+    "environmental engineer": [
+        "environmental engineering", "environmental scientist", "sustainability engineer",
+        "environmental consultant", "water resources engineer",
+    ],
+}
+
+# Seniority, level and filler words that never change which profile a goal means
+GOAL_FILLER_WORDS: Set[str] = {
+    "sr", "senior", "jr", "junior", "lead", "principal", "staff", "head", "chief", "associate",
+    "assistant", "intern", "internship", "entry", "level", "mid", "i", "ii", "iii", "iv",
+    "a", "an", "the", "to", "be", "become", "becoming", "as", "aspiring", "want", "wants", "my",
+    "role", "position", "job", "career", "in", "at", "of", "for", "remote", "contract",
+}
+
+# Abbreviations expanded before lookup
+GOAL_ABBREVIATIONS: Dict[str, str] = {
+    "eng": "engineer", "engr": "engineer", "engg": "engineer", "dev": "developer",
+    "devs": "developer", "mgr": "manager", "sec": "security",
+}
+
+# Generic job words -> the family they belong to; "civil engineer" shares only a family with
+# "software engineer", which is not enough to match it
+GENERIC_TITLE_WORDS: Dict[str, str] = {
+    "engineer": "engineer", "engineering": "engineer", "developer": "engineer", "programmer": "engineer",
+    "coder": "engineer", "analyst": "analyst", "scientist": "scientist", "tester": "tester",
+    "consultant": "consultant", "specialist": "specialist", "manager": "manager",
+    "architect": "architect", "administrator": "administrator",
+}
+
+# Below this confidence the default role is used instead
+MIN_CONFIDENCE = 0.6
+
+# Minimum edit similarity between the distinguishing words of a goal and a title ("sofware" ~ "software")
+FUZZY_MIN_SIMILARITY = 0.8
+
+# A goal matched only on a title's distinguishing words ("security" ~ "security engineer") is never exact
+FUZZY_MAX_CONFIDENCE = 0.9
+
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+
+
+def goal_tokens(goal: str) -> List[str]:
+    words = _NON_WORD.split((goal or "").lower().replace("/", " "))
+    tokens = [GOAL_ABBREVIATIONS.get(w, w) for w in words if w]
+    return [t for t in tokens if t not in GOAL_FILLER_WORDS]
+
+
+def _generic_word(token: str) -> Optional[str]:
+    """The generic job word ``token`` is or misspells ("enginer"), if any"""
+    if token in GENERIC_TITLE_WORDS:
+        return token
+    if len(token) >= 5:
+        for word in GENERIC_TITLE_WORDS:
+            if word[0] == token[0] and edit_similarity(token, word) >= FUZZY_MIN_SIMILARITY:
+                return word
+    return None
+
+
+def _families_agree(a: FrozenSet[str], b: FrozenSet[str]) -> bool:
+    return not a or not b or bool(a & b)
+
+
+@dataclass(frozen=True)
+class RoleResolution:
+    role: str
+    confidence: float  # 1.0 exact title or alias; 0.0 when falling back to the default role
+    matched: Optional[str] = None  # the role name or alias the goal matched
+
+
+class RoleResolver:
+    """Resolve free-text goals to one of ``roles``; results are LRU-cached per goal string"""
+
+    def __init__(self, roles: Iterable[str], aliases: Dict[str, List[str]], default: str, cache_size: int = 4096):
+        self.roles = list(roles)
+        self.default = default
+        titles: Dict[str, str] = {}
+        for role in self.roles:
+            for title in [role, *aliases.get(role, [])]:
+                key = " ".join(goal_tokens(title)) or title
+                titles.setdefault(key, role)
+        self._titles = titles
+        self._title_tokens: Dict[str, Tuple[str, ...]] = {t: tuple(t.split()) for t in titles}
+        # Distinguishing (non-generic) words and generic word families of each title
+        self._title_words: Dict[str, Tuple[Tuple[str, ...], FrozenSet[str]]] = {
+            title: (
+                tuple(t for t in tokens if t not in GENERIC_TITLE_WORDS),
+                frozenset(GENERIC_TITLE_WORDS[t] for t in tokens if t in GENERIC_TITLE_WORDS),
+            )
+            for title, tokens in self._title_tokens.items()
+        }
+        self._token_index: Dict[str, Set[str]] = defaultdict(set)
+        for title, tokens in self._title_tokens.items():
+            for token in tokens:
+                self._token_index[token].add(title)
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _resolve(self, goal: str) -> RoleResolution:
+        tokens = goal_tokens(goal)
+        key = " ".join(tokens)
+        if not key:
+            return RoleResolution(self.default, 0.0)
+
+        # 1. Exact title or alias
+        if key in self._titles:
+            return RoleResolution(self._titles[key], 1.0, key)
+
+        # Misspelled generic words count as the word they misspell, at the cost of the typo
+        corrected = [_generic_word(t) or t for t in tokens]
+        typo_factor = 1.0
+        for token, word in zip(tokens, corrected):
+            typo_factor *= edit_similarity(token, word)
+        tokens = corrected
+        goal_set = set(tokens)
+        goal_words = [t for t in tokens if t not in GENERIC_TITLE_WORDS]
+        goal_families = frozenset(GENERIC_TITLE_WORDS[t] for t in goal_set if t in GENERIC_TITLE_WORDS)
+
+        # 2. Titles whose distinguishing words all appear in the goal ("data analyst at a hospital"), longest first
+        best_score, best_title = 0.0, None
+        best_rank: Tuple = ()
+        candidates = set().union(*(self._token_index.get(t, set()) for t in goal_set))
+        for title in candidates:
+            words, families = self._title_words[title]
+            if not goal_set.issuperset(words) or not _families_agree(goal_families, families):
+                continue
+            title_tokens = self._title_tokens[title]
+            overlap = sum(1 for t in title_tokens if t in goal_set)
+            # Share of the title found in the goal, discounted by unexplained goal words
+            score = overlap / len(title_tokens) * (0.8 + 0.2 * overlap / len(goal_set))
+            rank = (score, overlap, title)
+            if rank > best_rank:
+                best_score, best_title, best_rank = score, title, rank
+
+        # 3. Misspelled distinguishing words ("sofware enginer"), unless the words already fit well
+        if best_score < 0.8 and goal_words:
+            phrase = " ".join(goal_words)
+            fuzzy_rank: Tuple = (max(best_score, FUZZY_MIN_SIMILARITY - 1e-9), "")
+            for title, (words, families) in self._title_words.items():
+                if not words or words[0][0] != phrase[0] or not _families_agree(goal_families, families):
+                    continue
+                rank = (edit_similarity(phrase, " ".join(words)), title)
+                if rank > fuzzy_rank:
+                    fuzzy_rank = rank
+            if fuzzy_rank[1]:
+                best_score, best_title = min(fuzzy_rank[0], FUZZY_MAX_CONFIDENCE), fuzzy_rank[1]
+
+        best_score *= typo_factor
+        if best_title is None or best_score < MIN_CONFIDENCE:
+            return RoleResolution(self.default, 0.0)
+        return RoleResolution(self._titles[best_title], round(best_score, 4), best_title)
@@ -0,0 +1,127 @@
+"""
+Skill Aliases - shared canonicalization registry for skill names
+Maps every known alias/spelling to one canonical skill ID through a precomputed index
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set
+
+
+# Canonical skill ID -> aliases. Canonical IDs match the keys used in ROLE_TO_SKILLS,
+# QUESTION_BANK and the skill lexicon, so existing data needs no rewriting.
+SKILL_ALIASES: Dict[str, List[str]] = {
+    "python": ["python3", "python 3", "python programming"],
+    "sql": ["structured query language", "sql queries"],
+    "excel": ["ms excel", "microsoft excel", "spreadsheets"],
+    "tableau": ["tableau desktop"],
+    "powerbi": ["power bi", "pbi", "microsoft power bi", "ms power bi"],
+    "statistics": ["stats", "statistical analysis"],
+    "probability": ["probability theory"],
+    "data visualization": ["data viz", "dataviz", "data visualisation", "data visualizations"],
+    "epidemiology": ["epidemiological analysis"],
+    "pandas": ["python pandas"],
+    "numpy": ["num py"],
+    "matplotlib": [],
+    "scikit-learn": ["sklearn", "scikit learn", "scikitlearn"],
+    "postgresql": ["postgres", "postgre sql"],
+    "mysql": [],
+    "mongodb": ["mongo db", "mongo"],
+    "deep learning": [],
+    "tensorflow": ["tensor flow"],
+    "pytorch": ["py torch"],
+    "javascript": ["js", "ecmascript"],
+    "git": ["github", "gitlab"],
+    "docker": ["docker containers"],
+    "aws": ["amazon web services"],
+    "machine learning": ["ml"],
+    "data preprocessing": ["data cleaning", "data wrangling", "data preparation"],
+    "model deployment": ["ml deployment", "model serving"],
+    "cloud platforms": ["cloud computing", "cloud platform"],
+    "programming": ["coding", "software development"],
+    "algorithms": ["data structures and algorithms", "dsa"],
+    "system design": ["systems design", "system architecture"],
+    "databases": ["database", "dbms"],
+    "testing": ["software testing", "unit testing"],
+    "version control": ["source control"],
+    "network security": ["netsec"],
+    "incident response": ["ir"],
+    "penetration testing": ["pen testing", "pentesting", "pentest"],
+    "security tools": ["siem"],
+    "compliance": [],
+    "forensics": ["digital forensics"],
+    "biology": [],
+    "medical devices": ["medical device"],
+    "regulatory affairs": [],
+    "signal processing": ["dsp", "digital signal processing"],
+    "materials science": ["material science"],
+    "clinical trials": ["clinical trial"],
+    "environmental science": [],
+    "sustainability": [],
+    "regulatory compliance": [],
+    "data analysis": ["data analytics"],
+    "project management": [],
+    "gis": ["geographic information systems", "geographic information system"],
+}
+
+# Aliases that are also everyday words ("the stats of the game", "pushed to GitHub"). They
+# canonicalize a skill someone lists, but free-text matching never treats them as a skill.
+LIST_ONLY_ALIASES: Set[str] = {"stats", "mongo", "github", "gitlab"}
+
+_SEPARATORS = re.compile(r"[-_]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def skill_key(name: str) -> str:
+    """Lookup key for a skill string: lowercase, separators folded, whitespace collapsed"""
+    return _WHITESPACE.sub(" ", _SEPARATORS.sub(" ", (name or "").lower())).strip()
+
+
+def _build_index(aliases: Dict[str, List[str]]) -> Dict[str, str]:
+    index: Dict[str, str] = {}
+    for canonical, names in aliases.items():
+        for name in [canonical, *names]:
+            key = skill_key(name)
+            index.setdefault(key, canonical)
+            # Spacing variants ("power bi" / "powerbi") share one compact key
+            index.setdefault(key.replace(" ", ""), canonical)
+    return index
+
+
+_ALIAS_INDEX: Dict[str, str] = _build_index(SKILL_ALIASES)
+
+
+@lru_cache(maxsize=8192)
+def canonicalize_skill(name: str) -> str:
+    """Return the canonical skill ID for ``name``; unknown skills come back lowercased and trimmed"""
+    key = skill_key(name)
+    canonical = _ALIAS_INDEX.get(key) or _ALIAS_INDEX.get(key.replace(" ", ""))
+    if canonical:
+        return canonical
+    return _WHITESPACE.sub(" ", (name or "").lower()).strip()
+
+
+def canonical_skill_set(skills: Iterable[str]) -> Set[str]:
+    """Canonicalize a collection of skills into a set, skipping blanks"""
+    return {canonicalize_skill(s) for s in skills or [] if s and s.strip()}
+
+
+def same_skill(a: str, b: str) -> bool:
+    return canonicalize_skill(a) == canonicalize_skill(b)
+
+
+def text_aliases(canonical: str) -> List[str]:
+    """Aliases of ``canonical`` that identify the skill in free text (LIST_ONLY_ALIASES excluded)"""
+    return [alias for alias in SKILL_ALIASES.get(canonical, []) if skill_key(alias) not in LIST_ONLY_ALIASES]
+
+
+def alias_surface_forms(canonicals: Iterable[str]) -> Dict[str, str]:
+    """Alias -> canonical entries for the given skills, in the form they appear in normalized text"""
+    wanted = set(canonicals)
+    forms: Dict[str, str] = {}
+    for canonical in wanted:
+        for alias in text_aliases(canonical):
+            lowered = _WHITESPACE.sub(" ", alias.lower()).strip()
+            forms[lowered] = canonical
+            forms[skill_key(alias)] = canonical
+    return forms
@@ -0,0 +1,202 @@
+"""
+Skill Evidence - single-pass scanner for proficiency evidence in resume text
+Grades each skill from years of experience, recency, seniority verbs and project count, without an LLM call
+"""
+
+import re
+import datetime
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from .resume_sections import segment_resume
+from .skill_aliases import SKILL_ALIASES, skill_key, text_aliases
+
+# Score of a skill that is mentioned with no further evidence; evidence moves it up or down from here
+LISTED_SCORE = 0.45
+
+# Evidence saturates at these values
+FULL_CREDIT_YEARS = 5.0
+FULL_CREDIT_PROJECTS = 3
+# Last use within RECENT_YEARS counts fully, fading to nothing after STALE_YEARS
+RECENT_YEARS = 1
+STALE_YEARS = 6
+
+LEAD_VERBS = (
+    "led", "lead", "architected", "designed", "owned", "mentored", "spearheaded", "scaled",
+    "optimized", "expert", "advanced", "principal", "senior",
+)
+APPLIED_VERBS = (
+    "built", "developed", "implemented", "automated", "created", "analyzed", "deployed",
+    "maintained", "wrote", "used", "applied", "delivered", "migrated",
+)
+LEARNING_CUES = (
+    "familiar with", "familiarity with", "basic", "basics of", "exposure to", "coursework",
+    "learning", "beginner", "introductory", "currently studying",
+)
+SENIORITY_LEVELS = {"lead": 1.0, "applied": 0.5, "learning": -1.0}
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+"
+_BOUNDARY_BEFORE = r"(?<![\w+#])"
+_BOUNDARY_AFTER = r"(?![\w+#])"
+_BULLET = re.compile(r"\s*[-•*▪●◦–]")
+
+
+@dataclass
+class SkillEvidence:
+    """Evidence for one canonical skill and the graded score it supports"""
+    skill: str
+    mentions: int = 0
+    years: float = 0.0  # explicit "N years" on a line with the skill, or dated roles that mention it
+    last_used: Optional[int] = None  # end year of the most recent dated role mentioning the skill
+    seniority: float = 0.0  # -1.0 (learning) to 1.0 (led / architected)
+    projects: int = 0
+    score: float = 0.0
+    _blocks: Set[int] = field(default_factory=set, repr=False)
+    _project_entries: Set[int] = field(default_factory=set, repr=False)
+    _seniority_seen: bool = field(default=False, repr=False)
+
+
+def _alternation(words) -> str:
+    return "|".join(re.escape(w).replace(r"\ ", r"\s+") for w in sorted(words, key=len, reverse=True))
+
+
+def _build_scanner(forms: Dict[str, str]) -> re.Pattern:
+    """One compiled pattern for line breaks, dates, year counts, seniority cues and skill mentions"""
+    return re.compile(
+        r"(?P<nl>\n)"
+        rf"|(?P<range>(?:{_MONTH})?(?P<start>(?:19|20)\d{{2}})\s*(?:-|–|—|to)\s*(?:{_MONTH})?(?P<end>(?:19|20)\d{{2}}|present|current|now))"
+        r"|(?P<years>(?P<count>\d{1,2}(?:\.\d)?)\+?\s*(?:years?|yrs?)\b)"
+        rf"|{_BOUNDARY_BEFORE}(?P<lead>{_alternation(LEAD_VERBS)}){_BOUNDARY_AFTER}"
+        rf"|{_BOUNDARY_BEFORE}(?P<applied>{_alternation(APPLIED_VERBS)}){_BOUNDARY_AFTER}"
+        rf"|{_BOUNDARY_BEFORE}(?P<learning>{_alternation(LEARNING_CUES)}){_BOUNDARY_AFTER}"
+        rf"|{_BOUNDARY_BEFORE}(?P<skill>{_alternation(forms)}){_BOUNDARY_AFTER}",
+        re.IGNORECASE,
+    )
+
+
+def _skill_forms() -> Dict[str, str]:
+    forms: Dict[str, str] = {}
+    # List-only aliases ("stats", "github") are everyday words in prose and would raise proficiency
+    for canonical in SKILL_ALIASES:
+        for name in [canonical, *text_aliases(canonical)]:
+            forms.setdefault(name.lower(), canonical)
+    return forms
+
+
+_FORMS = _skill_forms()
+_FORM_KEYS = {skill_key(form): canonical for form, canonical in _FORMS.items()}
+_SCANNER = _build_scanner(_FORMS)
+
+
+def _starts_project(body: str, line_start: int) -> bool:
+    """A non-blank, non-bullet line in the projects section is a new project's title"""
+    line_end = body.find("\n", line_start)
+    return bool(body[line_start:line_end].strip()) and not _BULLET.match(body, line_start)
+
+
+def _span_years(spans: List[tuple]) -> float:
+    """Years covered by dated roles, counting overlapping roles once"""
+    years, merged_start, merged_end = 0, None, None
+    for start, end in sorted(spans):
+        if merged_end is not None and start <= merged_end:
+            merged_end = max(merged_end, end)
+            continue
+        if merged_end is not None:
+            years += max(merged_end - merged_start, 1)
+        merged_start, merged_end = start, end
+    if merged_end is not None:
+        years += max(merged_end - merged_start, 1)
+    return float(years)
+
+
+def _score(evidence: SkillEvidence, current_year: int) -> float:
+    score = LISTED_SCORE
+    score += 0.25 * min(evidence.years / FULL_CREDIT_YEARS, 1.0)
+    score += 0.15 * evidence.seniority
+    score += 0.10 * min(evidence.projects / FULL_CREDIT_PROJECTS, 1.0)
+    if evidence.last_used is not None:
+        age = max(current_year - evidence.last_used, 0)
+        score += 0.05 * min(max((STALE_YEARS - age) / (STALE_YEARS - RECENT_YEARS), 0.0), 1.0)
+    return round(min(max(score, 0.0), 1.0), 4)
+
+
+def scan_skill_evidence(text: str, current_year: Optional[int] = None) -> Dict[str, SkillEvidence]:
+    """Collect per-skill proficiency evidence from ``text`` in one scan of each section.
+
+    Cues on a line (seniority verbs, "N years") apply to the skills on that line; a date
+    range opens a role or project whose span and end year apply to every skill in it.
+    """
+    current_year = current_year or datetime.date.today().year
+    evidence: Dict[str, SkillEvidence] = {}
+    block_spans: List[tuple] = []
+    project_entries = 0
+
+    for section in segment_resume(text or ""):
+        block: Optional[int] = None
+        body = section.text + "\n"
+        line_start = 0
+        line_skills: Set[str] = set()
+        line_levels: List[float] = []
+        line_years = 0.0
+        if section.type == "projects" and _starts_project(body, 0):
+            project_entries += 1
+
+        for match in _SCANNER.finditer(body):
+            kind = match.lastgroup
+            if kind == "nl":
+                seniority = max(line_levels) if line_levels else None
+                for skill in line_skills:
+                    item = evidence[skill]
+                    if line_years:
+                        item.years = max(item.years, line_years)
+                    if seniority is not None and (not item._seniority_seen or seniority > item.seniority):
+                        item.seniority = seniority
+                        item._seniority_seen = True
+                line_start = match.end()
+                line_skills, line_levels, line_years = set(), [], 0.0
+                if section.type == "projects" and _starts_project(body, line_start):
+                    project_entries += 1
+                continue
+
+            if kind == "range":
+                start = int(match.group("start"))
+                end_text = match.group("end").lower()
+                end = current_year if end_text in ("present", "current", "now") else int(end_text)
+                if end >= start:
+                    block = len(block_spans)
+                    block_spans.append((start, end))
+            elif kind == "years":
+                line_years = max(line_years, float(match.group("count")))
+            elif kind in SENIORITY_LEVELS:
+                # The strongest cue on a line wins, so "learning" only counts on its own
+                line_levels.append(SENIORITY_LEVELS[kind])
+            elif kind == "skill":
+                skill = _FORM_KEYS.get(skill_key(match.group("skill")))
+                if skill is None:
+                    continue
+                item = evidence.setdefault(skill, SkillEvidence(skill=skill))
+                item.mentions += 1
+                line_skills.add(skill)
+                if block is not None:
+                    item._blocks.add(block)
+                if section.type == "projects" and project_entries:
+                    item._project_entries.add(project_entries)
+
+    for item in evidence.values():
+        if item._blocks:
+            spans = [block_spans[b] for b in item._blocks]
+            item.years = max(item.years, _span_years(spans))
+            item.last_used = max(end for _, end in spans)
+        item.projects = len(item._project_entries)
+        item.score = _score(item, current_year)
+    return evidence
+
+
+def proficiency_for_score(score: float) -> str:
+    if score >= 0.9:
+        return "Expert"
+    if score >= 0.7:
+        return "Advanced"
+    if score >= 0.4:
+        return "Intermediate"
+    return "Beginner"
@@ -0,0 +1,268 @@
+"""
+Skill Graph - skill co-occurrence counts mined from analyzed resumes
+Sparse symmetric count matrix updated per resume; "adjacent skills" ranks one row by PMI or conditional probability
+"""
+
+import os
+import math
+import json
+import atexit
+import sqlite3
+import threading
+from collections import OrderedDict, defaultdict
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .extraction_cache import make_cache_key
+from .skill_aliases import canonical_skill_set
+
+ADJACENCY_METRICS = ("pmi", "conditional")
+
+# Pairs seen fewer times than this are noise, and PMI overrates them
+DEFAULT_MIN_COUNT = 3
+
+# Long skill lists add quadratically many pairs for little signal
+MAX_SKILLS_PER_RESUME = 60
+
+# Observed resumes remembered in memory so a repeat replaces, not adds to, its counts;
+# persisted graphs also look older ones up in SQLite
+MAX_TRACKED_DOCUMENTS = 100_000
+
+# Seconds between background flushes of pending counts to SQLite
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+
+def document_key(text: str, user_id: Optional[str] = None) -> str:
+    """Identity of an observed resume: the user when known, else a hash of the resume text"""
+    if user_id:
+        return f"user:{user_id}"
+    return "resume:" + make_cache_key(text, None, "skill_graph", "1")[:32]
+
+
+class SkillCooccurrence:
+    """Sparse skill x skill co-occurrence counts (dict-of-dicts rows) with optional SQLite persistence.
+
+    Each observed resume adds 1 to every pair of its skills and to each skill's document
+    count, so any adjacency query is one row lookup. Pass ``path=None`` for memory only.
+    Counts change in memory at once; SQLite receives the accumulated deltas from a
+    background thread every ``flush_interval`` seconds (and on ``flush()`` or exit).
+    """
+
+    def __init__(self, path: Optional[str] = None, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.path = path
+        self.documents = 0
+        self._skill_counts: Dict[str, int] = defaultdict(int)
+        self._rows: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._observed: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._pending_skills: Dict[str, int] = defaultdict(int)
+        self._pending_pairs: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._pending_documents: Dict[str, Tuple[str, ...]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+                self._conn.executescript(
+                    "CREATE TABLE IF NOT EXISTS skill_docs (skill TEXT PRIMARY KEY, count INTEGER NOT NULL);"
+                    "CREATE TABLE IF NOT EXISTS skill_pairs ("
+                    " a TEXT NOT NULL, b TEXT NOT NULL, count INTEGER NOT NULL, PRIMARY KEY (a, b));"
+                    "CREATE TABLE IF NOT EXISTS skill_documents (key TEXT PRIMARY KEY, skills TEXT NOT NULL);"
+                )
+                self._load()
+            except sqlite3.Error as e:
+                print(f"⚠️ Skill graph persistence disabled ({path}): {e}")
+                self._conn = None
+        if self._conn is not None:
+            self._stop = threading.Event()
+            threading.Thread(target=self._flush_loop, args=(flush_interval,), daemon=True).start()
+            atexit.register(self.flush)
+
+    def _load(self) -> None:
+        for skill, count in self._conn.execute("SELECT skill, count FROM skill_docs"):
+            if skill == "":
+                self.documents = count  # Row "" holds the resume count
+            else:
+                self._skill_counts[skill] = count
+        for a, b, count in self._conn.execute("SELECT a, b, count FROM skill_pairs"):
+            self._rows[a][b] = count
+            self._rows[b][a] = count
+
+    def _previous_skills(self, key: str) -> Optional[Tuple[str, ...]]:
+        previous = self._observed.get(key)
+        if previous is not None:
+            self._observed.move_to_end(key)
+            return previous
+        if self._conn is None:
+            return None
+        with self._db_lock:
+            row = self._conn.execute("SELECT skills FROM skill_documents WHERE key = ?", (key,)).fetchone()
+        return tuple(json.loads(row[0])) if row else None
+
+    def _apply(self, skills: Tuple[str, ...], delta: int) -> None:
+        persist = self._conn is not None
+        self.documents += delta
+        if persist:
+            self._pending_skills[""] += delta
+        for skill in skills:
+            self._skill_counts[skill] += delta
+            if persist:
+                self._pending_skills[skill] += delta
+            if self._skill_counts[skill] <= 0:
+                del self._skill_counts[skill]
+        for a, b in combinations(skills, 2):
+            if persist:
+                self._pending_pairs[(a, b)] += delta
+            for x, y in ((a, b), (b, a)):
+                row = self._rows[x]
+                row[y] += delta
+                if row[y] <= 0:
+                    del row[y]
+                    if not row:
+                        del self._rows[x]
+
+    def observe(self, skills: Iterable[str], key: Optional[str] = None) -> bool:
+        """Add one resume's skills to the counts; returns whether the counts changed.
+
+        A resume observed before under the same ``key`` (see ``document_key``) replaces its
+        earlier contribution, so re-analyzing it never inflates the counts.
+        """
+        unique = tuple(sorted(canonical_skill_set(skills))[:MAX_SKILLS_PER_RESUME])
+        with self._lock:
+            previous = self._previous_skills(key) if key else None
+            if previous == unique or (previous is None and not unique):
+                return False
+            if previous:
+                self._apply(previous, -1)
+            if unique:
+                self._apply(unique, 1)
+            if key:
+                self._observed[key] = unique
+                self._observed.move_to_end(key)
+                while len(self._observed) > MAX_TRACKED_DOCUMENTS:
+                    self._observed.popitem(last=False)
+                if self._conn is not None:
+                    self._pending_documents[key] = unique
+        return True
+
+    def flush(self) -> None:
+        """Write the counts accumulated since the last flush to SQLite in one transaction"""
+        if self._conn is None:
+            return
+        with self._lock:
+            skill_deltas = [(s, d) for s, d in self._pending_skills.items() if d]
+            pair_deltas = [(a, b, d) for (a, b), d in self._pending_pairs.items() if d]
+            documents = [(k, json.dumps(v)) for k, v in self._pending_documents.items()]
+            self._pending_skills.clear()
+            self._pending_pairs.clear()
+            self._pending_documents.clear()
+        if not (skill_deltas or pair_deltas or documents):
+            return
+        with self._db_lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO skill_docs (skill, count) VALUES (?, ?)"
+                        " ON CONFLICT (skill) DO UPDATE SET count = count + excluded.count",
+                        skill_deltas,
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO skill_pairs (a, b, count) VALUES (?, ?, ?)"
+                        " ON CONFLICT (a, b) DO UPDATE SET count = count + excluded.count",
+                        pair_deltas,
+                    )
+                    self._conn.execute("DELETE FROM skill_docs WHERE count <= 0 AND skill != ''")
+                    self._conn.execute("DELETE FROM skill_pairs WHERE count <= 0")
+                    self._conn.executemany(
+                        "INSERT INTO skill_documents (key, skills) VALUES (?, ?)"
+                        " ON CONFLICT (key) DO UPDATE SET skills = excluded.skills",
+                        documents,
+                    )
+            except sqlite3.Error as e:
+                print(f"⚠️ Skill graph write failed: {e}")
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Flush and stop the background writer"""
+        if self._conn is not None:
+            self._stop.set()
+            self.flush()
+
+    def count(self, skill: str) -> int:
+        return self._skill_counts.get(skill, 0)
+
+    def pair_count(self, a: str, b: str) -> int:
+        row = self._rows.get(a)
+        return row.get(b, 0) if row else 0
+
+    def _score(self, skill: str, other: str, together: int, metric: str) -> float:
+        if metric == "conditional":
+            return together / self._skill_counts[skill]  # P(other | skill)
+        return math.log(together * self.documents / (self._skill_counts[skill] * self._skill_counts[other]))
+
+    def adjacent(
+        self,
+        skill: str,
+        limit: int = 10,
+        metric: str = "pmi",
+        min_count: int = DEFAULT_MIN_COUNT,
+        exclude: Iterable[str] = (),
+    ) -> List[Dict]:
+        """Skills that co-occur with ``skill``, strongest first"""
+        if metric not in ADJACENCY_METRICS:
+            raise ValueError(f"metric must be one of {ADJACENCY_METRICS}")
+        skill_id = next(iter(canonical_skill_set([skill])), "")
+        excluded = canonical_skill_set(exclude) | {skill_id}
+        with self._lock:
+            row = self._rows.get(skill_id)
+            if not row:
+                return []
+            scored = [
+                {
+                    "skill": other,
+                    "count": together,
+                    "score": round(self._score(skill_id, other, together, metric), 4),
+                    "conditional_probability": round(together / self._skill_counts[skill_id], 4),
+                }
+                for other, together in row.items()
+                if together >= min_count and other not in excluded
+            ]
+        scored.sort(key=lambda item: (-item["score"], -item["count"], item["skill"]))
+        return scored[:limit]
+
+    def strongest_link(self, skill: str, known: Iterable[str], min_count: int = DEFAULT_MIN_COUNT) -> Optional[Tuple[str, float]]:
+        """The known skill whose holders most often also have ``skill``, with P(skill | known skill)"""
+        with self._lock:
+            row = self._rows.get(skill)
+            if not row:
+                return None
+            best: Optional[Tuple[str, float]] = None
+            for other in known:
+                together = row.get(other, 0)
+                if together >= min_count:
+                    probability = together / self._skill_counts[other]
+                    if best is None or probability > best[1]:
+                        best = (other, probability)
+            return best
+
+    def stats(self) -> Dict:
+        with self._lock:
+            pairs = sum(len(row) for row in self._rows.values()) // 2
+            return {"documents": self.documents, "skills": len(self._skill_counts), "pairs": pairs}
+
+
+# Global instance
+_skill_graph_instance = None
+
+def get_skill_graph() -> SkillCooccurrence:
+    """Get or create the shared co-occurrence graph (persisted when SKILL_GRAPH_PATH is set)"""
+    global _skill_graph_instance
+    if _skill_graph_instance is None:
+        _skill_graph_instance = SkillCooccurrence(
+            path=os.getenv("SKILL_GRAPH_PATH") or None,
+            flush_interval=float(os.getenv("SKILL_GRAPH_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL)),
+        )
+    return _skill_graph_instance
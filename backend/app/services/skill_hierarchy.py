@@ -0,0 +1,104 @@
+"""
+Skill Hierarchy - specific skills under the general skills they demonstrate (pandas -> python)
+The DAG's transitive closure is precomputed into registry bitmasks, so finding the held
+descendants of a required skill is one AND
+"""
+
+from typing import Dict, Iterable, List, Set
+
+from .skill_aliases import canonicalize_skill
+from .skill_ids import SkillRegistry, get_skill_registry
+
+# Canonical skill -> more general skills it gives partial credit toward. Must stay acyclic.
+SKILL_PARENTS: Dict[str, List[str]] = {
+    "pandas": ["python", "data preprocessing"],
+    "numpy": ["python"],
+    "matplotlib": ["python", "data visualization"],
+    "scikit-learn": ["python", "machine learning"],
+    "tensorflow": ["deep learning"],
+    "pytorch": ["deep learning"],
+    "deep learning": ["machine learning"],
+    "python": ["programming"],
+    "javascript": ["programming"],
+    "postgresql": ["sql", "databases"],
+    "mysql": ["sql", "databases"],
+    "mongodb": ["databases"],
+    "tableau": ["data visualization"],
+    "powerbi": ["data visualization"],
+    "git": ["version control"],
+    "aws": ["cloud platforms"],
+    "probability": ["statistics"],
+    "penetration testing": ["network security"],
+    "forensics": ["incident response"],
+    "regulatory compliance": ["compliance"],
+}
+
+# Most score credited to a required skill the user lacks but holds a descendant of; weaker
+# specializations credit their own score
+DESCENDANT_CREDIT = 0.5
+
+
+class SkillHierarchy:
+    """Ancestor/descendant closure of a skill DAG as bitmasks over skill registry IDs"""
+
+    def __init__(self, parents: Dict[str, Iterable[str]], registry: SkillRegistry):
+        self.registry = registry
+        graph: Dict[str, Set[str]] = {}
+        for child, child_parents in parents.items():
+            graph.setdefault(canonicalize_skill(child), set()).update(canonicalize_skill(p) for p in child_parents)
+
+        ancestors: Dict[str, Set[str]] = {}
+        visiting: Set[str] = set()
+
+        def closure(skill: str) -> Set[str]:
+            if skill in ancestors:
+                return ancestors[skill]
+            if skill in visiting:
+                raise ValueError(f"Skill hierarchy has a cycle through '{skill}'")
+            visiting.add(skill)
+            found: Set[str] = set()
+            for parent in graph.get(skill, ()):
+                found.add(parent)
+                found |= closure(parent)
+            visiting.discard(skill)
+            ancestors[skill] = found
+            return found
+
+        self._ancestors: Dict[int, int] = {}
+        self._descendants: Dict[int, int] = {}
+        for skill in graph:
+            skill_id = registry.intern(skill)
+            for ancestor in closure(skill):
+                ancestor_id = registry.intern(ancestor)
+                self._ancestors[skill_id] = self._ancestors.get(skill_id, 0) | 1 << ancestor_id
+                self._descendants[ancestor_id] = self._descendants.get(ancestor_id, 0) | 1 << skill_id
+
+    def ancestors_mask(self, skill_id: int) -> int:
+        return self._ancestors.get(skill_id, 0)
+
+    def descendants_mask(self, skill_id: int) -> int:
+        return self._descendants.get(skill_id, 0)
+
+    def held_descendants(self, skill_id: int, held_mask: int) -> int:
+        """Bitmask of the held skills that are (transitive) specializations of ``skill_id``"""
+        return self._descendants.get(skill_id, 0) & held_mask
+
+    def credit(self, credited_by: int, scores: Dict[str, float]) -> float:
+        """Score credited for the held specializations in ``credited_by`` (canonical ``scores``)"""
+        best = max((scores.get(skill, 0.0) for skill in self.registry.names(credited_by)), default=0.0)
+        return min(DESCENDANT_CREDIT, best)
+
+    def ancestors(self, skill: str) -> List[str]:
+        skill_id = self.registry.lookup(skill)
+        return self.registry.names(self.ancestors_mask(skill_id)) if skill_id is not None else []
+
+
+# Global instance
+_skill_hierarchy_instance = None
+
+def get_skill_hierarchy() -> SkillHierarchy:
+    """Get or build the closure of SKILL_PARENTS"""
+    global _skill_hierarchy_instance
+    if _skill_hierarchy_instance is None:
+        _skill_hierarchy_instance = SkillHierarchy(SKILL_PARENTS, get_skill_registry())
+    return _skill_hierarchy_instance
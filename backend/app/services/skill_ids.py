@@ -0,0 +1,117 @@
+"""
+Skill IDs - process-wide registry interning canonical skills to small integers
+Skill sets become int bitmasks (bit i = skill i) or NumPy bool rows, so matching is bitwise
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .skill_aliases import SKILL_ALIASES, canonicalize_skill
+
+
+class SkillRegistry:
+    """Append-only canonical skill <-> integer ID table.
+
+    IDs never change once assigned, so masks built earlier stay valid as the registry grows.
+    Lookups are lock-free; only interning a new skill takes the lock.
+    """
+
+    def __init__(self, skills: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+        for skill in skills:
+            self.intern(skill)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, skill: str) -> int:
+        """ID for ``skill``, assigning the next free one when it is new"""
+        canonical = canonicalize_skill(skill)
+        skill_id = self._ids.get(canonical)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(canonical)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(canonical)
+                    self._ids[canonical] = skill_id
+        return skill_id
+
+    def lookup(self, skill: str) -> Optional[int]:
+        """ID for ``skill`` without interning it; None when unregistered"""
+        return self._ids.get(canonicalize_skill(skill))
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def mask(self, skills: Iterable[str], intern: bool = False) -> int:
+        """Bitmask of ``skills``. Unregistered skills are skipped unless ``intern`` is set:
+        they cannot overlap any mask built from registered skills, and skipping them keeps
+        free text from growing the registry."""
+        mask = 0
+        for skill in skills or []:
+            if not skill or not skill.strip():
+                continue
+            skill_id = self.intern(skill) if intern else self.lookup(skill)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """Canonical skills in ``mask``, in ID order"""
+        found = []
+        while mask:
+            low = mask & -mask
+            found.append(self._names[low.bit_length() - 1])
+            mask ^= low
+        return found
+
+    def bool_array(self, skills: Iterable[str], size: Optional[int] = None):
+        """NumPy bool vector over registry IDs (length ``size``, default the current registry size)"""
+        vector = np.zeros(size or len(self), dtype=bool)
+        for skill in skills or []:
+            skill_id = self.lookup(skill) if skill else None
+            if skill_id is not None and skill_id < len(vector):
+                vector[skill_id] = True
+        return vector
+
+    def bool_matrix(self, profiles: Sequence[Iterable[str]], size: Optional[int] = None):
+        """Profiles x skills NumPy bool matrix, one row per skill set"""
+        width = size or len(self)
+        matrix = np.zeros((len(profiles), width), dtype=bool)
+        for row, skills in enumerate(profiles):
+            ids = [i for i in (self.lookup(s) for s in skills or [] if s) if i is not None and i < width]
+            matrix[row, ids] = True
+        return matrix
+
+    def mask_to_array(self, mask: int, size: Optional[int] = None):
+        """Convert an int bitmask to a NumPy bool vector over registry IDs"""
+        width = size or len(self)
+        raw = np.frombuffer(mask.to_bytes((width + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(raw, bitorder="little")[:width].astype(bool)
+
+
+def popcount(mask: int) -> int:
+    return mask.bit_count()
+
+
+# Global instance, seeded with every canonical skill so their IDs are stable across processes
+_skill_registry_instance = None
+_skill_registry_lock = threading.Lock()
+
+def get_skill_registry() -> SkillRegistry:
+    """Get or create the process-wide skill registry"""
+    global _skill_registry_instance
+    if _skill_registry_instance is None:
+        with _skill_registry_lock:
+            if _skill_registry_instance is None:
+                _skill_registry_instance = SkillRegistry(SKILL_ALIASES)
+    return _skill_registry_instance
@@ -0,0 +1,136 @@
+"""
+Skill Matcher - Aho-Corasick multi-pattern matcher for rule-based skill extraction
+Finds every lexicon entry in a single pass over the text, respecting word boundaries
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+@dataclass(frozen=True)
+class SkillMatch:
+    """A single lexicon hit inside a text"""
+    start: int
+    end: int  # exclusive
+    pattern: str
+    skill: str
+
+
+class SkillMatcher:
+    """Compiled Aho-Corasick automaton over a skill lexicon.
+
+    ``patterns`` maps a surface form (as it appears in normalized text) to the
+    skill label reported for it, so aliases can resolve to one skill.
+    """
+
+    def __init__(self, patterns: Dict[str, str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[int]] = [[]]
+        self._patterns: List[str] = []
+        self._skills: List[str] = []
+
+        for pattern, skill in patterns.items():
+            if pattern:
+                self._add(pattern, skill)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def patterns(self) -> List[str]:
+        """Every surface form the matcher recognizes"""
+        return list(self._patterns)
+
+    @property
+    def entries(self) -> Dict[str, str]:
+        """Surface form -> skill for every pattern"""
+        return dict(zip(self._patterns, self._skills))
+
+    def _add(self, pattern: str, skill: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = nxt
+        self._outputs[node].append(len(self._patterns))
+        self._patterns.append(pattern)
+        self._skills.append(skill)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # Merge outputs along the failure chain so matching never walks it
+                inherited = self._outputs[self._fail[child]]
+                if inherited:
+                    self._outputs[child] = self._outputs[child] + inherited
+
+    def _on_boundary(self, text: str, start: int, end: int, pattern: str) -> bool:
+        if _is_word_char(pattern[0]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(pattern[-1]) and end < len(text) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def find_all(self, text: str) -> List[SkillMatch]:
+        """Return every whole-word lexicon hit in ``text`` (which should already be normalized)"""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        matches: List[SkillMatch] = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for idx in outputs[node]:
+                pattern = self._patterns[idx]
+                start = i - len(pattern) + 1
+                if self._on_boundary(text, start, i + 1, pattern):
+                    matches.append(SkillMatch(start, i + 1, pattern, self._skills[idx]))
+        return matches
+
+    def extract(self, text: str) -> Set[str]:
+        """Return the set of skills found in ``text``"""
+        return self.skills_of(self.find_all(text))
+
+    @staticmethod
+    def skills_of(matches: Iterable[SkillMatch]) -> Set[str]:
+        """Skills of ``matches``, dropping hits nested inside a longer hit (``c`` inside ``c++``)"""
+        found: Set[str] = set()
+        cover_start, cover_end = -1, -1
+        # Longest-first per start offset, so a containing hit is always seen first
+        for m in sorted(matches, key=lambda m: (m.start, -m.end)):
+            if cover_start <= m.start and m.end <= cover_end:
+                continue
+            if m.end > cover_end:
+                cover_start, cover_end = m.start, m.end
+            found.add(m.skill)
+        return found
+
+
+def build_skill_matcher(lexicon: Iterable[str], aliases: Optional[Dict[str, str]] = None) -> SkillMatcher:
+    """Compile a matcher from a lexicon of skills plus optional alias -> skill entries"""
+    patterns = {skill: skill for skill in lexicon}
+    if aliases:
+        patterns.update(aliases)
+    return SkillMatcher(patterns)
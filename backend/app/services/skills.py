@@ -1,6 +1,16 @@
 import re
 import os
-from typing import List
+import asyncio
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from .fuzzy_matcher import DEFAULT_FUZZY_THRESHOLD, TrigramIndex, candidate_terms
+from .extraction_confidence import ExtractionConfidence, score_extraction_confidence
+from .local_extractor import get_local_executor, get_local_model
+from .near_duplicate import get_near_duplicate_index, simhash
+from .skill_aliases import alias_surface_forms, canonical_skill_set
+from .skill_matcher import SkillMatcher, build_skill_matcher
 
 # Import Nemotron service
 try:
@@ -22,37 +32,221 @@ BASIC_SKILL_LEXICON = {
     "pandas",
     "numpy",
     "matplotlib",
+    "scikit-learn",
+    "postgresql",
+    "mysql",
+    "mongodb",
+    "machine learning",
+    "deep learning",
+    "tensorflow",
+    "pytorch",
+    "javascript",
+    "git",
+    "docker",
+    "aws",
 }
 
 
+# Extraction modes: "llm_first" tries Nemotron on every request and falls back to the lexicon,
+# "cascade" escalates to Nemotron only when the lexicon result looks incomplete,
+# "rule_only" never calls Nemotron
+EXTRACTION_MODES = ("llm_first", "cascade", "rule_only")
+DEFAULT_CASCADE_THRESHOLD = 0.5
+
+# Model backends the escalation tier can use: the remote Nemotron endpoint or the in-process local model
+EXTRACTION_BACKENDS = ("nemotron", "local")
+
+_skill_matcher = None
+_fuzzy_index = None
+
+# How many extractions each tier served: lexicon only, Nemotron, Nemotron failed -> lexicon,
+# a near-duplicate resume's stored Nemotron result, or the local model
+_tier_counts: Dict[str, int] = {"rule_based": 0, "llm": 0, "llm_failed": 0, "near_duplicate": 0, "local_model": 0}
+_tier_lock = threading.Lock()
+
+
 def normalize(text: str) -> str:
     return re.sub(r"\s+", " ", text.strip().lower())
 
 
-def extract_skills_from_text(text: str, user_known_skills: List[str]) -> List[str]:
-    """Extract skills using Nemotron AI or fallback to rule-based approach"""
+def normalize_lines(text: str) -> str:
+    """``normalize`` that keeps a line break as "\\n"; character positions match ``normalize``"""
+    return re.sub(r"[^\S\n]+", " ", re.sub(r"\s*\n\s*", "\n", text.strip().lower()))
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Get or compile the lexicon matcher used by rule-based extraction"""
+    global _skill_matcher
+    if _skill_matcher is None:
+        _skill_matcher = build_skill_matcher(BASIC_SKILL_LEXICON, aliases=alias_surface_forms(BASIC_SKILL_LEXICON))
+    return _skill_matcher
+
+
+def get_fuzzy_index() -> TrigramIndex:
+    """Get or build the trigram index over the same surface forms as the lexicon matcher"""
+    global _fuzzy_index
+    if _fuzzy_index is None:
+        _fuzzy_index = TrigramIndex(get_skill_matcher().entries)
+    return _fuzzy_index
+
+
+def resolve_fuzzy_threshold(fuzzy_threshold: Optional[float] = None) -> float:
+    """Requested similarity threshold, or the SKILL_FUZZY_THRESHOLD default; 0 disables fuzzy matching"""
+    if fuzzy_threshold is None:
+        fuzzy_threshold = float(os.getenv("SKILL_FUZZY_THRESHOLD", DEFAULT_FUZZY_THRESHOLD))
+    return min(max(fuzzy_threshold, 0.0), 1.0)
+
+
+def get_extraction_mode() -> str:
+    mode = os.getenv("SKILL_EXTRACTION_MODE", "llm_first").strip().lower()
+    return mode if mode in EXTRACTION_MODES else "llm_first"
+
+
+def get_extraction_backend() -> str:
+    backend = os.getenv("SKILL_EXTRACTION_BACKEND", "nemotron").strip().lower()
+    return backend if backend in EXTRACTION_BACKENDS else "nemotron"
+
+
+def get_cascade_threshold() -> float:
+    return float(os.getenv("SKILL_EXTRACTION_CASCADE_THRESHOLD", DEFAULT_CASCADE_THRESHOLD))
+
+
+def record_extraction_tier(tier: str) -> None:
+    with _tier_lock:
+        _tier_counts[tier] = _tier_counts.get(tier, 0) + 1
+
+
+def get_extraction_stats() -> Dict:
+    """Per-tier extraction counters plus the active configuration"""
+    with _tier_lock:
+        counts = dict(_tier_counts)
+    return {
+        "mode": get_extraction_mode(),
+        "backend": get_extraction_backend(),
+        "cascade_threshold": get_cascade_threshold(),
+        "nemotron_enabled": nemotron_enabled(),
+        "local_model_loaded": get_extraction_backend() == "local" and get_local_model() is not None,
+        "tier_counts": counts,
+        "total": sum(counts.values()),
+    }
+
+
+def rule_based_confidence(text: str) -> ExtractionConfidence:
+    """How completely the lexicon alone covers the skills in ``text``"""
+    matcher = get_skill_matcher()
+    return score_extraction_confidence(text or "", matcher.find_all(normalize(text or "")), matcher.patterns)
+
+
+def should_escalate_to_llm(text: str) -> bool:
+    """Whether ``text`` should go to the model backend under the configured extraction mode"""
+    if not model_backend_enabled():
+        return False
+    mode = get_extraction_mode()
+    if mode == "rule_only":
+        return False
+    if mode == "cascade":
+        return rule_based_confidence(text).score < get_cascade_threshold()
+    return True
+
+
+def nemotron_enabled() -> bool:
+    """Whether the remote Nemotron extractor can be used in this process"""
+    return NEMOTRON_AVAILABLE and bool(os.getenv("NVIDIA_API_KEY"))
+
+
+def model_backend_enabled() -> bool:
+    """Whether the configured model backend (Nemotron or the local model) can be used"""
+    if get_extraction_backend() == "local":
+        return get_local_model() is not None
+    return nemotron_enabled()
+
+
+def extract_skills_with_local_model(text: str, user_known_skills: List[str]) -> Optional[List[str]]:
+    """Extract skills with the in-process model; returns None when it is unavailable, fails or finds nothing"""
+    model = get_local_model()
+    if model is None:
+        return None
+    try:
+        return model.extract(text, user_known_skills) or None
+    except Exception as e:
+        print(f"⚠️ Local skill model failed, falling back to rule-based: {e}")
+    return None
+
+
+def extract_skills_with_nemotron(text: str, user_known_skills: List[str]) -> Optional[List[str]]:
+    """Extract skills with Nemotron AI; returns None when it is unavailable, fails or finds nothing"""
+    if not nemotron_enabled():
+        return None
+    try:
+        nemotron = get_nemotron_service()
+        ai_skills = nemotron.extract_skills_from_text(text, user_known_skills)
+        if ai_skills:
+            print(f"✅ Using Nemotron AI for skill extraction: {len(ai_skills)} skills found")
+            return sorted(canonical_skill_set(ai_skills))
+    except Exception as e:
+        print(f"⚠️ Nemotron AI failed, falling back to rule-based: {e}")
+    return None
+
+
+def extract_skills_rule_based(text: str, user_known_skills: List[str], fuzzy_threshold: Optional[float] = None) -> List[str]:
+    """Extract lexicon skills (exact, then fuzzy for the remaining words) plus the user's own skills"""
+    text_lines = normalize_lines(text or "")
+    matcher = get_skill_matcher()
+    # Exact hits may wrap across lines ("machine\nlearning" in PDF text); fuzzy n-grams may not
+    matches = matcher.find_all(text_lines.replace("\n", " "))
+    found = matcher.skills_of(matches)
+    threshold = resolve_fuzzy_threshold(fuzzy_threshold)
+    if threshold > 0 and text_lines:
+        terms = candidate_terms(text_lines, covered=[(m.start, m.end) for m in matches])
+        found.update(m.skill for m in get_fuzzy_index().match_terms(terms, threshold))
+    found |= canonical_skill_set(user_known_skills)
+    return sorted(found)
+
+
+def extract_skills_from_text(text: str, user_known_skills: List[str], fuzzy_threshold: Optional[float] = None) -> List[str]:
+    """Extract skills using the model backend or the rule-based lexicon, depending on the extraction mode"""
     
-    # Try Nemotron AI first if available and API key is set
-    if NEMOTRON_AVAILABLE and os.getenv("NVIDIA_API_KEY"):
-        try:
-            nemotron = get_nemotron_service()
-            ai_skills = nemotron.extract_skills_from_text(text, user_known_skills)
-            if ai_skills:
-                print(f"✅ Using Nemotron AI for skill extraction: {len(ai_skills)} skills found")
-                return ai_skills
-        except Exception as e:
-            print(f"⚠️ Nemotron AI failed, falling back to rule-based: {e}")
+    # Escalate to the model backend when the mode (and, in cascade mode, the lexicon confidence) calls for it
+    escalate = should_escalate_to_llm(text)
+    if escalate and get_extraction_backend() == "local":
+        local_skills = extract_skills_with_local_model(text, user_known_skills)
+        if local_skills:
+            record_extraction_tier("local_model")
+            return local_skills
+        record_extraction_tier("llm_failed")
+    elif escalate:
+        index = get_near_duplicate_index()
+        fingerprint = simhash(text) if index is not None else None
+        if fingerprint is not None:
+            match = index.nearest(fingerprint)
+            if match is not None:
+                # Start from the near-identical resume's LLM result; the lexicon adds what this one changed
+                record_extraction_tier("near_duplicate")
+                return sorted(set(match.skills).union(extract_skills_rule_based(text, user_known_skills, fuzzy_threshold)))
+
+        ai_skills = extract_skills_with_nemotron(text, user_known_skills)
+        if ai_skills:
+            record_extraction_tier("llm")
+            if fingerprint is not None:
+                # The requester's own skills are not part of the resume and must not leak to look-alikes
+                index.add(fingerprint, sorted(set(ai_skills) - canonical_skill_set(user_known_skills)))
+            return ai_skills
+        record_extraction_tier("llm_failed")
+    else:
+        record_extraction_tier("rule_based")
     
     # Fallback to rule-based extraction
     print("📝 Using rule-based skill extraction")
-    text_norm = normalize(text)
-    found = set()
-    for token in BASIC_SKILL_LEXICON:
-        if token in text_norm:
-            found.add(token)
-    for s in user_known_skills or []:
-        if s:
-            found.add(normalize(s))
-    return sorted(found)
+    return extract_skills_rule_based(text, user_known_skills, fuzzy_threshold)
+
 
+async def run_extraction(extract: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call a blocking extraction function from an async endpoint.
 
+    With the local backend the model is CPU-bound, so the call runs on the local model's
+    thread pool instead of holding the event loop.
+    """
+    call = partial(extract, *args, **kwargs)
+    if get_extraction_backend() == "local":
+        return await asyncio.get_running_loop().run_in_executor(get_local_executor(), call)
+    return call()
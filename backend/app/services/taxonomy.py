@@ -0,0 +1,272 @@
+"""
+Taxonomy - role, AI-risk, job-market and problem tables loaded from versioned data files
+JSON sources in data/taxonomy are compiled to one marshal file for fast cold starts, and a
+polling watcher swaps in edited taxonomies without a restart
+"""
+
+import os
+import sys
+import json
+import marshal
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+TAXONOMY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "taxonomy")
+
+# Source file name (without .json) -> Taxonomy field
+TAXONOMY_SOURCES: Dict[str, str] = {
+    "role_skills": "role_to_skills",
+    "ai_replacement": "ai_replacement",
+    "job_market": "job_market",
+    "problem_bank": "problem_bank",
+}
+
+COMPILED_NAME = "taxonomy.bin"
+COMPILED_FORMAT = 1
+
+# Roles the services fall back to, so every taxonomy must define them
+DEFAULT_ROLE = "data analyst"
+DEFAULT_PROBLEM_ROLE = "data_analyst"
+
+# Fields every entry of a table must carry (problem_bank: every problem), as the services read them
+_NUMBER = (int, float)
+TABLE_FIELDS: Dict[str, Dict[str, Any]] = {
+    "ai_replacement": {
+        "automation_risk": _NUMBER, "ai_resistant_skills": list, "ai_vulnerable_skills": list,
+        "research_papers": list, "strategies": list,
+    },
+    "job_market": {
+        "growth_rate": _NUMBER, "avg_salary": _NUMBER, "competition_level": str,
+        "top_skills_demand": list, "emerging_skills": list,
+    },
+    "problem_bank": {"id": str, "skills_required": list, "difficulty": str},
+}
+
+
+@dataclass(frozen=True)
+class Taxonomy:
+    role_to_skills: Dict[str, Dict[str, Dict]]
+    ai_replacement: Dict[str, Dict]
+    job_market: Dict[str, Dict]
+    problem_bank: Dict[str, List[Dict]]
+    versions: Dict[str, int] = field(default_factory=dict)  # source name -> its "version" field
+    fingerprint: str = ""  # hash of the JSON sources this was loaded from
+    source: str = "json"  # "json" or "compiled"
+
+
+def _validate_entry(table: str, name: str, entry: Any) -> None:
+    if not isinstance(entry, dict):
+        raise ValueError(f"{table}['{name}'] must be an object")
+    for key, kind in TABLE_FIELDS[table].items():
+        if not isinstance(entry.get(key), kind):
+            raise ValueError(f"{table}['{name}'] needs a '{key}' field")
+
+
+def validate_taxonomy(taxonomy: Taxonomy) -> None:
+    """Raise ValueError when the tables are inconsistent with what the services look up"""
+    if DEFAULT_ROLE not in taxonomy.role_to_skills:
+        raise ValueError(f"role_skills must define the default role '{DEFAULT_ROLE}'")
+    for role, skills in taxonomy.role_to_skills.items():
+        for skill, info in skills.items():
+            if not isinstance(info, dict) or not 0.0 < float(info.get("required_score", 0.7)) <= 1.0:
+                raise ValueError(f"role_skills['{role}']['{skill}'] needs a required_score in (0, 1]")
+    if DEFAULT_ROLE not in taxonomy.ai_replacement:
+        raise ValueError(f"ai_replacement must define the default role '{DEFAULT_ROLE}'")
+    if set(taxonomy.ai_replacement) != set(taxonomy.job_market):
+        raise ValueError("ai_replacement and job_market must define the same roles")
+    if DEFAULT_PROBLEM_ROLE not in taxonomy.problem_bank:
+        raise ValueError(f"problem_bank must define the default role '{DEFAULT_PROBLEM_ROLE}'")
+    for table in ("ai_replacement", "job_market"):
+        for role, entry in getattr(taxonomy, table).items():
+            _validate_entry(table, role, entry)
+    for role, problems in taxonomy.problem_bank.items():
+        if not isinstance(problems, list):
+            raise ValueError(f"problem_bank['{role}'] must be a list of problems")
+        for i, problem in enumerate(problems):
+            _validate_entry("problem_bank", f"{role}'][{i}", problem)
+
+
+def _source_paths(directory: str) -> Dict[str, str]:
+    return {name: os.path.join(directory, f"{name}.json") for name in TAXONOMY_SOURCES}
+
+
+def source_fingerprint(directory: str = TAXONOMY_DIR) -> str:
+    """Hash of the raw JSON sources; cheap, since nothing is parsed"""
+    digest = hashlib.sha256()
+    for name, path in _source_paths(directory).items():
+        with open(path, "rb") as f:
+            digest.update(name.encode("utf-8") + b"\0" + f.read() + b"\0")
+    return digest.hexdigest()[:16]
+
+
+def load_json_taxonomy(directory: str = TAXONOMY_DIR) -> Taxonomy:
+    tables: Dict[str, Dict] = {}
+    versions: Dict[str, int] = {}
+    for name, path in _source_paths(directory).items():
+        with open(path, encoding="utf-8") as f:
+            document = json.load(f)
+        tables[TAXONOMY_SOURCES[name]] = document["data"]
+        versions[name] = int(document.get("version", 1))
+    taxonomy = Taxonomy(**tables, versions=versions, fingerprint=source_fingerprint(directory), source="json")
+    validate_taxonomy(taxonomy)
+    return taxonomy
+
+
+def compile_taxonomy(directory: str = TAXONOMY_DIR, output: Optional[str] = None) -> str:
+    """Build step: validate the JSON sources and write them as one marshal file"""
+    taxonomy = load_json_taxonomy(directory)
+    output = output or os.path.join(directory, COMPILED_NAME)
+    header = {
+        "format": COMPILED_FORMAT,
+        "python": list(sys.version_info[:2]),  # marshal is only stable within a Python version
+        "fingerprint": taxonomy.fingerprint,
+        "versions": taxonomy.versions,
+    }
+    tables = {name: getattr(taxonomy, name) for name in TAXONOMY_SOURCES.values()}
+    tmp = f"{output}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(marshal.dumps((header, tables)))
+    os.replace(tmp, output)
+    return output
+
+
+def load_compiled_taxonomy(directory: str = TAXONOMY_DIR) -> Optional[Taxonomy]:
+    """The compiled taxonomy, or None when it is missing, stale or built by another Python"""
+    path = os.path.join(directory, COMPILED_NAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        # One loads() over the whole file; marshal.load() on a file object is ~15x slower
+        with open(path, "rb") as f:
+            header, tables = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        print(f"⚠️ Ignoring compiled taxonomy {path}: {e}")
+        return None
+    if (
+        header.get("format") != COMPILED_FORMAT
+        or header.get("python") != list(sys.version_info[:2])
+        or header.get("fingerprint") != source_fingerprint(directory)
+    ):
+        return None
+    return Taxonomy(**tables, versions=header["versions"], fingerprint=header["fingerprint"], source="compiled")
+
+
+def load_taxonomy(directory: str = TAXONOMY_DIR) -> Taxonomy:
+    """Load from the compiled file when it matches the sources, else parse the JSON"""
+    return load_compiled_taxonomy(directory) or load_json_taxonomy(directory)
+
+
+# Global instance
+_taxonomy_instance: Optional[Taxonomy] = None
+_taxonomy_lock = threading.Lock()
+_listeners: List[Tuple[Callable[[Taxonomy], Any], Callable[[Any], None]]] = []
+
+
+def taxonomy_dir() -> str:
+    return os.getenv("TAXONOMY_DIR") or TAXONOMY_DIR
+
+
+def get_taxonomy() -> Taxonomy:
+    """Get or load the current taxonomy"""
+    global _taxonomy_instance
+    if _taxonomy_instance is None:
+        with _taxonomy_lock:
+            if _taxonomy_instance is None:
+                _taxonomy_instance = load_taxonomy(taxonomy_dir())
+    return _taxonomy_instance
+
+
+def on_taxonomy_change(build: Callable[[Taxonomy], Any], install: Callable[[Any], None]) -> None:
+    """Rebuild a derived index for each new taxonomy.
+
+    ``build`` computes the index from a taxonomy without side effects and may raise;
+    ``install`` swaps a built index in and must not fail.
+    """
+    _listeners.append((build, install))
+
+
+def set_taxonomy(taxonomy: Taxonomy) -> None:
+    """Validate ``taxonomy`` and build every derived index from it, then swap them all in.
+
+    Nothing changes when validation or any build fails, so a bad taxonomy can never be
+    left half-applied.
+    """
+    global _taxonomy_instance
+    validate_taxonomy(taxonomy)
+    with _taxonomy_lock:
+        built = [(install, build(taxonomy)) for build, install in _listeners]
+        _taxonomy_instance = taxonomy
+        for install, index in built:
+            install(index)
+
+
+def reload_taxonomy() -> bool:
+    """Reload from disk when the sources changed; False (and the old taxonomy kept) otherwise"""
+    directory = taxonomy_dir()
+    try:
+        if _taxonomy_instance is not None and source_fingerprint(directory) == _taxonomy_instance.fingerprint:
+            return False
+        set_taxonomy(load_taxonomy(directory))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"⚠️ Taxonomy reload failed, keeping version {_taxonomy_instance and _taxonomy_instance.versions}: {e}")
+        return False
+    print(f"✅ Taxonomy reloaded: {_taxonomy_instance.versions}")
+    return True
+
+
+class TaxonomyWatcher:
+    """Daemon thread that polls the taxonomy sources' modification times and reloads on change"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._mtimes = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, float]:
+        mtimes = {}
+        for path in [*_source_paths(taxonomy_dir()).values(), os.path.join(taxonomy_dir(), COMPILED_NAME)]:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = -1
+        return mtimes
+
+    def check(self) -> bool:
+        """Reload if any source changed since the last check"""
+        mtimes = self._snapshot()
+        if mtimes == self._mtimes:
+            return False
+        self._mtimes = mtimes
+        return reload_taxonomy()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                # A bad poll (unreadable file, listener bug) must not end hot reload for the process
+                print(f"⚠️ Taxonomy watcher poll failed, will retry: {e}")
+
+    def start(self) -> "TaxonomyWatcher":
+        self._thread = threading.Thread(target=self._run, name="taxonomy-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+_watcher: Optional[TaxonomyWatcher] = None
+
+
+def start_taxonomy_watcher() -> Optional[TaxonomyWatcher]:
+    """Start polling every TAXONOMY_RELOAD_INTERVAL seconds (0 or unset disables hot reload)"""
+    global _watcher
+    interval = float(os.getenv("TAXONOMY_RELOAD_INTERVAL", 0) or 0)
+    if interval > 0 and _watcher is None:
+        get_taxonomy()
+        _watcher = TaxonomyWatcher(interval).start()
+    return _watcher
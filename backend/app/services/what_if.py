@@ -0,0 +1,275 @@
+"""
+What-If - "next best skill" simulator over the role requirement matrix
+Every one- and two-skill addition is scored at once as deltas against the roles x skills arrays
+"""
+
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .gaps import resolve_role
+from .role_fit import RoleMatrix, get_role_matrix
+
+# Efficiencies and gains are compared at this precision so float noise cannot reorder exact ties
+RANK_DECIMALS = 9
+
+
+@dataclass
+class SkillAddition:
+    skills: List[str]
+    gap_reduction: float  # share of the target roles' requirements closed, averaged over the targets
+    fit_gain: float  # mastery-weighted fit gained, averaged over the targets
+    mastery_points: float  # points to learn the skills up to the highest target requirement
+    gain_per_mastery_point: float
+    roles_improved: List[str]
+
+
+@dataclass
+class WhatIfResult:
+    target_roles: List[str]
+    singles: List[SkillAddition]
+    pairs: List[SkillAddition]
+
+
+def _target_indices(matrix: RoleMatrix, roles: Optional[Sequence[str]]) -> List[int]:
+    """Matrix rows for free-text target roles; every role when none are given"""
+    if not roles:
+        return list(range(len(matrix.roles)))
+    index = {role: r for r, role in enumerate(matrix.roles)}
+    targets = dict.fromkeys(resolve_role(role).role for role in roles)
+    return [index[role] for role in targets if role in index]
+
+
+class SkillSimulator:
+    """Ranks skill additions by gap reduction per mastery point for a set of target roles.
+
+    Learning skill s to the highest target requirement closes, in each target role r, the
+    share (1 - coverage[r, s]) / skills_in_r of that role's requirements and costs the
+    largest remaining mastery[r, s] * (1 - coverage[r, s]) across the targets. Learning a
+    specialization (pandas) also credits its unheld ancestors (python) as in
+    ``RoleMatrix.user_vector``, which adds to its gain at no extra cost. Skills fill separate
+    matrix columns, so a pair's gain and cost are the sums of its two skills', corrected only
+    for the few pairs whose credit overlaps, and the whole pair table is one broadcast.
+    """
+
+    def __init__(self, matrix: Optional[RoleMatrix] = None):
+        self.matrix = matrix or get_role_matrix()
+
+    def simulate(
+        self,
+        current_scores: Dict[str, float],
+        roles: Optional[Sequence[str]] = None,
+        limit: int = 5,
+        pairs: bool = True,
+    ) -> WhatIfResult:
+        targets = _target_indices(self.matrix, roles)
+        vector = self.matrix.user_vector(current_scores)
+        if not targets or limit <= 0:
+            return WhatIfResult([self.matrix.roles[r] for r in targets], [], [])
+        credit = self._ancestor_credit(current_scores, vector, targets)
+        if NUMPY_AVAILABLE:
+            singles, pair_list = self._simulate_numpy(vector, targets, limit, pairs, credit)
+        else:
+            singles, pair_list = self._simulate_python(vector, targets, limit, pairs, credit)
+        return WhatIfResult([self.matrix.roles[r] for r in targets], singles, pair_list)
+
+    def _ancestor_credit(self, current_scores, vector, targets) -> Dict[int, Dict[int, float]]:
+        """Matrix skill -> the other matrix skills whose score learning it would raise, with the raised scores"""
+        m = self.matrix
+        credit: Dict[int, Dict[int, float]] = {}
+        for s, skill in enumerate(m.skills):
+            skill_id = m._registry.lookup(skill)
+            if skill_id is None or not m._hierarchy.ancestors_mask(skill_id):
+                continue
+            level = max(m._required[r][s] for r in targets)
+            if level <= vector[s]:
+                continue
+            learned = m.user_vector({**current_scores, skill: level})
+            raised = {a: score for a, score in enumerate(learned) if a != s and score > vector[a]}
+            if raised:
+                credit[s] = raised
+        return credit
+
+    def _credit_gain(self, vector, raised: Dict[int, float], targets) -> Tuple[float, float, Set[int]]:
+        """(gap reduction, fit gain, target roles improved) from raising skills to the ``raised`` scores"""
+        m = self.matrix
+        gain = fit = 0.0
+        improved: Set[int] = set()
+        for r in targets:
+            count = sum(1 for x in m._required[r] if x > 0)
+            total = sum(m._mastery[r])
+            for a, score in raised.items():
+                required = m._required[r][a]
+                if required <= 0:
+                    continue
+                share = min(score / required, 1.0) - min(vector[a] / required, 1.0)
+                if share <= 0:
+                    continue
+                gain += share / count
+                fit += (m._mastery[r][a] / total if total else 0.0) * share
+                improved.add(r)
+        return gain / len(targets), fit / len(targets), improved
+
+    def _pair_correction(self, vector, credit, extras, s: int, t: int, targets) -> Optional[Tuple[float, float]]:
+        """Gain and fit to add to the sum of two skills' own figures when their credit overlaps"""
+        a, b = credit.get(s, {}), credit.get(t, {})
+        if not (a.keys() & b.keys() or t in a or s in b):
+            return None
+        # A skill learned outright needs no credit, and a skill credited twice counts once
+        merged = {c: max(a.get(c, 0.0), b.get(c, 0.0)) for c in a.keys() | b.keys() if c not in (s, t)}
+        gain, fit, _ = self._credit_gain(vector, merged, targets)
+        none = (0.0, 0.0, set())
+        return (
+            gain - extras.get(s, none)[0] - extras.get(t, none)[0],
+            fit - extras.get(s, none)[1] - extras.get(t, none)[1],
+        )
+
+    def _addition(self, skills, gain, fit, cost, roles_improved) -> SkillAddition:
+        return SkillAddition(
+            skills=skills,
+            gap_reduction=round(float(gain), 4),
+            fit_gain=round(float(fit), 4),
+            mastery_points=round(float(cost), 1),
+            gain_per_mastery_point=round(float(gain) / float(cost), 6),
+            roles_improved=roles_improved,
+        )
+
+    @staticmethod
+    def _rank(efficiency, gain, names: List, limit: int) -> List[int]:
+        """Indices of the ``limit`` most efficient candidates, ties broken by gain then name"""
+        efficiency, gain = np.round(efficiency, RANK_DECIMALS), np.round(gain, RANK_DECIMALS)
+        if len(efficiency) > limit:
+            kth = efficiency[np.argpartition(-efficiency, limit - 1)[limit - 1]]
+            top = np.flatnonzero(efficiency >= kth)  # keep everything tied with the k-th
+        else:
+            top = np.arange(len(efficiency))
+        return sorted(top.tolist(), key=lambda i: (-efficiency[i], -gain[i], names[i]))[:limit]
+
+    def _simulate_numpy(self, vector, targets, limit, pairs, credit):
+        m = self.matrix
+        rows = np.asarray(targets, dtype=np.int64)
+        user = np.asarray(vector, dtype=np.float64)
+        required, mask = m.required[rows], m.mask[rows]
+        coverage = np.minimum(np.divide(user, required, out=np.ones_like(required), where=mask), 1.0)
+        missing_share = np.where(mask, 1.0 - coverage, 0.0)
+        counts = np.maximum(mask.sum(axis=1, keepdims=True), 1)
+
+        gain = (missing_share / counts).mean(axis=0)
+        fit = (m.weights[rows] * missing_share).mean(axis=0)
+        cost = (m.mastery[rows] * missing_share).max(axis=0)
+        improves = missing_share > 0
+        extras = {s: self._credit_gain(vector, raised, targets) for s, raised in credit.items()}
+        for s, (extra_gain, extra_fit, _) in extras.items():
+            gain[s] += extra_gain
+            fit[s] += extra_fit
+        candidates = np.flatnonzero(cost > 0)
+        if not len(candidates):
+            return [], []
+
+        def roles_for(columns) -> List[str]:
+            hit = improves[:, columns].any(axis=1)
+            credited = set().union(*(extras[c][2] for c in columns if c in extras))
+            return [m.roles[r] for i, r in enumerate(targets) if hit[i] or r in credited]
+
+        g, f, c = gain[candidates], fit[candidates], cost[candidates]
+        names = [m.skills[s] for s in candidates]
+        # Ties are broken on names, as 1-tuples here and 2-tuples for pairs like the Python path
+        keys = [(name,) for name in names]
+        singles = [
+            self._addition([names[i]], g[i], f[i], c[i], roles_for([candidates[i]]))
+            for i in self._rank(g / c, g, keys, limit)
+        ]
+        if not pairs or len(candidates) < 2:
+            return singles, []
+
+        n = len(candidates)
+        a, b = np.triu_indices(n, k=1)
+        pair_gain, pair_fit, pair_cost = g[a] + g[b], f[a] + f[b], c[a] + c[b]
+        position = {s: i for i, s in enumerate(candidates.tolist())}
+        for s in credit:
+            i = position.get(s)
+            for j in range(n) if i is not None else ():
+                if j == i or (candidates[j] in credit and j < i):
+                    continue  # pairs of two credited skills are corrected once
+                correction = self._pair_correction(vector, credit, extras, s, int(candidates[j]), targets)
+                if correction is not None:
+                    lo, hi = min(i, j), max(i, j)
+                    k = lo * n - lo * (lo + 1) // 2 + hi - lo - 1  # row-major index into the triu pairs
+                    pair_gain[k] += correction[0]
+                    pair_fit[k] += correction[1]
+        pair_names = [(names[i], names[j]) for i, j in zip(a.tolist(), b.tolist())]
+        pair_list = [
+            self._addition(
+                [names[a[k]], names[b[k]]], pair_gain[k], pair_fit[k], pair_cost[k],
+                roles_for([candidates[a[k]], candidates[b[k]]]),
+            )
+            for k in self._rank(pair_gain / pair_cost, pair_gain, pair_names, limit)
+        ]
+        return singles, pair_list
+
+    def _simulate_python(self, vector, targets, limit, pairs, credit):
+        m = self.matrix
+        extras = {s: self._credit_gain(vector, raised, targets) for s, raised in credit.items()}
+        stats = []  # (name, gain, fit, cost, roles improved)
+        for s, skill in enumerate(m.skills):
+            gain = fit = cost = 0.0
+            improved = []
+            for r in targets:
+                required = m._required[r][s]
+                if required <= 0:
+                    continue
+                share = 1.0 - min(vector[s] / required, 1.0)
+                if share <= 0:
+                    continue
+                count = sum(1 for x in m._required[r] if x > 0)
+                total = sum(m._mastery[r])
+                gain += share / count
+                fit += (m._mastery[r][s] / total if total else 0.0) * share
+                cost = max(cost, m._mastery[r][s] * share)
+                improved.append(r)
+            if s in extras:
+                gain += extras[s][0] * len(targets)
+                fit += extras[s][1] * len(targets)
+                improved.extend(extras[s][2])
+            if cost > 0:
+                stats.append(((skill,), gain / len(targets), fit / len(targets), cost, improved))
+
+        def key(item):
+            return (-round(item[1] / item[3], RANK_DECIMALS), -round(item[1], RANK_DECIMALS), item[0])
+
+        singles = [
+            self._addition(list(names), gain, fit, cost, [m.roles[r] for r in targets if r in improved])
+            for names, gain, fit, cost, improved in sorted(stats, key=key)[:limit]
+        ]
+        if not pairs:
+            return singles, []
+        combined = []
+        for x, y in combinations(stats, 2):
+            gain, fit = x[1] + y[1], x[2] + y[2]
+            correction = self._pair_correction(
+                vector, credit, extras, m.skill_index[x[0][0]], m.skill_index[y[0][0]], targets,
+            )
+            if correction is not None:
+                gain, fit = gain + correction[0], fit + correction[1]
+            combined.append((x[0] + y[0], gain, fit, x[3] + y[3], set(x[4]) | set(y[4])))
+        pair_list = [
+            self._addition(list(names), gain, fit, cost, [m.roles[r] for r in targets if r in improved])
+            for names, gain, fit, cost, improved in sorted(combined, key=key)[:limit]
+        ]
+        return singles, pair_list
+
+
+def simulate_next_skills(
+    current_scores: Dict[str, float],
+    roles: Optional[Sequence[str]] = None,
+    limit: int = 5,
+    pairs: bool = True,
+) -> WhatIfResult:
+    """Top ``limit`` one- and two-skill additions for the target roles (all roles when none)"""
+    return SkillSimulator().simulate(current_scores, roles=roles, limit=limit, pairs=pairs)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: columnar NumPy course scoring vs. score_course over every candidate dict
+Run with: python bench_course_scoring.py [--sizes 1000 10000 100000] [--k 5]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.course_scoring import NUMPY_AVAILABLE, INDEXED_RELEVANCE, CourseColumns, top_k
+from backend.app.services.resources import score_course
+
+PROVIDERS = ["Coursera", "Udemy", "edX", "Khan Academy", "Pluralsight", "DataCamp"]
+SKILLS = ["python", "sql", "docker", "statistics", "tableau", "excel", "aws", "react"]
+PREFERENCES = dict(weekly_time_hours=5, free_preferred=True, provider_preferences=["edX", "DataCamp"])
+
+
+def synthetic_courses(count, seed=7):
+    """Courses that all teach the target skill, so every one is a ranking candidate"""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i + 1,
+            "provider": rng.choice(PROVIDERS),
+            "name": f"Course {i + 1}",
+            "skills": sorted({"python", *rng.sample(SKILLS, 2)}),
+            "rating": round(rng.uniform(3.0, 5.0), 1),
+            "duration_hours": rng.randint(1, 60),
+            "price": rng.choice(["Free", "Paid"]),
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_top_k(courses, skill, k):
+    """The pre-columnar path: score every dict, sort the whole list, slice"""
+    scored = [{**c, "score": score_course(c, skill, **PREFERENCES)} for c in courses]
+    scored.sort(key=lambda x: x["score"], reverse=True)
+    return [(c["id"], c["score"]) for c in scored[:k]]
+
+
+def columnar_top_k(columns, skill, k):
+    candidates = columns.for_skill(skill)
+    scores = columns.scores(candidates, INDEXED_RELEVANCE, **PREFERENCES)
+    best = top_k(scores, k, decimals=4)
+    return [(course_id, round(score, 4)) for course_id, score in zip(candidates.ids[best].tolist(), scores[best].tolist())]
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(sizes, k):
+    if not NUMPY_AVAILABLE:
+        print("❌ NumPy is required for the columnar path: pip install numpy")
+        return 1
+    print(f"⏱️  Course ranking benchmark: top {k} of N candidates for one skill (best of 5)")
+    print("=" * 78)
+    print(f"{'courses':>9} {'legacy ms':>10} {'columnar ms':>12} {'speedup':>8} {'build ms':>9}")
+    for size in sizes:
+        courses = synthetic_courses(size)
+        start = time.perf_counter()
+        columns = CourseColumns(
+            [(c["id"], c["provider"], c["rating"], c["duration_hours"], c["price"]) for c in courses],
+            sorted((s, c["id"]) for c in courses for s in c["skills"]),
+        )
+        build = time.perf_counter() - start
+        assert columnar_top_k(columns, "python", k) == legacy_top_k(courses, "python", k), "columnar ranking differs"
+        legacy = best_time(lambda: legacy_top_k(courses, "python", k), 3 if size <= 100_000 else 1)
+        columnar = best_time(lambda: columnar_top_k(columns, "python", k), 5)
+        print(f"{size:>9,} {legacy * 1e3:>10.2f} {columnar * 1e3:>12.3f} {legacy / columnar:>7.0f}x {build * 1e3:>9.0f}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 300_000])
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args(argv)
+    return run_benchmark(args.sizes, args.k)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
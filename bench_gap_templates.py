@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-role SkillGap templates vs. building every gap from scratch
+Run with: python bench_gap_templates.py
+"""
+
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.gaps import ROLE_TO_SKILLS, gaps_for_scores
+from backend.app.services.models import SkillGap
+from backend.app.services.skill_aliases import canonicalize_skill
+from backend.app.services.skill_evidence import proficiency_for_score
+from backend.app.services.skill_hierarchy import DESCENDANT_CREDIT, get_skill_hierarchy
+from backend.app.services.skill_ids import get_skill_registry
+
+REQUESTS = 2_000
+
+
+def legacy_gaps(scores, graded, required_skills, role):
+    """The per-skill loop gaps_for_scores used before templates (no co-occurrence links)"""
+    registry, hierarchy = get_skill_registry(), get_skill_hierarchy()
+    role_skills = ROLE_TO_SKILLS[role]
+    required_mask = registry.mask(required_skills, intern=True)
+    known_mask = registry.mask(scores)
+    held_mask = known_mask & required_mask
+    gaps = []
+    for skill in required_skills:
+        skill_id = canonicalize_skill(skill)
+        skill_info = role_skills.get(skill_id, {})
+        required_score = skill_info.get("required_score", 0.7)
+        registry_id = registry.intern(skill_id)
+        held = held_mask >> registry_id & 1
+        credited_by = 0 if held else hierarchy.held_descendants(registry_id, known_mask)
+        if held and skill_id in graded:
+            current_score = scores[skill_id]
+            proficiency_level = proficiency_for_score(current_score)
+            status = "Known" if current_score >= required_score else "Partial"
+        elif held:
+            current_score, proficiency_level, status = scores[skill_id], "Intermediate", "Known"
+        elif credited_by:
+            current_score = DESCENDANT_CREDIT
+            proficiency_level = proficiency_for_score(current_score)
+            status = "Known" if current_score >= required_score else "Partial"
+        else:
+            current_score, proficiency_level, status = 0.2, "Beginner", "Missing"
+        if status == "Missing":
+            recommendation = f"Start with {skill.title()} basics on Coursera"
+        elif status == "Partial" and credited_by:
+            via = ", ".join(s.title() for s in registry.names(credited_by))
+            recommendation = f"Build on your {via} experience to cover {skill.title()} more broadly"
+        elif status == "Partial":
+            recommendation = f"Build your {skill.title()} skills up to {skill_info.get('required_proficiency', 'Intermediate')} level"
+        else:
+            recommendation = f"Advance your {skill.title()} skills"
+        gaps.append(SkillGap(
+            skill=skill, status=status, proficiency_level=proficiency_level,
+            required_proficiency=skill_info.get("required_proficiency", "Intermediate"),
+            current_score=current_score, required_score=required_score,
+            reasoning=skill_info.get("reasoning", f"Essential skill for {role} role"),
+            recommendation=recommendation, mastery_points=skill_info.get("mastery_points", 100),
+        ))
+    return gaps
+
+
+def synthetic_requests(count, seed=11):
+    """(scores, graded, required skills, role) for users holding a random part of a role"""
+    rng = random.Random(seed)
+    skills = sorted({s for role in ROLE_TO_SKILLS.values() for s in role} | {"pandas", "postgresql", "tableau"})
+    requests = []
+    for _ in range(count):
+        role = rng.choice(sorted(ROLE_TO_SKILLS))
+        scores = {s: rng.choice([0.3, 0.5, 0.8, 0.95]) for s in rng.sample(skills, rng.randint(0, 8))}
+        graded = set(scores) if rng.random() < 0.5 else set()
+        if not graded:
+            scores = {s: 0.8 for s in scores}
+        requests.append((scores, graded, list(ROLE_TO_SKILLS[role]), role))
+    return requests
+
+
+def time_requests(fn, requests, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for scores, graded, required, role in requests:
+            fn(scores, graded, required, role)
+        best = min(best, time.perf_counter() - start)
+    return best / len(requests)
+
+
+def allocations_per_request(fn, requests):
+    """(retained KiB, peak KiB) per request, traced by tracemalloc"""
+    retained = peak = 0
+    sample = requests[:200]
+    tracemalloc.start()
+    for scores, graded, required, role in sample:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = fn(scores, graded, required, role)
+        current, high = tracemalloc.get_traced_memory()
+        retained += current - base
+        peak += high - base
+        del result
+    tracemalloc.stop()
+    return retained / len(sample) / 1024, peak / len(sample) / 1024
+
+
+def run_benchmark():
+    requests = synthetic_requests(REQUESTS)
+    templated = lambda scores, graded, required, role: gaps_for_scores(scores, graded, required, role)
+    for args in requests:
+        assert templated(*args) == legacy_gaps(*args), "templated gaps differ from the legacy loop"
+
+    print(f"⏱️  Gap detection benchmark: {REQUESTS} requests over {len(ROLE_TO_SKILLS)} roles (best of 3)")
+    print("=" * 78)
+    print(f"{'path':>10} {'µs/request':>11} {'µs/gap':>8} {'retained KiB':>13} {'peak KiB':>9}")
+    gaps_per_request = sum(len(r[2]) for r in requests) / len(requests)
+    results = {}
+    for name, fn in (("legacy", legacy_gaps), ("templates", templated)):
+        per_request = time_requests(fn, requests) * 1e6
+        retained, peak = allocations_per_request(fn, requests)
+        results[name] = per_request
+        print(f"{name:>10} {per_request:>11.1f} {per_request / gaps_per_request:>8.2f} {retained:>13.2f} {peak:>9.2f}")
+    print(f"\nSpeedup: {results['legacy'] / results['templates']:.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
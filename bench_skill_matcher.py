@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Aho-Corasick skill matcher vs. the per-lexicon substring loop
+Run with: python bench_skill_matcher.py
+"""
+
+import os
+import sys
+import time
+import random
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.skills import BASIC_SKILL_LEXICON, normalize
+from backend.app.services.skill_matcher import build_skill_matcher
+
+RESUME_PARAGRAPH = (
+    "Senior data analyst with 6 years of experience building dashboards in Tableau and PowerBI. "
+    "Wrote production SQL against Postgres and NoSQL stores, automated reporting in Python with "
+    "pandas, numpy and matplotlib, and ran statistics and probability workshops for the epidemiology "
+    "team. Migrated Excel models to a data visualization platform used by 300 stakeholders. "
+)
+
+
+def legacy_extract(text_norm, lexicon):
+    """The substring loop previously used by extract_skills_from_text"""
+    found = set()
+    for token in lexicon:
+        if token in text_norm:
+            found.add(token)
+    return found
+
+
+def synthetic_lexicon(size, seed=7):
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz"
+    lexicon = set(BASIC_SKILL_LEXICON)
+    while len(lexicon) < size:
+        words = ["".join(rng.choice(alphabet) for _ in range(rng.randint(3, 9))) for _ in range(rng.randint(1, 3))]
+        lexicon.add(" ".join(words))
+    return lexicon
+
+
+def time_call(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark():
+    print("⏱️  Skill matcher benchmark (best of 3)")
+    print("=" * 78)
+    print(f"{'lexicon':>8} {'resume chars':>13} {'build ms':>9} {'legacy ms':>10} {'automaton ms':>13} {'speedup':>8}")
+    for lexicon_size in (12, 1_000, 10_000, 30_000):
+        lexicon = synthetic_lexicon(lexicon_size)
+        start = time.perf_counter()
+        matcher = build_skill_matcher(lexicon)
+        build_ms = (time.perf_counter() - start) * 1000
+        for paragraphs in (5, 50):
+            text_norm = normalize(RESUME_PARAGRAPH * paragraphs)
+            legacy = time_call(lambda: legacy_extract(text_norm, lexicon), 3) * 1000
+            automaton = time_call(lambda: matcher.extract(text_norm), 3) * 1000
+            print(f"{lexicon_size:>8} {len(text_norm):>13} {build_ms:>9.1f} {legacy:>10.2f} {automaton:>13.2f} {legacy / automaton:>7.1f}x")
+
+    text_norm = normalize(RESUME_PARAGRAPH)
+    print("\nFalse positives removed by word-boundary matching:",
+          sorted(legacy_extract(text_norm, BASIC_SKILL_LEXICON) - build_skill_matcher(BASIC_SKILL_LEXICON).extract(text_norm)) or "none")
+
+
+if __name__ == "__main__":
+    run_benchmark()
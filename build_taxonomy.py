@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Validate the role taxonomy JSON sources and compile them to taxonomy.bin
+The compiled file is only used by the same Python version and while the sources are unchanged;
+otherwise the services fall back to parsing the JSON.
+
+    python build_taxonomy.py                      # backend/app/data/taxonomy (or TAXONOMY_DIR)
+    python build_taxonomy.py --dir ./taxonomy --bench
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.taxonomy import compile_taxonomy, load_compiled_taxonomy, load_json_taxonomy, taxonomy_dir
+
+
+def bench(directory, runs=50):
+    for name, load in (("json", load_json_taxonomy), ("compiled", load_compiled_taxonomy)):
+        start = time.perf_counter()
+        for _ in range(runs):
+            load(directory)
+        print(f"  {name:<9} {(time.perf_counter() - start) / runs * 1000:.2f} ms per load")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=None, help="taxonomy source directory")
+    parser.add_argument("--output", default=None, help="compiled file (default: <dir>/taxonomy.bin)")
+    parser.add_argument("--bench", action="store_true", help="compare JSON and compiled load times")
+    args = parser.parse_args(argv)
+
+    directory = args.dir or taxonomy_dir()
+    try:
+        output = compile_taxonomy(directory, args.output)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Taxonomy build failed: {e}")
+        return 1
+    taxonomy = load_json_taxonomy(directory)
+    print(f"✅ Compiled {taxonomy.versions} ({taxonomy.fingerprint}) -> {output} ({os.path.getsize(output):,} bytes)")
+    if args.bench and not args.output:
+        bench(directory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
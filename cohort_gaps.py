@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Skill gap heatmap for a cohort of profiles
+Profiles are JSONL ({"known_skills": [...], "goal": ..., "skill_scores": {...}}) or CSV with
+known_skills (";"-separated), goal and optional skill_scores (JSON) columns.
+
+    python cohort_gaps.py cohort.jsonl                         # each profile against its own goal
+    python cohort_gaps.py cohort.csv --role "data analyst" --top 5
+    python cohort_gaps.py cohort.jsonl --json heatmap.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.cohort import COHORT_FORMATS, DEFAULT_CHUNK_SIZE, analyze_cohort_file
+
+
+def print_report(report, top):
+    print(f"{report['profiles']} profiles ({report['skipped']} skipped)")
+    for role in report["roles"]:
+        print(f"\n{role['role'].title()} - {role['profiles']} profiles")
+        print(f"  {'skill':<24}{'missing':>9}{'partial':>9}{'gap rate':>10}{'deficit':>9}{'mastery pts':>13}")
+        for skill in role["skills"][:top]:
+            print(
+                f"  {skill['skill']:<24}{skill['missing']:>9}{skill['partial']:>9}"
+                f"{skill['gap_rate']:>10.1%}{skill['avg_deficit']:>9.2f}{skill['mastery_points']:>13,.0f}"
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("profiles")
+    parser.add_argument("--format", choices=COHORT_FORMATS, default=None, help="default: from the file extension")
+    parser.add_argument("--role", default=None, help="compare every profile with this role instead of its goal")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--top", type=int, default=10, help="skills shown per role")
+    parser.add_argument("--json", dest="json_path", default=None, help="also write the full report here")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.profiles.lower().endswith(".csv") else "jsonl")
+    start = time.perf_counter()
+    with open(args.profiles, encoding="utf-8", newline="") as f:
+        report = analyze_cohort_file(f, fmt, role=args.role, chunk_size=args.chunk_size)
+    print_report(report, args.top)
+    print(f"\n⏱️ {time.perf_counter() - start:.2f}s")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Train and evaluate the local skill model against LLM-labelled resumes
+Labelled data is JSONL with one {"text": ..., "skills": [...]} object per line.
+
+    python eval_local_extractor.py label resumes/ labelled.jsonl     # label .txt resumes with Nemotron
+    python eval_local_extractor.py train labelled.jsonl skill_model.npz
+    python eval_local_extractor.py eval labelled.jsonl skill_model.npz
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.local_extractor import LocalSkillModel
+from backend.app.services.skill_aliases import canonical_skill_set
+from backend.app.services.skills import extract_skills_rule_based
+
+
+def read_labelled(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record["text"], record.get("skills", [])
+
+
+def split(examples, holdout, seed=7):
+    examples = list(examples)
+    random.Random(seed).shuffle(examples)
+    cut = int(len(examples) * (1 - holdout))
+    return examples[:cut], examples[cut:]
+
+
+def label(args):
+    from backend.app.services.nemotron import get_nemotron_service
+    nemotron = get_nemotron_service()
+    names = sorted(n for n in os.listdir(args.resumes) if n.endswith(".txt"))
+    with open(args.output, "w", encoding="utf-8") as out:
+        for i, name in enumerate(names, 1):
+            with open(os.path.join(args.resumes, name), encoding="utf-8") as f:
+                text = f.read()
+            skills = sorted(canonical_skill_set(nemotron.extract_skills_from_text(text, [])))
+            out.write(json.dumps({"text": text, "skills": skills}) + "\n")
+            print(f"[{i}/{len(names)}] {name}: {len(skills)} skills")
+
+
+def train(args):
+    examples = list(read_labelled(args.data))
+    train_set, _ = split(examples, args.holdout) if args.holdout else (examples, [])
+    start = time.perf_counter()
+    model = LocalSkillModel.train(train_set, epochs=args.epochs)
+    model.threshold = args.threshold
+    model.save(args.model)
+    print(f"✅ Trained on {len(train_set)} resumes in {time.perf_counter() - start:.1f}s -> {args.model}")
+
+
+def score(predicted, gold):
+    tp = len(predicted & gold)
+    return tp, len(predicted) - tp, len(gold) - tp
+
+
+def report(name, totals, latencies):
+    tp, fp, fn = totals
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1e3
+    print(f"{name:<12} {precision:>9.3f} {recall:>7.3f} {f1:>6.3f} {p50:>8.2f} {p95:>8.2f}")
+
+
+def evaluate(args):
+    examples = list(read_labelled(args.data))
+    if args.holdout:
+        _, examples = split(examples, args.holdout)
+    model = LocalSkillModel.load(args.model)
+    if args.threshold is not None:
+        model.threshold = args.threshold
+
+    extractors = {
+        "local model": lambda text: model.extract(text),
+        "rule-based": lambda text: extract_skills_rule_based(text, []),
+    }
+    print(f"📊 {len(examples)} LLM-labelled resumes")
+    print(f"{'extractor':<12} {'precision':>9} {'recall':>7} {'f1':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, extract in extractors.items():
+        totals, latencies = [0, 0, 0], []
+        for text, gold in examples:
+            start = time.perf_counter()
+            predicted = set(extract(text))
+            latencies.append(time.perf_counter() - start)
+            for k, v in enumerate(score(predicted, canonical_skill_set(gold))):
+                totals[k] += v
+        report(name, totals, latencies)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("label", help="label .txt resumes with Nemotron")
+    p.add_argument("resumes")
+    p.add_argument("output")
+    p.set_defaults(func=label)
+
+    p = commands.add_parser("train", help="train a local model")
+    p.add_argument("data")
+    p.add_argument("model")
+    p.add_argument("--epochs", type=int, default=5)
+    p.add_argument("--threshold", type=float, default=0.5)
+    p.add_argument("--holdout", type=float, default=0.2, help="fraction kept out for eval (same seed)")
+    p.set_defaults(func=train)
+
+    p = commands.add_parser("eval", help="compare the local model and the lexicon with LLM labels")
+    p.add_argument("data")
+    p.add_argument("model")
+    p.add_argument("--threshold", type=float, default=None)
+    p.add_argument("--holdout", type=float, default=0.2, help="evaluate only the held-out fraction (0 = all)")
+    p.set_defaults(func=evaluate)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Bulk-load provider course dumps into the course catalog
+Courses are JSONL ({"name": ..., "provider": ..., "link": ..., "skills": [...], "rating": ...,
+"duration_hours": ..., "price": ..., "difficulty": ..., "description": ...}) or CSV with the same
+columns (skills ";"-separated). Title/url/platform/skills_covered are accepted as aliases.
+
+    python load_course_catalog.py coursera.jsonl --db catalog.sqlite3
+    python load_course_catalog.py udemy.csv --db catalog.sqlite3 --batch-size 5000
+    python load_course_catalog.py --db catalog.sqlite3 --search "sql window functions"
+
+Point the API at the same file with COURSE_CATALOG_PATH.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.course_catalog import CATALOG_FORMATS, DEFAULT_BATCH_SIZE, CourseCatalog, load_catalog_file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dumps", nargs="*")
+    parser.add_argument("--db", default=os.getenv("COURSE_CATALOG_PATH", "course_catalog.sqlite3"))
+    parser.add_argument("--format", choices=CATALOG_FORMATS, default=None, help="default: from the file extension")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="courses per transaction")
+    parser.add_argument("--search", default=None, help="full-text search the catalog after loading")
+    args = parser.parse_args(argv)
+
+    catalog = CourseCatalog(args.db)
+    for path in args.dumps:
+        fmt = args.format or ("csv" if path.lower().endswith(".csv") else "jsonl")
+        start = time.perf_counter()
+        with open(path, encoding="utf-8", newline="") as f:
+            stats = load_catalog_file(f, fmt, catalog=catalog, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"📚 {path}: {stats['loaded']:,} courses loaded, {stats['skipped']:,} skipped in {elapsed:.1f}s")
+    print(f"Catalog {args.db}: {len(catalog):,} courses over {len(catalog.skills()):,} skills")
+
+    if args.search:
+        for course in catalog.search(args.search, limit=10):
+            print(f"  {course['provider']:<14} {course['name']:<50} {', '.join(course['skills'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
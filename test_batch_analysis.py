@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script for bulk resume analysis (/analyze/batch)
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import batch, skills
+from backend.app.services.gap_state import get_gap_state_store
+from backend.app.services.near_duplicate import SimHashIndex
+
+RESUME = """Summary
+Analyst who turns messy operational data into dashboards and recommendations for sales teams.
+
+Skills
+Python, SQL, Tableau, Excel, statistics, stakeholder communication
+
+Experience
+Operations Analyst Intern, Northwind Logistics
+- Cleaned shipment records with pandas and reduced manual reconciliation time by a third
+- Wrote SQL views feeding the warehouse throughput dashboard used by regional managers
+"""
+
+
+def test_llm_fan_out_is_bounded_and_ordered(monkeypatch):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_llm(text, known):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return None if "fail" in text else ["python", text.split()[0]]
+
+    monkeypatch.setattr(skills, "should_escalate_to_llm", lambda text: True)
+    monkeypatch.setattr(skills, "extract_skills_with_nemotron", fake_llm)
+    monkeypatch.setattr(skills, "get_near_duplicate_index", lambda: None)
+    items = [{"goal": "data analyst", "resume_text": f"skill{i} notes"} for i in range(12)]
+    items[3] = {"goal": "data analyst", "resume_text": "fail but knows sql"}
+    items[5] = {"resume_text": "no goal"}
+    results = asyncio.run(batch.analyze_batch(items, max_concurrency=3))
+
+    assert peak[0] <= 3, peak
+    assert [r.index for r in results] == list(range(12))
+    assert results[0].result.extracted_skills == ["python", "skill0"]
+    assert results[3].result.extracted_skills == ["sql"]  # rule-based fallback
+    assert results[5].error and results[5].result is None
+
+
+def test_items_share_the_single_analysis_path(monkeypatch):
+    calls, index = [], SimHashIndex()
+
+    def fake_llm(text, known):
+        calls.append(text)
+        return ["python", "sql", "tableau"]
+
+    monkeypatch.setattr(skills, "should_escalate_to_llm", lambda text: True)
+    monkeypatch.setattr(skills, "extract_skills_with_nemotron", fake_llm)
+    monkeypatch.setattr(skills, "get_near_duplicate_index", lambda: index)
+    monkeypatch.setattr(skills, "_tier_counts", {tier: 0 for tier in skills._tier_counts})
+    asyncio.run(batch.analyze_batch([{"goal": "data analyst", "resume_text": RESUME}]))
+    items = [
+        {"goal": "data analyst", "resume_text": RESUME.replace("Northwind", "Contoso"), "user_id": "batch-user"},
+        {"goal": "data analyst", "resume_text": "ok", "known_skills": ["x"]},
+    ]
+    results = asyncio.run(batch.analyze_batch(items))
+
+    # The look-alike resume reuses the stored LLM result instead of calling it again
+    assert skills.get_extraction_stats()["tier_counts"]["near_duplicate"] == 1
+    assert results[0].result.recomputed_sections and results[1].result.recomputed_sections is None
+    state = get_gap_state_store().get("batch-user")
+    assert state is not None and state.role == "data analyst"
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Batch Analysis Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for the role transition graph and career path planning
+"""
+
+import os
+import sys
+from dataclasses import replace
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import career_paths
+from backend.app.services.career_paths import RoleGraph, get_role_graph
+from backend.app.services.role_fit import RoleMatrix
+from backend.app.services.taxonomy import get_taxonomy, set_taxonomy
+
+
+def _skill(score, points):
+    return {"required_score": score, "mastery_points": points}
+
+
+# mid's on-the-job sql and python take senior past its entry bar; junior's statistics carries over
+LADDER = {
+    "junior": {"excel": _skill(0.6, 100), "statistics": _skill(0.8, 200)},
+    "mid": {"excel": _skill(0.6, 100), "sql": _skill(0.8, 100), "python": _skill(0.8, 100)},
+    "senior": {"sql": _skill(0.8, 300), "python": _skill(0.8, 300), "statistics": _skill(0.8, 200), "machine learning": _skill(0.8, 300)},
+    "island": {"welding": _skill(0.7, 400)},
+}
+
+
+def test_skills_accumulate_along_the_path():
+    path = RoleGraph(RoleMatrix(LADDER), entry_fit=0.7).path("junior", "senior")
+    assert [(h.from_role, h.to_role) for h in path.hops] == [("junior", "mid"), ("mid", "senior")]
+    # Statistics, from junior, and sql and python, from working as mid, already meet senior's bar
+    assert [(h.mastery_points, h.skills_to_learn) for h in path.hops] == [(220.0, ["python", "sql"]), (0.0, [])]
+    assert (path.total_mastery_points, path.direct_mastery_points) == (220.0, 380.0)
+
+
+def test_skills_cost_the_same_for_every_role():
+    # sql and python are priced alike in mid and senior, so learning all of a role before
+    # entering it never makes a detour pay; ties go to fewer hops
+    path = RoleGraph(RoleMatrix(LADDER), entry_fit=1.0).path("junior", "senior")
+    assert [h.to_role for h in path.hops] == ["senior"]
+    assert path.total_mastery_points == path.direct_mastery_points == 700.0
+
+
+def test_unrelated_targets_are_a_direct_move():
+    graph = RoleGraph(RoleMatrix(LADDER), entry_fit=0.7)
+    path = graph.path("junior", "island")
+    assert [h.to_role for h in path.hops] == ["island"] and path.total_mastery_points == 280.0
+    assert graph.path("senior", "senior").hops == []
+    assert [h.to_role for h in RoleGraph(RoleMatrix(LADDER), max_hops=1).path("junior", "senior").hops] == ["senior"]
+
+
+def test_every_taxonomy_role_pair_has_a_path():
+    graph = RoleGraph(RoleMatrix(get_taxonomy().role_to_skills))
+    for source in graph.roles:
+        for target in set(graph.roles) - {source}:
+            path = graph.path(source, target)
+            assert path.hops[0].from_role == source and path.hops[-1].to_role == target
+            assert path.total_mastery_points == round(sum(h.mastery_points for h in path.hops), 1)
+            assert path.total_mastery_points <= path.direct_mastery_points
+    # No plausible-overlap cutoff: roles sharing few skills are still one direct move apart
+    path = graph.path("software engineer", "machine learning engineer")
+    assert path.hops[-1].to_role == "machine learning engineer" and path.total_mastery_points > 0
+
+
+def test_taxonomy_has_multi_hop_paths():
+    graph = RoleGraph(RoleMatrix(get_taxonomy().role_to_skills))
+    multi_hop = [(s, t) for s in graph.roles for t in graph.roles if s != t and len(graph.path(s, t).hops) > 1]
+    assert multi_hop
+    # Pandas learned as a data analyst is credited towards ML data preprocessing
+    path = graph.path("health data analyst", "machine learning engineer")
+    assert [h.to_role for h in path.hops] == ["data analyst", "machine learning engineer"]
+    assert path.total_mastery_points < path.direct_mastery_points
+
+
+def test_plan_from_current_skills_enters_the_cheapest_role():
+    graph = RoleGraph(RoleMatrix(LADDER), entry_fit=0.7)
+    plan = graph.plan({"excel": 0.6}, "senior")
+    assert [(h.from_role, h.to_role) for h in plan.hops] == [(None, "junior"), ("junior", "mid"), ("mid", "senior")]
+    assert (plan.total_mastery_points, plan.direct_mastery_points) == (330.0, 570.0)
+    stranger = graph.plan({}, "island")
+    assert [h.to_role for h in stranger.hops] == ["island"]
+    assert stranger.total_mastery_points == stranger.direct_mastery_points == 280.0
+
+
+def test_graph_is_rebuilt_when_the_taxonomy_changes():
+    original = get_taxonomy()
+    assert "senior" not in get_role_graph().roles
+    try:
+        set_taxonomy(replace(original, role_to_skills={**original.role_to_skills, **LADDER}))
+        # Built with every path during the swap, not on first use
+        graph = career_paths._role_graph_instance
+        assert graph is not None and ("junior", "senior") in [(graph.roles[a], graph.roles[b]) for a, b in graph._paths]
+        assert [h.to_role for h in get_role_graph().path("junior", "senior").hops] == ["mid", "senior"]
+    finally:
+        set_taxonomy(original)
+    assert "senior" not in get_role_graph().roles
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Career Path Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for cohort skill gap heatmaps
+"""
+
+import io
+import os
+import sys
+import json
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import cohort
+from backend.app.services.cohort import analyze_cohort, analyze_cohort_file, read_profiles
+from backend.app.services.gaps import ROLE_TO_SKILLS, detect_skill_gaps, map_role_to_required_skills
+
+PROFILES = [
+    {"known_skills": ["Python 3", "SQL", "Excel"], "goal": "Data Analyst"},
+    {"known_skills": ["sql", "tableau"], "goal": "sr. data analyst"},
+    {"known_skills": ["python", "ml"], "goal": "ML engineer"},
+    {"known_skills": ["python"], "goal": "data analyst", "skill_scores": {"python": 0.5, "statistics": 0.9}},
+]
+
+
+def _skill_row(report, role, skill):
+    role_report = next(r for r in report["roles"] if r["role"] == role)
+    return next(s for s in role_report["skills"] if s["skill"] == skill)
+
+
+def test_counts_match_per_profile_gap_detection():
+    report = analyze_cohort(PROFILES, chunk_size=3)
+    assert report["profiles"] == 4
+    assert [r["role"] for r in report["roles"]] == ["data analyst", "machine learning engineer"]
+    required = map_role_to_required_skills("data analyst")
+    missing = [g.skill for p in PROFILES[:2] for g in detect_skill_gaps(p["known_skills"], required) if g.status == "Missing"]
+    for skill in required:
+        graded_missing = int(skill not in ("python", "statistics"))  # PROFILES[3]
+        assert _skill_row(report, "data analyst", skill)["missing"] == missing.count(skill) + graded_missing
+
+
+def test_graded_scores_count_as_partial_with_deficit():
+    report = analyze_cohort(PROFILES[3:])
+    python = _skill_row(report, "data analyst", "python")
+    assert (python["missing"], python["partial"]) == (0, 1)
+    assert python["avg_deficit"] == round(ROLE_TO_SKILLS["data analyst"]["python"]["required_score"] - 0.5, 4)
+    assert _skill_row(report, "data analyst", "statistics")["gap_rate"] == 0.0
+
+
+def test_role_override_and_pure_python_fallback_agree():
+    numpy_report = analyze_cohort(PROFILES, role="data analyst")
+    assert [r["profiles"] for r in numpy_report["roles"]] == [4]
+    cohort.NUMPY_AVAILABLE = False
+    try:
+        assert analyze_cohort(PROFILES, role="data analyst") == numpy_report
+    finally:
+        cohort.NUMPY_AVAILABLE = True
+
+
+def test_jsonl_and_csv_inputs_stream_the_same_profiles():
+    jsonl = io.BytesIO("\n".join(json.dumps(p) for p in PROFILES[:3]).encode())
+    csv_text = "goal,known_skills\nData Analyst,Python 3;SQL;Excel\nsr. data analyst,sql|tableau\nML engineer,\"python, ml\"\n"
+    assert list(read_profiles(io.StringIO(csv_text), "csv"))[0]["known_skills"] == ["Python 3", "SQL", "Excel"]
+    assert analyze_cohort_file(jsonl, "jsonl") == analyze_cohort_file(io.StringIO(csv_text), "csv")
+
+
+def test_bad_rows_are_skipped():
+    report = analyze_cohort([PROFILES[0], "not a profile", {"known_skills": 5}])
+    assert (report["profiles"], report["skipped"]) == (1, 2)
+
+
+def test_malformed_lines_are_skipped():
+    jsonl = io.StringIO(json.dumps(PROFILES[0]) + '\n{"known_skills": ["sql"\n' + json.dumps(PROFILES[1]) + "\n")
+    report = analyze_cohort_file(jsonl, "jsonl")
+    assert (report["profiles"], report["skipped"]) == (2, 1)
+    csv_text = 'goal,known_skills,skill_scores\nData Analyst,sql,"{bad"\nData Analyst,python,"{""python"": 0.5}"\n'
+    report = analyze_cohort_file(io.StringIO(csv_text), "csv")
+    assert (report["profiles"], report["skipped"]) == (1, 1)
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Cohort Gap Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the indexed, persistent course catalog
+"""
+
+import io
+import os
+import sys
+import json
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.course_catalog import CourseCatalog, load_catalog_file, normalize_course
+from backend.app.services.resources import MOCK_PROVIDER_COURSES, candidate_courses, rank_resources_for_skills, score_course
+from backend.app.services.skill_aliases import canonicalize_skill
+
+COURSES = [
+    {"name": "Intro to PostgreSQL", "provider": "Udemy", "link": "u/pg", "skills": ["postgres", "sql"], "rating": 4.4, "price": 19.99},
+    {"title": "Window Functions in Depth", "platform": "Coursera", "url": "c/wf", "skills_covered": "sql;analytics", "rating": "4.9"},
+    {"name": "Kubernetes Up and Running", "provider": "edX", "link": "e/k8s", "skill": "Kubernetes", "description": "Deploy containers at scale"},
+]
+
+
+def _catalog(courses=COURSES):
+    catalog = CourseCatalog()
+    catalog.add_courses(courses)
+    return catalog
+
+
+def test_records_are_normalized():
+    course = normalize_course(COURSES[1])
+    assert (course["name"], course["provider"], course["link"]) == ("Window Functions in Depth", "Coursera", "c/wf")
+    assert course["skills"] == ["analytics", "sql"] and course["rating"] == 4.9 and course["price"] == "Free"
+    assert normalize_course(COURSES[0])["price"] == "Paid"
+    assert normalize_course(COURSES[2])["skills"] == ["kubernetes"]
+
+
+def test_jsonl_and_csv_dumps_load_and_invalid_records_are_skipped():
+    jsonl = "\n".join(json.dumps(c) for c in COURSES + [{"name": "No skills"}]) + "\n\n"
+    catalog = CourseCatalog()
+    assert load_catalog_file(io.BytesIO(jsonl.encode()), "jsonl", catalog=catalog, batch_size=2) == {"loaded": 3, "skipped": 1}
+    csv_dump = "name,provider,link,skills,rating\nSQL Drills,Khan Academy,k/sql,sql;mysql,4.1\n,Nobody,x,sql,1\n"
+    assert load_catalog_file(io.StringIO(csv_dump), "csv", catalog=catalog) == {"loaded": 1, "skipped": 1}
+    assert len(catalog) == 4 and catalog.skills()[canonicalize_skill("sql")] == 3
+
+
+def test_reloading_a_course_replaces_its_skills_and_search_text():
+    catalog = _catalog()
+    catalog.add_courses([{**COURSES[0], "skills": ["docker"], "description": "Containers"}])
+    assert len(catalog) == 3
+    assert "Intro to PostgreSQL" not in [c["name"] for c in catalog.courses_for_skill("sql")]
+    assert [c["skills"] for c in catalog.courses_for_skill("docker")] == [["docker"]]
+    if catalog.fts:
+        assert catalog.search("postgres") == [] and catalog.search("containers")[0]["name"] == "Intro to PostgreSQL"
+
+
+def test_skill_lookups_and_full_text_search():
+    catalog = _catalog()
+    assert [c["name"] for c in catalog.courses_for_skill("PostgreSQL")] == ["Intro to PostgreSQL"]
+    assert [c["name"] for c in catalog.courses_for_skill("kubernetes")] == ["Kubernetes Up and Running"]
+    if catalog.fts:
+        assert catalog.search("window function")[0]["name"] == "Window Functions in Depth"
+        assert catalog.search('deploy" OR *') == []
+    assert catalog.top_rated(1)[0]["rating"] == 4.9
+
+
+def test_unindexed_skills_fall_back_to_search_then_top_rated():
+    catalog = _catalog()
+    candidates, indexed = candidate_courses("deploying containers", catalog)
+    assert not indexed
+    if catalog.fts:
+        assert [c["name"] for c in candidates] == ["Kubernetes Up and Running"]
+    candidates, indexed = candidate_courses("cobol", catalog)
+    assert not indexed and len(candidates) == 3
+    assert rank_resources_for_skills(["sql"], 5, True, [], catalog=CourseCatalog()) == []
+
+
+def test_ranking_matches_the_in_memory_mock_courses():
+    catalog = _catalog(MOCK_PROVIDER_COURSES)
+    skills = ["sql", "Data Visualization", "docker", "stats", "python"]
+    for free_preferred, providers in ((True, []), (False, ["edX"]), (True, ["Udemy", "Coursera"])):
+        ranked = rank_resources_for_skills(skills, 5, free_preferred, providers, catalog=catalog)
+        for skill, item in zip(skills, ranked):
+            by_skill = [c for c in MOCK_PROVIDER_COURSES if canonicalize_skill(c["skill"]) == canonicalize_skill(skill)]
+            best = max(by_skill or MOCK_PROVIDER_COURSES, key=lambda c: score_course(c, skill, 5, free_preferred, providers))
+            assert (item.name, item.score) == (best["name"], score_course(best, skill, 5, free_preferred, providers))
+
+
+def test_file_catalog_persists_across_reopening(tmp_path):
+    path = str(tmp_path / "catalog.sqlite3")
+    CourseCatalog(path).add_courses(COURSES)
+    reopened = CourseCatalog(path)
+    assert len(reopened) == 3 and [c["name"] for c in reopened.courses_for_skill("sql")] == ["Intro to PostgreSQL", "Window Functions in Depth"]
+
+
+
+def test_columns_pick_up_writes_from_another_connection(tmp_path):
+    path = str(tmp_path / "catalog.sqlite3")
+    catalog = CourseCatalog(path)
+    catalog.add_courses(COURSES[:2])
+    columns = catalog.columns()
+    assert catalog.columns() is columns and len(columns.courses.ids) == 2
+    # e.g. load_course_catalog.py writing to the same file from its own process
+    CourseCatalog(path).add_courses(COURSES[2:])
+    assert len(catalog.columns().courses.ids) == 3
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Course Catalog Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
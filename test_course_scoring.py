@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for columnar course scoring and top-k selection
+"""
+
+import os
+import sys
+import random
+
+import numpy as np
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import course_catalog
+from backend.app.services.course_catalog import CourseCatalog
+from backend.app.services.course_scoring import top_k
+from backend.app.services.resources import rank_resources_for_skills, top_courses_for_skill
+
+PROVIDERS = ["Coursera", "Udemy", "edX", "Khan Academy"]
+
+
+def _catalog(count=300, seed=3):
+    rng = random.Random(seed)
+    catalog = CourseCatalog()
+    catalog.add_courses(
+        {
+            "name": f"Course {i}",
+            "provider": rng.choice(PROVIDERS),
+            "link": f"https://example.com/{i}",
+            "skills": rng.sample(["python", "sql", "docker", "statistics"], 2),
+            "rating": rng.choice([3.9, 4.2, 4.5, 4.8]),
+            "duration_hours": rng.randint(1, 40),
+            "price": rng.choice(["Free", 49]),
+        }
+        for i in range(count)
+    )
+    return catalog
+
+
+def test_top_k_breaks_ties_by_position():
+    scores = np.array([0.5, 0.9, 0.7, 0.9, 0.70004, 0.1])
+    assert top_k(scores, 3).tolist() == [1, 3, 4]
+    # 0.7 and 0.70004 tie at 4 decimals, so the earlier one wins
+    assert top_k(scores, 3, decimals=4).tolist() == [1, 3, 2]
+    assert top_k(scores, 1).tolist() == [1]
+    assert top_k(scores, 10).tolist() == [1, 3, 4, 2, 0, 5]
+    assert top_k(scores, 0).tolist() == [] and top_k(np.array([]), 3).tolist() == []
+
+
+def test_columnar_ranking_matches_score_course(monkeypatch):
+    catalog = _catalog()
+    cases = [("python", 5, True, []), ("sql", 20, False, ["edX"]), ("statistics", 2, True, ["Udemy", "Coursera"]),
+             ("kubernetes", 5, True, ["edX"]), ("docker containers", 8, False, [])]
+    vectorized = [(case, top_courses_for_skill(case[0], 7, *case[1:], catalog=catalog)) for case in cases]
+    monkeypatch.setattr(course_catalog, "NUMPY_AVAILABLE", False)
+    assert catalog.columns() is None
+    for case, courses in vectorized:
+        expected = top_courses_for_skill(case[0], 7, *case[1:], catalog=catalog)
+        assert [(c["id"], c["score"]) for c in courses] == [(c["id"], c["score"]) for c in expected], case
+
+
+def test_columns_are_rebuilt_after_writes():
+    catalog = _catalog(20)
+    columns = catalog.columns()
+    assert catalog.columns() is columns and len(columns) == 20
+    catalog.add_courses([{"name": "Rust in Action", "provider": "Udemy", "skills": ["rust"], "rating": 5.0}])
+    assert len(catalog.columns()) == 21
+    assert top_courses_for_skill("rust", 3, 5, True, [], catalog=catalog)[0]["name"] == "Rust in Action"
+    catalog.clear()
+    assert len(catalog.columns()) == 0 and top_courses_for_skill("rust", 3, 5, True, [], catalog=catalog) == []
+
+
+def test_rank_resources_returns_several_courses_per_skill():
+    ranked = rank_resources_for_skills(["python", "sql"], 5, True, [], catalog=_catalog(), per_skill=3)
+    assert [r.skill for r in ranked] == ["python"] * 3 + ["sql"] * 3
+    assert ranked[0].score >= ranked[1].score >= ranked[2].score
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Course Scoring Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
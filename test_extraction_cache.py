@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test script for the two-tier Nemotron extraction cache
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.extraction_cache import ExtractionCache, make_cache_key
+
+
+def test_key_ignores_formatting_noise():
+    a = make_cache_key("Python and  SQL\n", ["SQL", "python"], "nemotron", "1")
+    b = make_cache_key("python and sql", ["python", "sql"], "nemotron", "1")
+    assert a == b
+    assert a != make_cache_key("python and sql", ["python", "sql"], "nemotron", "2")
+
+
+def test_disk_tier_survives_restart_and_evicts():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.sqlite3")
+        cache = ExtractionCache(path=path, max_entries=2, memory_entries=1)
+        for i in range(3):
+            cache.set(f"k{i}", [f"skill{i}"])
+
+        restarted = ExtractionCache(path=path, max_entries=2)
+        assert restarted.get("k0") is None  # evicted by size
+        assert restarted.get("k2") == ["skill2"]
+        assert restarted.stats["disk_hits"] == 1
+
+
+def test_ttl_expiry():
+    cache = ExtractionCache(path=None, ttl_seconds=-1)
+    cache.set("k", ["python"])
+    assert cache.get("k") is None
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Extraction Cache Test")
+    print("=" * 60)
+    for test in (test_key_ignores_formatting_noise, test_disk_tier_survives_restart_and_evicts, test_ttl_expiry):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for confidence-gated cascade extraction and the per-tier counters
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import skills
+from backend.app.services.extraction_confidence import score_extraction_confidence
+from backend.app.services.skills import extract_skills_from_text, get_extraction_stats, rule_based_confidence
+
+WELL_COVERED = """Skills
+Python, SQL, Tableau, Excel, pandas, statistics
+Experience
+Built SQL dashboards in Tableau with Python and Excel
+Education
+BSc Statistics
+Projects
+Pandas churn model"""
+
+UNKNOWN_STACK = "Worked on Kubernetes, Terraform, Helm, Ansible, Prometheus and Grafana at Acme building platform tooling"
+
+
+@pytest.fixture
+def nemotron(monkeypatch):
+    """A working Nemotron backend that records the texts it was asked about"""
+    calls = []
+
+    def fake_nemotron(text, user_known_skills):
+        calls.append(text)
+        return ["kubernetes", "terraform"]
+
+    monkeypatch.setenv("SKILL_EXTRACTION_BACKEND", "nemotron")
+    monkeypatch.delenv("SKILL_EXTRACTION_CASCADE_THRESHOLD", raising=False)
+    monkeypatch.setattr(skills, "nemotron_enabled", lambda: True)
+    monkeypatch.setattr(skills, "extract_skills_with_nemotron", fake_nemotron)
+    monkeypatch.setattr(skills, "get_near_duplicate_index", lambda: None)
+    monkeypatch.setattr(skills, "_tier_counts", {tier: 0 for tier in skills._tier_counts})
+    return calls
+
+
+def test_confidence_rewards_lexicon_coverage_and_penalizes_unknown_terms():
+    high = rule_based_confidence(WELL_COVERED)
+    assert high.score > 0.9 and high.hit_density == 1.0 and high.section_coverage == 1.0
+    low = rule_based_confidence(UNKNOWN_STACK)
+    assert low.score < 0.2 and {"Kubernetes", "Terraform", "Grafana"} <= set(low.unknown_terms)
+    # Words starting a sentence or bullet are not mistaken for unknown skills
+    assert score_extraction_confidence("Managed the team. Shipped on time.", []).unknown_terms == []
+    assert score_extraction_confidence("", []).score == 1.0
+
+
+def test_cascade_escalates_only_low_confidence_text(monkeypatch, nemotron):
+    monkeypatch.setenv("SKILL_EXTRACTION_MODE", "cascade")
+    assert "python" in extract_skills_from_text(WELL_COVERED, [])
+    assert extract_skills_from_text(UNKNOWN_STACK, []) == ["kubernetes", "terraform"]
+    assert nemotron == [UNKNOWN_STACK]
+    assert get_extraction_stats()["tier_counts"]["rule_based"] == 1 and get_extraction_stats()["tier_counts"]["llm"] == 1
+
+
+def test_cascade_threshold_is_configurable(monkeypatch, nemotron):
+    monkeypatch.setenv("SKILL_EXTRACTION_MODE", "cascade")
+    monkeypatch.setenv("SKILL_EXTRACTION_CASCADE_THRESHOLD", "0.99")
+    extract_skills_from_text(WELL_COVERED, [])
+    monkeypatch.setenv("SKILL_EXTRACTION_CASCADE_THRESHOLD", "0")
+    extract_skills_from_text(UNKNOWN_STACK, [])
+    assert nemotron == [WELL_COVERED]
+    assert get_extraction_stats()["cascade_threshold"] == 0.0
+
+
+def test_counters_in_each_mode(monkeypatch, nemotron):
+    monkeypatch.setenv("SKILL_EXTRACTION_MODE", "llm_first")
+    extract_skills_from_text(WELL_COVERED, [])
+    monkeypatch.setattr(skills, "extract_skills_with_nemotron", lambda text, known: None)
+    assert "python" in extract_skills_from_text(WELL_COVERED, [])
+    monkeypatch.setenv("SKILL_EXTRACTION_MODE", "rule_only")
+    extract_skills_from_text(UNKNOWN_STACK, [])
+    stats = get_extraction_stats()
+    assert stats["mode"] == "rule_only" and stats["total"] == 3
+    assert {t: n for t, n in stats["tier_counts"].items() if n} == {"llm": 1, "llm_failed": 1, "rule_based": 1}
+
+
+def test_without_a_backend_every_mode_stays_rule_based(monkeypatch, nemotron):
+    monkeypatch.setattr(skills, "nemotron_enabled", lambda: False)
+    for mode in ("llm_first", "cascade"):
+        monkeypatch.setenv("SKILL_EXTRACTION_MODE", mode)
+        extract_skills_from_text(UNKNOWN_STACK, [])
+    assert nemotron == [] and get_extraction_stats()["tier_counts"]["rule_based"] == 2
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Extraction Cascade Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
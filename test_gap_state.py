@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for per-user gap state updated by assessments
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import gap_state
+from backend.app.services.assessment import score_assessment
+from backend.app.services.gap_state import GapStateStore, record_analysis
+from backend.app.services.gaps import current_skill_scores, detect_skill_gaps, gaps_for_scores, map_role_to_required_skills
+from backend.app.services.skill_graph import get_skill_graph
+
+REQUIRED = map_role_to_required_skills("data analyst")
+
+
+def _responses(skill, correct, total):
+    return [{"skill": skill, "selected_index": 0, "answer_index": 0 if i < correct else 1} for i in range(total)]
+
+
+def _analyzed_user(monkeypatch, known):
+    monkeypatch.setattr(gap_state, "_gap_state_store_instance", GapStateStore())
+    scores = current_skill_scores(known)
+    gaps = detect_skill_gaps(known, REQUIRED, cooccurrence=get_skill_graph())
+    return record_analysis("u1", "data analyst", REQUIRED, scores, set(), gaps)
+
+
+def test_assessment_updates_only_affected_gaps(monkeypatch):
+    state = _analyzed_user(monkeypatch, ["python", "sql"])
+    before = dict(state.gaps)
+    result = score_assessment(_responses("sql", 1, 2) + _responses("statistics", 4, 5))
+    gaps, recomputed = gap_state.get_gap_state_store().assess("u1", result.results)
+    assert recomputed == ["statistics", "sql"]
+    assert state.gaps["sql"].status == "Partial" and state.gaps["sql"].current_score == 0.5
+    assert state.gaps["statistics"].current_score == 0.8
+    assert all(state.gaps[s] is before[s] for s in REQUIRED if s not in recomputed)
+    assert state.version == 2 and state.assessed_skills == {"sql", "statistics"}
+    assert [g.skill for g in gaps] == REQUIRED
+
+
+def test_incremental_gaps_match_a_full_recompute(monkeypatch):
+    state = _analyzed_user(monkeypatch, ["python", "tableau", "excel"])
+    for responses in (_responses("pandas", 3, 3), _responses("python", 0, 3), _responses("tableau", 2, 3)):
+        gap_state.apply_assessment(state, score_assessment(responses).results)
+        full = gaps_for_scores(state.scores, state.graded, REQUIRED, cooccurrence=get_skill_graph())
+        assert list(state.gaps.values()) == full
+    # Failing the python assessment drops it, but held pandas still earns hierarchy credit
+    assert state.gaps["python"].status == "Partial" and "Pandas" in state.gaps["python"].recommendation
+
+
+def test_unknown_users_are_not_created(monkeypatch):
+    monkeypatch.setattr(gap_state, "_gap_state_store_instance", GapStateStore())
+    assert gap_state.get_gap_state_store().assess("nobody", score_assessment(_responses("sql", 1, 1)).results) is None
+    assert gap_state.get_gap_state_store().get("nobody") is None
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Gap State Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
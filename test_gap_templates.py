@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for precomputed per-role SkillGap templates
+"""
+
+import os
+import sys
+from dataclasses import replace
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import gaps as gaps_module
+from backend.app.services.gaps import detect_skill_gaps, gaps_for_scores, map_role_to_required_skills
+from backend.app.services.models import AnalyzeResponse, SkillGap
+from backend.app.services.skill_graph import SkillCooccurrence
+from backend.app.services.taxonomy import get_taxonomy, set_taxonomy
+
+REQUIRED = map_role_to_required_skills("data analyst")
+
+
+def test_constructed_gaps_behave_like_validated_ones():
+    scores = {"python": 0.95, "sql": 0.5, "pandas": 0.6}
+    for gap in gaps_for_scores(scores, set(scores), REQUIRED + ["cobol"], "data analyst"):
+        validated = SkillGap(**gap.model_dump())
+        assert gap == validated and gap.model_dump_json() == validated.model_dump_json()
+        assert gap.model_fields_set == validated.model_fields_set
+        assert gap.model_copy(update={"status": "Known"}).status == "Known"
+    response = AnalyzeResponse(extracted_skills=[], required_skills=REQUIRED, skill_gaps=detect_skill_gaps([], REQUIRED))
+    assert [g["status"] for g in response.model_dump()["skill_gaps"]] == ["Missing"] * len(REQUIRED)
+
+
+def test_templates_are_not_changed_by_per_user_fields():
+    cooccurrence = SkillCooccurrence()
+    for _ in range(3):
+        cooccurrence.observe(["excel", "sql"])
+    linked = {g.skill: g for g in detect_skill_gaps(["excel"], REQUIRED, cooccurrence=cooccurrence)}
+    assert "also list it" in linked["sql"].recommendation
+    plain = {g.skill: g for g in detect_skill_gaps(["excel"], REQUIRED)}
+    assert plain["sql"].recommendation == "Start with Sql basics on Coursera"
+    assert linked["sql"] is not plain["sql"]
+
+
+def test_off_taxonomy_required_skills_do_not_grow_the_registry():
+    registry = gaps_module._registry
+    size = len(registry)
+    for i in range(200):
+        required = [f"inhouse tool {i}", "python"]
+        gaps = detect_skill_gaps(["python"], required, requirements={f"inhouse tool {i}": {"required_score": 0.6}})
+        assert [g.status for g in gaps] == ["Missing", "Known"]
+        assert detect_skill_gaps([f"inhouse tool {i}"], required)[0].status == "Known"
+    assert len(registry) == size
+
+
+def test_templates_are_rebuilt_when_the_taxonomy_changes():
+    original = get_taxonomy()
+    role_skills = {**original.role_to_skills["data analyst"]}
+    role_skills["sql"] = {**role_skills["sql"], "reasoning": "Reloaded reasoning", "mastery_points": 999}
+    try:
+        set_taxonomy(replace(original, role_to_skills={**original.role_to_skills, "data analyst": role_skills}))
+        gap = next(g for g in detect_skill_gaps([], REQUIRED) if g.skill == "sql")
+        assert (gap.reasoning, gap.mastery_points) == ("Reloaded reasoning", 999)
+    finally:
+        set_taxonomy(original)
+    assert gaps_module._index.templates["data analyst"]["sql"].missing["mastery_points"] != 999
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Gap Template Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental re-analysis of revised resumes
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import incremental_analysis
+from backend.app.services.incremental_analysis import ResumeRevisionStore, extract_skills_incrementally
+from backend.app.services.skills import extract_skills_from_text
+
+RESUME = """Technical Skills: Python, SQL
+
+Work Experience
+Acme Corp - Data Analyst
+- Built dashboards in Tableau
+
+EDUCATION
+BS Statistics, State University
+"""
+
+
+def _counting_extractor(monkeypatch):
+    calls = []
+
+    def fake_extract(text, user_known_skills, fuzzy_threshold=None):
+        calls.append(text)
+        return [s for s in ("python", "sql", "tableau", "excel", "statistics") if s in text.lower()]
+
+    monkeypatch.setattr(incremental_analysis, "extract_skills_from_text", fake_extract)
+    return calls
+
+
+def test_only_changed_sections_are_recomputed(monkeypatch):
+    calls = _counting_extractor(monkeypatch)
+    store = ResumeRevisionStore()
+
+    first = extract_skills_incrementally("u1", RESUME, [], store=store)
+    assert first.recomputed_sections == ["skills:0", "experience:0", "education:0"]
+    assert first.skills == ["python", "sql", "statistics", "tableau"]
+    assert len(calls) == 1  # every changed section in one extraction
+
+    calls.clear()
+    revised = RESUME.replace("Python, SQL", "Python, SQL, Excel")
+    second = extract_skills_incrementally("u1", revised, ["git"], store=store)
+    assert second.recomputed_sections == ["skills:0"]
+    assert second.reused_sections == ["experience:0", "education:0"]
+    assert len(calls) == 1
+    assert second.skills == ["excel", "git", "python", "sql", "statistics", "tableau"]
+
+
+def test_removed_sections_drop_their_skills(monkeypatch):
+    _counting_extractor(monkeypatch)
+    store = ResumeRevisionStore()
+    extract_skills_incrementally("u1", RESUME, [], store=store)
+
+    trimmed = RESUME.split("EDUCATION")[0]
+    result = extract_skills_incrementally("u1", trimmed, [], store=store)
+    assert result.recomputed_sections == []
+    assert "statistics" not in result.skills
+
+
+def test_batched_skills_are_attributed_to_their_sections(monkeypatch):
+    calls = _counting_extractor(monkeypatch)
+    store = ResumeRevisionStore()
+    extract_skills_incrementally("u1", RESUME, [], store=store)
+    records = store.get("u1")
+    assert (records["skills:0"].skills, records["experience:0"].skills) == (["python", "sql"], ["tableau"])
+
+    # Changing only the experience section re-extracts it alone; skills elsewhere stay put
+    calls.clear()
+    result = extract_skills_incrementally("u1", RESUME.replace("Tableau", "Excel"), [], store=store)
+    assert result.recomputed_sections == ["experience:0"] and len(calls) == 1
+    assert result.skills == ["excel", "python", "sql", "statistics"]
+
+
+def test_every_section_type_is_extracted(monkeypatch):
+    monkeypatch.setenv("SKILL_EXTRACTION_MODE", "rule_only")
+    resume = "Jane Doe\n\nLanguages: Python, Java, C++, SQL\n\nAwards\nTableau Viz of the Day\n"
+    result = extract_skills_incrementally("u1", resume, [], store=ResumeRevisionStore())
+    assert result.skills == extract_skills_from_text(resume, []) == ["python", "sql", "tableau"]
+    assert result.recomputed_sections == ["header:0", "languages:0", "awards:0"]
+
+
+def test_store_evicts_least_recent_users():
+    store = ResumeRevisionStore(max_users=2)
+    store.put("a", {})
+    store.put("b", {})
+    store.get("a")
+    store.put("c", {})
+    assert set(store._users) == {"a", "c"}
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Incremental Re-analysis Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
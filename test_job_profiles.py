@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for role profiles extracted from job descriptions
+"""
+
+import os
+import sys
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import job_profiles
+from backend.app.services.batch import analyze_batch
+from backend.app.services.gaps import detect_skill_gaps
+from backend.app.services.job_profiles import BASE_REQUIRED_SCORE, JobProfileStore, extract_job_profile, profile_id_for
+
+JD = """Senior Analytics Engineer
+We need 5+ years of SQL and expert knowledge of Python.
+Experience with Docker and AWS is a plus; familiarity with Tableau is nice to have.
+"""
+
+
+def test_levels_follow_the_wording():
+    profile = extract_job_profile(JD)
+    assert profile.title == "Senior Analytics Engineer"
+    assert {"sql", "python", "docker", "aws", "tableau"} <= set(profile.skills)
+    assert profile.skills["sql"]["required_score"] > BASE_REQUIRED_SCORE
+    assert profile.skills["python"]["required_score"] > BASE_REQUIRED_SCORE
+    assert profile.skills["tableau"]["required_score"] < BASE_REQUIRED_SCORE
+    assert "5+ years" in profile.skills["sql"]["reasoning"]
+
+
+def test_ids_are_content_hashes():
+    assert profile_id_for(JD) == profile_id_for("  " + JD.upper().replace("\n", "  \n"))
+    assert profile_id_for(JD) != profile_id_for(JD + "Kubernetes")
+
+
+def test_concurrent_registrations_cost_one_extraction(monkeypatch):
+    calls = []
+    extract = job_profiles.extract_job_profile
+    monkeypatch.setattr(job_profiles, "extract_job_profile", lambda *a, **k: calls.append(1) or extract(*a, **k))
+    store = JobProfileStore(max_profiles=2)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: store.register(JD), range(64)))
+    assert len(calls) == 1 and store.stats == {"extractions": 1, "hits": 63}
+    assert len({id(profile) for profile, _ in results}) == 1
+    assert sum(not cached for _, cached in results) == 1
+    assert store._pending == {}  # per-text locks are dropped once no registration holds them
+    store.register("Python developer")
+    store.register("SQL developer")
+    assert store.get(profile_id_for(JD)) is None  # least recently used profile evicted
+
+
+def test_failed_and_cached_registrations_release_their_lock(monkeypatch):
+    store = JobProfileStore()
+    store.register(JD)
+    for _ in range(3):
+        store.register(JD)
+    def failing_extract(*args, **kwargs):
+        raise ValueError("No skills found in the job description")
+
+    monkeypatch.setattr(job_profiles, "extract_job_profile", failing_extract)
+    with pytest.raises(ValueError):
+        store.register("Nothing here")
+    assert store._pending == {}
+
+
+def test_title_renames_a_registered_profile():
+    store = JobProfileStore()
+    profile, _ = store.register(JD)
+    renamed, cached = store.register(JD, title="Analytics Engineer II")
+    assert cached and renamed.profile_id == profile.profile_id and renamed.skills == profile.skills
+    assert store.get(profile.profile_id).title == "Analytics Engineer II"
+    assert store.register(JD)[0].title == "Analytics Engineer II"
+
+
+def test_gaps_use_the_profile_requirements():
+    profile = extract_job_profile(JD)
+    gaps = {g.skill: g for g in detect_skill_gaps(["python"], list(profile.skills), role=profile.title, requirements=profile.skills)}
+    assert gaps["sql"].status == "Missing"
+    assert gaps["sql"].required_score == profile.skills["sql"]["required_score"]
+    assert gaps["python"].status == "Known"
+
+
+def test_batch_items_share_one_profile(monkeypatch):
+    monkeypatch.setattr(job_profiles, "_job_profile_store_instance", JobProfileStore())
+    items = [{"goal": "", "known_skills": ["sql"], "job_description": JD} for _ in range(20)]
+    items.append({"goal": "", "role_profile_id": "missing"})
+    results = asyncio.run(analyze_batch(items))
+    assert {r.result.role_profile_id for r in results[:20]} == {profile_id_for(JD)}
+    assert results[0].result.resolved_role == "Senior Analytics Engineer"
+    assert "Unknown role profile" in results[20].error
+    assert job_profiles.get_job_profile_store().stats["extractions"] == 1
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Job Profile Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for the local CPU skill model and the extraction backend switch
+"""
+
+import os
+import sys
+import random
+import asyncio
+import threading
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import local_extractor, skills
+from backend.app.services.local_extractor import LocalSkillModel
+
+TOOLS = ["Kubernetes", "React", "Terraform", "Airflow", "Snowflake", "Kafka", "GraphQL", "Redis",
+         "Grafana", "Jenkins", "Ansible", "Looker", "FastAPI", "Django", "TypeScript", "Spark"]
+WORDS = ["customer", "revenue", "pipeline", "reporting", "latency", "platform", "billing", "search"]
+
+
+def labelled_resume(rng):
+    chosen = rng.sample(TOOLS, 5)
+    lines = ["Alex Smith", "", "Skills: " + ", ".join(chosen[:3]), "", "Experience",
+             "Acme Inc - Engineer (2019 - Present)"]
+    lines += [f"- Built the {rng.choice(WORDS)} {rng.choice(WORDS)} service with {s}" for s in chosen[2:]]
+    lines.append("- Improved uptime for Northwind Traders by 30%")
+    return "\n".join(lines), [s.lower() for s in chosen]
+
+
+def test_model_learns_llm_labels_and_round_trips(tmp_path):
+    rng = random.Random(3)
+    model = LocalSkillModel.train([labelled_resume(rng) for _ in range(120)], dim=1 << 16, epochs=3)
+    text, gold = labelled_resume(random.Random(99))
+    predicted = set(model.extract(text))
+    assert set(gold) <= predicted
+    assert "northwind traders" not in predicted
+
+    path = str(tmp_path / "model.npz")
+    model.save(path)
+    assert LocalSkillModel.load(path).extract(text) == model.extract(text)
+
+
+def test_local_backend_falls_back_without_model(monkeypatch):
+    monkeypatch.setenv("SKILL_EXTRACTION_BACKEND", "local")
+    monkeypatch.setattr(local_extractor, "_local_model", None)
+    monkeypatch.setattr(local_extractor, "_local_model_error", "model file not found")
+    assert not skills.should_escalate_to_llm("Python and SQL")
+    assert skills.extract_skills_from_text("Python and SQL", []) == ["python", "sql"]
+
+
+def test_local_backend_is_used_when_loaded(monkeypatch):
+    class FakeModel:
+        def extract(self, text, known):
+            return ["kubernetes"]
+
+    monkeypatch.setenv("SKILL_EXTRACTION_BACKEND", "local")
+    monkeypatch.setenv("SKILL_EXTRACTION_MODE", "llm_first")
+    monkeypatch.setattr(local_extractor, "_local_model", FakeModel())
+    monkeypatch.setattr(skills, "get_local_model", lambda: local_extractor._local_model)
+    assert skills.extract_skills_from_text("Ran Kubernetes clusters", []) == ["kubernetes"]
+
+
+def test_async_extraction_runs_on_local_pool(monkeypatch):
+    def current_thread(*args):
+        return threading.current_thread().name
+
+    monkeypatch.setenv("SKILL_EXTRACTION_BACKEND", "local")
+    assert asyncio.run(skills.run_extraction(current_thread)).startswith("local-skill-model")
+    monkeypatch.setenv("SKILL_EXTRACTION_BACKEND", "nemotron")
+    assert asyncio.run(skills.run_extraction(current_thread)) == threading.current_thread().name
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Local Skill Model Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
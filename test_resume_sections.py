@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for resume segmentation and budgeted LLM extraction text
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.resume_sections import segment_resume, build_extraction_text, estimate_tokens
+
+RESUME = """Jane Doe
+jane@example.com
+
+PROFESSIONAL SUMMARY
+Data analyst with 5 years of experience.
+
+Technical Skills: Python, SQL, Tableau
+
+Work Experience
+Acme Corp - Data Analyst (2020 - Present)
+- Built dashboards in Tableau
+
+EDUCATION
+BS Statistics, State University
+
+Interests
+Chess, hiking
+"""
+
+
+def test_sections_are_typed():
+    sections = segment_resume(RESUME)
+    assert [s.type for s in sections] == ["header", "summary", "skills", "experience", "education", "interests"]
+    assert sections[2].text == "Python, SQL, Tableau"  # inline "Heading: content"
+
+
+def test_unstructured_text_is_one_section():
+    sections = segment_resume("I know Python and SQL.\nI built dashboards.")
+    assert [s.type for s in sections] == ["other"]
+
+
+def test_extraction_text_prefers_skills_and_respects_budget():
+    text = build_extraction_text(segment_resume(RESUME), token_budget=20)
+    assert text.startswith("[Technical Skills]\nPython, SQL, Tableau")
+    assert "Chess" not in text
+    assert estimate_tokens(text) <= 20
+
+
+def test_languages_and_unlisted_sections_reach_the_llm():
+    resume = RESUME + "\nLanguages: Python, Java, C++, SQL\n\nAwards\nKaggle silver medal\n"
+    text = build_extraction_text(segment_resume(resume), token_budget=1000)
+    assert text.index("[Languages]\nPython, Java, C++, SQL") < text.index("[Work Experience]")
+    assert text.endswith("[Interests]\nChess, hiking\n\n[Awards]\nKaggle silver medal")
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Resume Segmentation Test")
+    print("=" * 60)
+    for test in (test_sections_are_typed, test_unstructured_text_is_one_section,
+                 test_extraction_text_prefers_skills_and_respects_budget,
+                 test_languages_and_unlisted_sections_reach_the_llm):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test script for vectorized role-fit ranking
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services import role_fit
+from backend.app.services.gaps import ROLE_TO_SKILLS, current_skill_scores
+from backend.app.services.role_fit import RoleMatrix
+
+SCORES = {"python": 0.9, "statistics": 0.8, "machine learning": 0.45, "sql": 0.9, "pandas": 0.6}
+
+
+def test_roles_are_ranked_by_weighted_coverage():
+    fits = RoleMatrix(ROLE_TO_SKILLS).fit(SCORES)
+    assert len(fits) == len(ROLE_TO_SKILLS)
+    assert [f.role for f in fits[:2]] == ["data analyst", "health data analyst"]
+    data_analyst = fits[0]
+    assert set(data_analyst.skills_below_requirement) == {"pandas", "data visualization", "tableau"}
+    # pandas: 180 * (1 - 0.6/0.9); data visualization and tableau untouched
+    assert data_analyst.mastery_points_remaining == round(180 * (1 - 0.6 / 0.9) + 120 + 140, 1)
+    assert fits[-1].fit_score == 0.0 and fits[-1].mastery_points_remaining > 0
+
+
+def test_python_fallback_matches_numpy(monkeypatch):
+    expected = RoleMatrix(ROLE_TO_SKILLS).fit(SCORES)
+    monkeypatch.setattr(role_fit, "NUMPY_AVAILABLE", False)
+    assert RoleMatrix(ROLE_TO_SKILLS).fit(SCORES) == expected
+
+
+def test_limit_keeps_the_best_roles_and_never_drops_the_tail():
+    matrix = RoleMatrix(ROLE_TO_SKILLS)
+    ranked = matrix.fit(SCORES)
+    assert matrix.fit(SCORES, limit=2) == ranked[:2]
+    assert matrix.fit(SCORES, limit=-3) == matrix.fit(SCORES, limit=0) == ranked[:1]
+
+
+def test_scores_follow_gap_detection_defaults():
+    assert current_skill_scores(["Python 3", "SQL"]) == {"python": 0.8, "sql": 0.8}
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Role Fit Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
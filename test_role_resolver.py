@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for free-text goal to role resolution
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.ai_analysis import analyze_ai_replacement_risk
+from backend.app.services.gaps import ROLE_TO_SKILLS, detect_skill_gaps, map_role_to_required_skills, resolve_role
+from backend.app.services.role_resolver import ROLE_ALIASES, RoleResolution, RoleResolver, goal_tokens
+
+
+def test_goal_tokens_drop_seniority_and_expand_abbreviations():
+    assert goal_tokens("Sr. Software Eng.") == ["software", "engineer"]
+    assert goal_tokens("I want to become a Data Analyst") == ["data", "analyst"]
+
+
+def test_exact_titles_and_aliases():
+    assert resolve_role("Sr. Data Analyst").role == "data analyst"
+    assert resolve_role("Sr. Data Analyst").confidence == 1.0
+    ml = resolve_role("ML engineer")
+    assert (ml.role, ml.confidence, ml.matched) == ("machine learning engineer", 1.0, "ml engineer")
+    assert resolve_role("SOC Analyst II").role == "cybersecurity analyst"
+
+
+def test_padded_goals_use_token_containment():
+    resolution = resolve_role("clinical data analyst at a regional hospital")
+    assert resolution.role == "health data analyst"
+    assert 0.5 <= resolution.confidence < 1.0
+
+
+def test_misspelled_goals_use_trigram_fallback():
+    resolution = resolve_role("sofware enginer")
+    assert resolution.role == "software engineer"
+    assert 0.6 <= resolution.confidence < 1.0
+    assert resolve_role("data analist").role == "data analyst" and resolve_role("data analist").confidence < 1.0
+
+
+def test_single_word_goals_are_not_exact():
+    # "security" only matches the distinguishing word of "security engineer"; "analytics" of "analytics analyst"
+    security = resolve_role("security")
+    assert security.role == "cybersecurity analyst" and 0.6 <= security.confidence < 1.0
+    analytics = resolve_role("Analytics")
+    assert analytics.role == "data analyst" and 0.6 <= analytics.confidence < 1.0
+    assert resolve_role("cybersecurity").confidence == 1.0
+
+
+def test_unknown_goals_fall_back_to_default():
+    resolution = resolve_role("astronaut")
+    assert (resolution.role, resolution.confidence, resolution.matched) == ("data analyst", 0.0, None)
+    assert resolve_role("").role == "data analyst"
+
+
+def test_generic_title_words_alone_do_not_match():
+    # Sharing only "engineer" / "analyst" / a field word with a known title is not a match
+    for goal in ("civil engineer", "data engineer", "DevOps engineer", "data scientist", "Software analyst", "Java engineer"):
+        assert resolve_role(goal) == RoleResolution("data analyst", 0.0), goal
+    assert resolve_role("python developer").role == "software engineer"
+    assert resolve_role("ML developer").role == "machine learning engineer"
+
+
+def test_resolver_only_returns_its_own_roles():
+    resolver = RoleResolver(["data analyst", "software engineer"], ROLE_ALIASES, default="data analyst")
+    assert resolver.resolve("ML engineer") == RoleResolution("data analyst", 0.0)
+    assert resolver.resolve("mlops engineer") == RoleResolution("data analyst", 0.0)
+    assert resolver.resolve("backend developer") == RoleResolution("software engineer", 1.0, "backend developer")
+
+
+def test_gap_detection_and_risk_use_resolved_role():
+    assert map_role_to_required_skills("Senior ML Engineer") == list(ROLE_TO_SKILLS["machine learning engineer"])
+    gaps = detect_skill_gaps(known_skills=[], required_skills=["model deployment"], role="sr. ml eng")
+    assert gaps[0].required_score == ROLE_TO_SKILLS["machine learning engineer"]["model deployment"]["required_score"]
+    risk = analyze_ai_replacement_risk("Lead Security Analyst", [])
+    assert risk["ai_resistant_skills"] == analyze_ai_replacement_risk("cybersecurity analyst", [])["ai_resistant_skills"]
+
+
+if __name__ == "__main__":
+    import pytest
+    print("🧪 WorkWise Noesis - Role Resolver Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared skill canonicalization registry
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.skill_aliases import canonicalize_skill
+from backend.app.services.gaps import detect_skill_gaps
+from backend.app.services.resources import rank_resources_for_skills
+from backend.app.services.ai_analysis import get_job_market_analysis
+
+
+def test_aliases_share_one_id():
+    for alias in ["Power BI", "powerbi", "PBI", "power-bi", " POWER  bi "]:
+        assert canonicalize_skill(alias) == "powerbi", alias
+    assert canonicalize_skill("data viz") == canonicalize_skill("Data Visualization") == "data visualization"
+    assert canonicalize_skill("Scikit-Learn") == "scikit-learn"  # unknown skills pass through lowercased
+
+
+def test_services_compare_canonical_ids():
+    gaps = {g.skill: g.status for g in detect_skill_gaps(["Data Viz", "Python3"], ["data visualization", "python", "sql"])}
+    assert gaps == {"data visualization": "Known", "python": "Known", "sql": "Missing"}, gaps
+
+    ranked = rank_resources_for_skills(["Data Viz"], weekly_time_hours=5, free_preferred=True, provider_preferences=[])
+    assert ranked[0].name == "Data Visualization Basics"
+
+    market = get_job_market_analysis("data analyst", ["Stats", "Structured Query Language"])
+    assert market["skill_match_percentage"] == 50.0
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Skill Alias Registry Test")
+    print("=" * 60)
+    for test in (test_aliases_share_one_id, test_services_compare_canonical_ids):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the skill co-occurrence graph and adjacent-skill ranking
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.gaps import detect_skill_gaps
+from backend.app.services.skill_graph import SkillCooccurrence, document_key
+
+RESUMES = (
+    [["Python", "pandas", "SQL"]] * 6
+    + [["Python", "Django", "Docker"]] * 3
+    + [["Excel", "SQL", "Tableau"]] * 4
+    + [["Excel", "PowerBI"]] * 2
+)
+
+
+def build(path=None):
+    graph = SkillCooccurrence(path=path)
+    for skills in RESUMES:
+        graph.observe(skills)
+    return graph
+
+
+def test_adjacent_ranks_one_row():
+    graph = build()
+    by_conditional = graph.adjacent("python", metric="conditional")
+    assert [a["skill"] for a in by_conditional] == ["pandas", "sql", "django", "docker"]
+    assert by_conditional[0]["conditional_probability"] == round(6 / 9, 4)
+    # PMI favours the skills that mostly appear with Python over the common SQL
+    by_pmi = [a["skill"] for a in graph.adjacent("Python 3", metric="pmi")]
+    assert by_pmi.index("sql") == len(by_pmi) - 1
+    assert [a["skill"] for a in graph.adjacent("python", min_count=5, exclude=["pandas"])] == ["sql"]
+
+
+def test_counts_persist(tmp_path):
+    path = str(tmp_path / "graph.sqlite3")
+    build(path).close()
+    reloaded = SkillCooccurrence(path=path)
+    assert reloaded.documents == len(RESUMES)
+    assert reloaded.pair_count("python", "pandas") == 6 and reloaded.pair_count("pandas", "python") == 6
+
+
+def test_reanalyzed_resumes_are_counted_once():
+    graph = build()
+    resume = "Python developer: pandas and SQL pipelines"
+    assert graph.observe(["python", "pandas", "sql"], key=document_key(resume))
+    before = (graph.documents, graph.count("python"), graph.pair_count("python", "pandas"))
+    for _ in range(5):
+        assert not graph.observe(["python", "pandas", "sql"], key=document_key(resume + "  "))
+    assert (graph.documents, graph.count("python"), graph.pair_count("python", "pandas")) == before
+
+
+def test_a_users_revised_resume_replaces_the_previous_one(tmp_path):
+    path = str(tmp_path / "graph.sqlite3")
+    graph = SkillCooccurrence(path=path, flush_interval=3600)
+    graph.observe(["python", "sql"], key=document_key("v1", "u1"))
+    graph.observe(["python", "docker"], key=document_key("v2", "u1"))
+    assert (graph.documents, graph.pair_count("python", "sql"), graph.pair_count("python", "docker")) == (1, 0, 1)
+    assert graph.count("sql") == 0 and graph.adjacent("sql", min_count=1) == []
+    graph.close()
+
+    # The replacement and the user's last resume survive a restart
+    reloaded = SkillCooccurrence(path=path)
+    assert (reloaded.documents, reloaded.pair_count("python", "sql"), reloaded.pair_count("python", "docker")) == (1, 0, 1)
+    assert not reloaded.observe(["docker", "python"], key=document_key("v2", "u1"))
+    reloaded.close()
+
+
+def test_gap_recommendations_cite_cooccurrence():
+    graph = build()
+    gaps = {g.skill: g for g in detect_skill_gaps(["python"], ["python", "pandas", "tableau"], cooccurrence=graph)}
+    assert "67% of analyzed resumes with Python also list it" in gaps["pandas"].recommendation
+    assert gaps["tableau"].recommendation == "Start with Tableau basics on Coursera"
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Skill Graph Test")
+    print("=" * 60)
+    for test in (test_adjacent_ranks_one_row, test_gap_recommendations_cite_cooccurrence):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for the skill hierarchy and partial credit for specializations
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.cohort import analyze_cohort
+from backend.app.services.career_paths import get_role_graph
+from backend.app.services.gaps import ROLE_TO_SKILLS, detect_skill_gaps, gaps_for_scores, map_role_to_required_skills
+from backend.app.services.role_fit import get_role_matrix
+from backend.app.services.skill_hierarchy import DESCENDANT_CREDIT, SkillHierarchy, get_skill_hierarchy
+from backend.app.services.skill_ids import SkillRegistry, get_skill_registry
+from backend.app.services.what_if import SkillSimulator
+
+
+def test_closure_is_transitive():
+    hierarchy = get_skill_hierarchy()
+    assert {"deep learning", "machine learning"} <= set(hierarchy.ancestors("tensorflow"))
+    assert {"sql", "databases"} <= set(hierarchy.ancestors("PostgreSQL"))
+    registry = get_skill_registry()
+    descendants = registry.names(hierarchy.descendants_mask(registry.lookup("machine learning")))
+    assert {"deep learning", "pytorch", "tensorflow", "scikit-learn"} <= set(descendants)
+    assert hierarchy.ancestors("welding") == []
+
+
+def test_cycles_are_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        SkillHierarchy({"a": ["b"], "b": ["c"], "c": ["a"]}, SkillRegistry())
+
+
+def test_specializations_give_partial_credit():
+    gaps = {g.skill: g for g in detect_skill_gaps(["PostgreSQL"], map_role_to_required_skills("software engineer"), role="software engineer")}
+    assert gaps["databases"].status == "Partial" and gaps["databases"].current_score == DESCENDANT_CREDIT
+    assert "Postgresql" in gaps["databases"].recommendation
+    assert gaps["algorithms"].status == "Missing"
+
+
+def test_held_skills_keep_their_own_score():
+    required = map_role_to_required_skills("data analyst")
+    gaps = {g.skill: g for g in detect_skill_gaps(["pandas", "python"], required)}
+    assert gaps["python"].status == "Known" and gaps["python"].current_score == 0.8
+    credited = {g.skill: g for g in detect_skill_gaps(["pandas"], required)}
+    assert credited["python"].status == "Partial" and credited["python"].current_score == DESCENDANT_CREDIT
+
+
+def test_weak_specializations_credit_their_own_score():
+    required = map_role_to_required_skills("data analyst")
+    gaps = {g.skill: g for g in gaps_for_scores({"pandas": 0.1}, {"pandas"}, required)}
+    assert gaps["python"].status == "Partial" and gaps["python"].current_score == 0.1
+    matrix = get_role_matrix()
+    assert matrix.user_vector({"Pandas": 0.1})[matrix.skill_index["python"]] == 0.1
+
+
+def test_query_and_container_skills_do_not_credit_broader_requirements():
+    se = {g.skill: g for g in detect_skill_gaps(["sql"], map_role_to_required_skills("software engineer"), role="software engineer")}
+    assert se["databases"].status == "Missing"
+    mle = {g.skill: g for g in detect_skill_gaps(["docker"], map_role_to_required_skills("ML engineer"), role="ML engineer")}
+    assert mle["model deployment"].status == "Missing"
+
+
+def test_cohort_counts_apply_the_same_credit():
+    report = analyze_cohort([{"known_skills": ["postgresql"], "goal": "software engineer"}])
+    row = next(s for s in report["roles"][0]["skills"] if s["skill"] == "databases")
+    assert (row["missing"], row["partial"]) == (0, 1)
+    weak = analyze_cohort([{"known_skills": ["pandas"], "skill_scores": {"pandas": 0.1}, "goal": "data analyst"}])
+    row = next(s for s in weak["roles"][0]["skills"] if s["skill"] == "python")
+    assert row["partial"] == 1 and row["avg_deficit"] == round(ROLE_TO_SKILLS["data analyst"]["python"]["required_score"] - 0.1, 4)
+
+
+def test_role_fit_what_if_and_career_paths_apply_the_same_credit():
+    python = ROLE_TO_SKILLS["data analyst"]["python"]
+    credited_cost = round(python["mastery_points"] * (1 - DESCENDANT_CREDIT / python["required_score"]), 1)
+    matrix = get_role_matrix()
+    assert matrix.user_vector({"pandas": 0.8})[matrix.skill_index["python"]] == DESCENDANT_CREDIT
+    assert matrix.user_vector({"pandas": 0.8, "python": 0.3})[matrix.skill_index["python"]] == 0.3
+    singles = {tuple(a.skills): a for a in SkillSimulator().simulate({"pandas": 0.8}, ["data analyst"], limit=20, pairs=False).singles}
+    assert singles[("python",)].mastery_points == credited_cost
+    fit = next(f for f in matrix.fit({"pandas": 0.8}) if f.role == "data analyst")
+    assert fit.mastery_points_remaining < next(f for f in matrix.fit({}) if f.role == "data analyst").mastery_points_remaining
+    graph, analyst = get_role_graph(), get_role_graph().index["data analyst"]
+    credited_entry = graph._entry(matrix.user_vector({"pandas": 0.8}), analyst)[0]
+    assert credited_entry < graph._entry(matrix.held_vector({"pandas": 0.8}), analyst)[0]
+    assert graph.plan({"pandas": 0.8}, "data analyst").direct_mastery_points == round(credited_entry, 1)
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Skill Hierarchy Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))
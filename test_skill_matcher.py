@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for the Aho-Corasick skill matcher used by rule-based extraction
+"""
+
+import os
+import sys
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from backend.app.services.skill_matcher import build_skill_matcher
+from backend.app.services import fuzzy_matcher
+from backend.app.services.fuzzy_matcher import TrigramIndex
+from backend.app.services.skills import extract_skills_rule_based
+
+
+def test_matches_whole_words_only():
+    """Short skills must not fire inside longer words"""
+    matcher = build_skill_matcher({"r", "sql", "python", "data visualization"})
+    found = matcher.extract("built nosql pipelines in python and r; led data visualization reviews")
+    assert found == {"python", "r", "data visualization"}, found
+
+
+def test_overlapping_patterns_all_reported():
+    matcher = build_skill_matcher({"machine learning", "learning", "deep learning"})
+    hits = matcher.find_all("deep learning and machine learning")
+    assert [(h.start, h.end, h.skill) for h in hits] == [
+        (0, 13, "deep learning"),
+        (5, 13, "learning"),
+        (18, 34, "machine learning"),
+        (26, 34, "learning"),
+    ], hits
+
+
+def test_aliases_resolve_to_skill():
+    matcher = build_skill_matcher({"powerbi"}, aliases={"power bi": "powerbi"})
+    assert matcher.extract("dashboards in power bi") == {"powerbi"}
+
+
+def test_symbol_patterns():
+    matcher = build_skill_matcher({"c++", "c#", "c"})
+    assert matcher.extract("c++ and c# but not objective-cee") == {"c++", "c#"}
+    assert matcher.extract("c, c++") == {"c", "c++"}
+
+
+def test_fuzzy_index_catches_typos_and_spacing():
+    index = TrigramIndex({"python": "python", "postgresql": "postgresql", "scikit-learn": "scikit-learn", "stats": "statistics"})
+    found = {m.term: m.skill for m in index.match_terms(["pyhton", "postgre sql", "scikit learn", "state", "javelin"])}
+    assert found == {"pyhton": "python", "postgre sql": "postgresql", "scikit learn": "scikit-learn"}, found
+
+
+def test_fuzzy_index_without_numpy():
+    available = fuzzy_matcher.NUMPY_AVAILABLE
+    fuzzy_matcher.NUMPY_AVAILABLE = False
+    try:
+        index = TrigramIndex({"tableau": "tableau", "matplotlib": "matplotlib"})
+        assert [m.skill for m in index.match_terms(["tablaeu", "matplotlb", "table"])] == ["tableau", "matplotlib"]
+    finally:
+        fuzzy_matcher.NUMPY_AVAILABLE = available
+
+
+def test_fuzzy_threshold_setting():
+    text = "Analysis in Pyhton and Tablaeu"
+    assert extract_skills_rule_based(text, []) == ["python", "tableau"]
+    assert extract_skills_rule_based(text, [], fuzzy_threshold=0.85) == ["tableau"]
+    assert extract_skills_rule_based(text, [], fuzzy_threshold=0) == []
+
+
+def test_fuzzy_index_rejects_ordinary_words():
+    index = TrigramIndex({"docker": "docker", "postgres": "postgresql", "python": "python"})
+    assert index.match_terms(["locker", "rocker", "docket", "dockery", "postures"]) == []
+    assert [m.skill for m in index.match_terms(["pyhton", "dockre"])] == ["python", "docker"]
+
+
+def test_common_phrases_are_not_skills():
+    assert extract_skills_rule_based("Sharpened my SQL skills", []) == ["sql"]
+    assert extract_skills_rule_based("Shipped a torch relay app", []) == []
+    assert extract_skills_rule_based("Locker room rocker filed a legal docket at Dockery Inc", []) == []
+    assert extract_skills_rule_based("Improved postures in ergonomics reviews", []) == []
+    # Everyday-word aliases only count when someone lists them as a skill
+    assert extract_skills_rule_based("Read the stats of the game, then pushed to GitHub and GitLab", []) == []
+    assert extract_skills_rule_based("Mongo the dog", []) == []
+    assert extract_skills_rule_based("", ["stats", "GitHub", "mongo"]) == ["git", "mongodb", "statistics"]
+
+
+def test_fuzzy_ngrams_stop_at_punctuation_and_line_breaks():
+    assert extract_skills_rule_based("I went to Amazon. Web services were down", []) == []
+    assert extract_skills_rule_based("Visited amazon; web sevices team", []) == []
+    assert extract_skills_rule_based("Shopped on amazon\nweb sevices", []) == []
+    assert extract_skills_rule_based("Deployed on amazon web sevices", []) == ["aws"]
+    # Exact phrases still match when a PDF wraps them across lines
+    assert extract_skills_rule_based("Applied machine\nlearning", []) == ["machine learning"]
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Skill Matcher Test")
+    print("=" * 60)
+    for test in (test_matches_whole_words_only, test_overlapping_patterns_all_reported,
+                 test_aliases_resolve_to_skill, test_symbol_patterns,
+                 test_fuzzy_index_catches_typos_and_spacing, test_fuzzy_index_without_numpy,
+                 test_fuzzy_threshold_setting, test_fuzzy_index_rejects_ordinary_words,
+                 test_common_phrases_are_not_skills, test_fuzzy_ngrams_stop_at_punctuation_and_line_breaks):
+        test()
+        print(f"✅ {test.__name__}")
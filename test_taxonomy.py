@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test script for data-driven role taxonomies, their compiled form and hot reload
+"""
+
+import os
+import sys
+import json
+import shutil
+import threading
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+import pytest
+
+from backend.app.services import ai_analysis, gaps, problems, taxonomy
+from backend.app.services.role_fit import get_role_matrix
+from backend.app.services.taxonomy import (
+    TAXONOMY_DIR, TaxonomyWatcher, compile_taxonomy, get_taxonomy, load_compiled_taxonomy,
+    load_json_taxonomy, reload_taxonomy, set_taxonomy,
+)
+
+
+@pytest.fixture
+def taxonomy_copy(tmp_path, monkeypatch):
+    """A writable copy of the shipped taxonomy as TAXONOMY_DIR; the original is restored after"""
+    directory = tmp_path / "taxonomy"
+    shutil.copytree(TAXONOMY_DIR, directory, ignore=shutil.ignore_patterns("*.bin"))
+    monkeypatch.setenv("TAXONOMY_DIR", str(directory))
+    original = get_taxonomy()
+    yield directory
+    set_taxonomy(original)
+
+
+def _edit(directory, name, change):
+    path = directory / f"{name}.json"
+    document = json.loads(path.read_text(encoding="utf-8"))
+    change(document)
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def test_shipped_sources_load_and_validate():
+    loaded = load_json_taxonomy()
+    assert set(loaded.versions) == {"role_skills", "ai_replacement", "job_market", "problem_bank"}
+    assert "data analyst" in loaded.role_to_skills
+    assert set(loaded.ai_replacement) == set(loaded.job_market)
+    assert gaps.ROLE_TO_SKILLS == get_taxonomy().role_to_skills
+
+
+def test_compiled_form_matches_json_until_sources_change(taxonomy_copy):
+    compile_taxonomy(str(taxonomy_copy))
+    compiled = load_compiled_taxonomy(str(taxonomy_copy))
+    source = load_json_taxonomy(str(taxonomy_copy))
+    assert compiled.source == "compiled"
+    assert (compiled.role_to_skills, compiled.problem_bank, compiled.fingerprint) == (
+        source.role_to_skills, source.problem_bank, source.fingerprint,
+    )
+    _edit(taxonomy_copy, "job_market", lambda d: d["data"]["data analyst"].update(avg_salary=1))
+    assert load_compiled_taxonomy(str(taxonomy_copy)) is None
+
+
+def test_reload_swaps_every_derived_index(taxonomy_copy):
+    def add_role(document):
+        document["version"] = 2
+        document["data"]["data engineer"] = {
+            "spark": {"required_proficiency": "Intermediate", "required_score": 0.7, "mastery_points": 150},
+            "sql": {"required_proficiency": "Advanced", "required_score": 0.8, "mastery_points": 120},
+        }
+
+    _edit(taxonomy_copy, "role_skills", add_role)
+    _edit(taxonomy_copy, "problem_bank", lambda d: d["data"]["data_analyst"][0].update(title="Renamed"))
+    assert reload_taxonomy()
+    assert get_taxonomy().versions["role_skills"] == 2
+    assert gaps.resolve_role("Senior Data Engineer").role == "data engineer"
+    assert gaps.map_role_to_required_skills("data engineer") == ["spark", "sql"]
+    assert gaps.missing_skills("data engineer", ["SQL"]) == ["spark"]
+    assert "data engineer" in get_role_matrix().roles
+    first = problems.PROBLEM_BANK["data_analyst"][0]
+    assert problems.get_problem_by_id(first["id"])["title"] == "Renamed"
+    assert not reload_taxonomy()  # unchanged sources are not reloaded
+
+
+def test_invalid_taxonomy_keeps_the_current_one(taxonomy_copy):
+    before = get_taxonomy()
+    _edit(taxonomy_copy, "job_market", lambda d: d["data"].pop("data analyst"))
+    assert not reload_taxonomy()
+    assert get_taxonomy() is before
+    assert ai_analysis.get_job_market_analysis("data analyst", [])["market_data"]
+
+
+def test_entries_missing_fields_are_rejected(taxonomy_copy):
+    before, market_index = get_taxonomy(), ai_analysis._index
+    _edit(taxonomy_copy, "job_market", lambda d: d["data"]["data analyst"].pop("top_skills_demand"))
+    with pytest.raises(ValueError, match="top_skills_demand"):
+        load_json_taxonomy(str(taxonomy_copy))
+    assert not reload_taxonomy()
+    assert get_taxonomy() is before and ai_analysis._index is market_index
+
+
+def test_failed_index_build_leaves_nothing_half_applied(taxonomy_copy, monkeypatch):
+    def failing_build(new_taxonomy):
+        raise KeyError("broken index")
+
+    before, role_index, matrix = get_taxonomy(), gaps._index, get_role_matrix()
+    _edit(taxonomy_copy, "role_skills", lambda d: d["data"]["data analyst"]["sql"].update(mastery_points=999))
+    with monkeypatch.context() as patch:
+        patch.setattr(taxonomy, "_listeners", [*taxonomy._listeners, (failing_build, lambda index: None)])
+        assert not reload_taxonomy()
+    assert get_taxonomy() is before and gaps._index is role_index and get_role_matrix() is matrix
+
+
+def test_watcher_reloads_on_modification(taxonomy_copy):
+    watcher = TaxonomyWatcher(interval=60)
+    assert not watcher.check()
+    _edit(taxonomy_copy, "ai_replacement", lambda d: d["data"]["data analyst"].update(automation_risk=0.1))
+    os.utime(taxonomy_copy / "ai_replacement.json", ns=(1, 1))
+    assert watcher.check()
+    assert ai_analysis.AI_REPLACEMENT_DATA["data analyst"]["automation_risk"] == 0.1
+    assert taxonomy.get_taxonomy().source == "json"
+
+
+def test_watcher_keeps_polling_after_a_failed_check(taxonomy_copy, monkeypatch):
+    watcher = TaxonomyWatcher(interval=0.01)
+    polls, recovered = [], threading.Event()
+
+    def check():
+        polls.append(1)
+        if len(polls) == 1:
+            raise OSError("taxonomy file vanished")
+        recovered.set()
+        return False
+
+    monkeypatch.setattr(watcher, "check", check)
+    watcher.start()
+    try:
+        assert recovered.wait(5)
+    finally:
+        watcher.stop()
+
+
+if __name__ == "__main__":
+    print("🧪 WorkWise Noesis - Taxonomy Test")
+    print("=" * 60)
+    sys.exit(pytest.main([__file__, "-q"]))